@@ -1,19 +1,45 @@
+# 起動時間の計測基準にするため最初にインポートする
+from core.startup import get_startup_report, mark_startup
+
 import os
 import sys
+import threading
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
-from flask import Flask, flash, redirect, render_template, request, session, url_for
+from flask import (
+    Flask,
+    Response,
+    flash,
+    get_flashed_messages,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
 from flask_wtf.csrf import CSRFProtect
 from markupsafe import Markup
 
 from core.auth import get_calendar_manager, get_spreadsheet_manager, requires_auth, setup_credentials
 from core.constants import JST
-from core.multi_demo_service import build_multi_demo_rows, create_multi_demo_events, flush_future_events
-from core.spreadsheet_demo_service import build_spreadsheet_demo_rows, create_spreadsheet_demo_events
+from core.discovery import preload_discovery_documents
+from core.event_pages import get_event_page_cache_stats
+from core.http_transport import get_http_pool_stats
+from core.spreadsheet_cache import get_spreadsheet_cache_stats
+from core.multi_demo_service import create_multi_demo_events, flush_future_events, iter_multi_demo_row_chunks
+from core.spreadsheet_demo_service import (
+    SpreadsheetParseError,
+    create_spreadsheet_demo_events,
+    iter_spreadsheet_demo_row_chunks,
+)
 from core.runtime import is_pyinstaller_environment, resource_path
 
+mark_startup("imports")
+
 
 # .envファイルから環境変数を読み込む
 dotenv_path = resource_path(".env")  # リソースパス関数を使用
@@ -37,6 +63,57 @@ csrf = CSRFProtect(app)
 
 
 
+@app.after_request
+def record_first_response(response):
+    """最初のレスポンスを返すまでの時間を記録"""
+    mark_startup("first_response")
+    return response
+
+
+# ストリーミング描画で、ここまでに描画した HTML をブラウザへ送る位置の目印
+STREAM_FLUSH_MARKER = "<!-- flush -->"
+
+
+def stream_page(template_name, **context):
+    """テンプレートを描画しながらストリーミングで返す
+
+    テンプレートが STREAM_FLUSH_MARKER を出力するたびに、それまでに描画した HTML を
+    まとめて送信する。行の読み込みを待つ前に目印を出力すれば、ページの外枠は
+    Google API の呼び出しを待たずに表示される。
+
+    セッション Cookie はレスポンスヘッダーと一緒に先に送られるため、描画中に
+    セッションを変更しても保存されない。フラッシュメッセージは描画前に取り出しておく。
+
+    Args:
+        template_name: テンプレート名
+        **context: テンプレートに渡す値
+
+    Returns:
+        ストリーミングレスポンス
+    """
+    get_flashed_messages(with_categories=True)
+    app.update_template_context(context)
+    template = app.jinja_env.get_template(template_name)
+
+    def generate():
+        buffer = []
+        for piece in template.generate(context):
+            buffer.append(piece)
+            if STREAM_FLUSH_MARKER in piece:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
+
+    return Response(stream_with_context(generate()), mimetype="text/html")
+
+
+@app.context_processor
+def inject_stream_flush_marker():
+    """テンプレートから stream_flush で目印を出力できるようにする"""
+    return {"stream_flush": Markup(STREAM_FLUSH_MARKER)}
+
+
 # nl2brフィルターを追加
 @app.template_filter("nl2br")
 def nl2br_filter(text):
@@ -53,7 +130,7 @@ def authenticate():
         if password:
             session["credentials_password"] = password
             # 認証情報をセットアップ
-            creds_dir, error = setup_credentials(session)
+            _bundle, error = setup_credentials(session)
             if error:
                 flash(f"認証エラー: {error}", "error")
                 session.pop("credentials_password", None)
@@ -66,40 +143,70 @@ def authenticate():
     return render_template("auth.html")
 
 
+# イベント一覧に表示する期間（日数）と1ページあたりの件数
+INDEX_WINDOW_DAYS = 30
+INDEX_PAGE_SIZE = 50
+
+
+def parse_window_start(value):
+    """イベント一覧の表示開始日（YYYY-MM-DD）を解釈する。省略時・不正な値は今日"""
+    if value:
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            pass
+    return datetime.now(JST).date()
+
+
+def to_utc_rfc3339(date_value):
+    """日本時間の日付の0時を UTC（Z）の RFC3339 文字列に変換する"""
+    start_of_day = datetime.combine(date_value, datetime.min.time(), tzinfo=JST)
+    return start_of_day.astimezone(ZoneInfo("UTC")).isoformat().replace("+00:00", "Z")
+
+
 @app.route("/")
 @requires_auth
 def index():
-    """イベント一覧ページ"""
+    """イベント一覧ページ
+
+    start（表示開始日）から INDEX_WINDOW_DAYS 日分のイベントを INDEX_PAGE_SIZE 件ずつ表示する。
+    page_token には Calendar API の pageToken をそのまま渡し、取得したページは
+    期間ごとにキャッシュするため、ページ・期間の行き来は1画面あたり最大1回の API 呼び出しで済む。
+    """
     calendar_manager = get_calendar_manager(session)
-    events = []
+    window_start = parse_window_start(request.args.get("start"))
+    window_end = window_start + timedelta(days=INDEX_WINDOW_DAYS)
+    page_token = request.args.get("page_token") or None
+    page = None
 
     if calendar_manager:
-        # 今日から30日分のイベントを取得
-        time_min = datetime.now(JST)
-        time_max = time_min + timedelta(days=30)
-
-        # UTC（Z）に変換
-        time_min_utc = time_min.astimezone(ZoneInfo("UTC"))
-        time_max_utc = time_max.astimezone(ZoneInfo("UTC"))
-
-        print(f"時間範囲: {time_min_utc.isoformat()} から {time_max_utc.isoformat()}")
+        time_min = to_utc_rfc3339(window_start)
+        time_max = to_utc_rfc3339(window_end)
+        print(f"時間範囲: {time_min} から {time_max}")
 
         try:
-            events = calendar_manager.get_events(
-                time_min=time_min_utc.isoformat().replace("+00:00", "Z"),
-                time_max=time_max_utc.isoformat().replace("+00:00", "Z"),
-                max_results=50,
+            page = calendar_manager.get_cached_events_page(
+                time_min,
+                time_max,
+                page_token=page_token,
+                max_results=INDEX_PAGE_SIZE,
             )
-            print(f"取得したイベント数: {len(events)}")
-            if events:
-                print(f"最初のイベント: {events[0]}")
+            print(f"取得したイベント数: {len(page['events'])}")
         except Exception as e:
             print(f"イベント取得エラー: {e}")
-            events = []
+            flash("イベントの取得に失敗しました", "error")
     else:
         print("calendar_managerの初期化に失敗しました")
 
-    return render_template("index.html", events=events)
+    return render_template(
+        "index.html",
+        events=page["events"] if page else [],
+        page=page,
+        window_start=window_start,
+        window_last_day=window_end - timedelta(days=1),
+        previous_window_start=window_start - timedelta(days=INDEX_WINDOW_DAYS),
+        next_window_start=window_end,
+    )
 
 
 @app.route("/event/<event_id>")
@@ -111,7 +218,7 @@ def event_detail(event_id):
         flash("カレンダーマネージャーが初期化されていません", "error")
         return redirect(url_for("index"))
 
-    event = calendar_manager.get_event(event_id)
+    event = calendar_manager.get_event(event_id, fields="detail")
     if not event:
         flash("イベントが見つかりませんでした", "error")
         return redirect(url_for("index"))
@@ -191,7 +298,7 @@ def event_update(event_id):
         return redirect(url_for("index"))
 
     # 現在のイベント情報を取得
-    event = calendar_manager.get_event(event_id)
+    event = calendar_manager.get_event(event_id, fields="detail")
     if not event:
         flash("イベントが見つかりませんでした", "error")
         return redirect(url_for("index"))
@@ -268,7 +375,7 @@ def event_delete(event_id):
         return redirect(url_for("index"))
 
     # 現在のイベント情報を取得
-    event = calendar_manager.get_event(event_id)
+    event = calendar_manager.get_event(event_id, fields="detail")
     if not event:
         flash("イベントが見つかりませんでした", "error")
         return redirect(url_for("index"))
@@ -321,28 +428,30 @@ def multi_demo():
 
         return redirect(url_for("multi_demo"))
 
-    try:
-        rows = build_multi_demo_rows(calendar_manager, session)
-    except FileNotFoundError as exc:
-        flash(str(exc), "error")
-        rows = []
-    except ValueError as exc:
-        flash(str(exc), "error")
-        rows = []
-    except Exception as exc:
-        flash(f"/multi データの読み込みに失敗しました: {exc}", "error")
-        rows = []
+    # 件数などの集計は行を描画し終えてからテンプレートの末尾で反映する
+    summary = {"row_count": 0, "created_count": 0, "assignees": [], "day_span": 0, "error": None}
 
-    created_count = sum(1 for row in rows if row["exists"])
-    assignees = sorted({row["assignee"] for row in rows})
-    day_span = max((row["day_offset"] for row in rows), default=0)
+    def row_chunks():
+        assignees = set()
+        try:
+            for chunk in iter_multi_demo_row_chunks(calendar_manager, session):
+                for row in chunk:
+                    summary["row_count"] += 1
+                    summary["created_count"] += row.exists
+                    summary["day_span"] = max(summary["day_span"], row.day_offset)
+                    assignees.add(row.assignee)
+                yield chunk
+        except (FileNotFoundError, ValueError) as exc:
+            summary["error"] = str(exc)
+        except Exception as exc:
+            summary["error"] = f"/multi データの読み込みに失敗しました: {exc}"
+        summary["assignees"] = sorted(assignees)
+
     synced_at_label = datetime.now(JST).strftime("%Y-%m-%d %H:%M:%S")
-    return render_template(
+    return stream_page(
         "multi.html",
-        rows=rows,
-        created_count=created_count,
-        assignees=assignees,
-        day_span=day_span,
+        row_chunks=row_chunks(),
+        summary=summary,
         synced_at_label=synced_at_label,
     )
 
@@ -378,6 +487,8 @@ def spreadsheet_demo():
                         flash(f"{skipped_count}件は既に存在していたため再作成していません", "info")
                     if failed_summaries:
                         flash(f"作成に失敗した予定: {', '.join(failed_summaries)}", "error")
+                except SpreadsheetParseError as exc:
+                    flash(f"Spreadsheet の内容が不正なため、予定は1件も作成していません: {exc}", "error")
                 except Exception as exc:
                     flash(f"Google カレンダーへの流し込みに失敗しました: {exc}", "error")
             else:
@@ -386,43 +497,85 @@ def spreadsheet_demo():
                 if failed_count:
                     flash(f"{failed_count}件の削除に失敗しました", "error")
         else:
+            spreadsheet_manager.invalidate_cache()
             flash("Google Spreadsheet の最新状態を再取得しました", "success")
 
         return redirect(url_for("spreadsheet_demo"))
 
-    rows = []
-    spreadsheet_title = "-"
-    range_name = "-"
+    # 件数・タイトル・範囲は行を描画し終えてからテンプレートの末尾で反映する
+    summary = {"imported_count": 0, "spreadsheet_title": "-", "range_name": "-", "error": None}
 
-    try:
-        rows = build_spreadsheet_demo_rows(spreadsheet_manager)
-        spreadsheet_title = spreadsheet_manager.get_sheet_title() or spreadsheet_manager.spreadsheet_id
-        range_name = spreadsheet_manager.range_name
-    except Exception as exc:
-        flash(f"Google Spreadsheetの読み込みに失敗しました: {exc}", "error")
+    def row_chunks():
+        try:
+            for chunk in iter_spreadsheet_demo_row_chunks(spreadsheet_manager):
+                summary["imported_count"] += len(chunk)
+                yield chunk
+            summary["spreadsheet_title"] = (
+                spreadsheet_manager.get_sheet_title() or spreadsheet_manager.spreadsheet_id
+            )
+            # range_name 未設定時はシート情報の取得が必要なため、ここで求める
+            summary["range_name"] = ", ".join(spreadsheet_manager.range_names)
+        except Exception as exc:
+            summary["error"] = f"Google Spreadsheetの読み込みに失敗しました: {exc}"
 
     synced_at_label = datetime.now(JST).strftime("%Y-%m-%d %H:%M:%S")
-    return render_template(
+    return stream_page(
         "spreadsheet.html",
-        rows=rows,
-        imported_count=len(rows),
-        spreadsheet_title=spreadsheet_title,
-        range_name=range_name,
+        row_chunks=row_chunks(),
+        summary=summary,
         synced_at_label=synced_at_label,
+    )
+
+
+@app.route("/startup")
+@requires_auth
+def startup_report():
+    """起動時間のレポート（各段階までの経過ミリ秒）"""
+    return jsonify(get_startup_report())
+
+
+@app.route("/metrics")
+@requires_auth
+def metrics():
+    """Google API 用コネクションプール・アクセストークン・スプレッドシートキャッシュ・イベント一覧のページキャッシュの利用状況"""
+    # google-auth を起動時に読み込まないよう、ここでインポートする
+    from core.token_cache import token_cache
+
+    return jsonify(
+        {
+            "http_pool": get_http_pool_stats(),
+            "token_cache": token_cache.stats(),
+            "spreadsheet_cache": get_spreadsheet_cache_stats(),
+            "event_page_cache": get_event_page_cache_stats(),
+        }
+    )
+
+
+def warm_up():
+    """初回リクエストを待たずにGoogle APIクライアントとDiscovery文書を読み込む"""
+    import gcal.calendar_manager  # noqa: F401
+    import gsheets.spreadsheet_manager  # noqa: F401
+
+    discovery_load_ms = preload_discovery_documents()
+    mark_startup("warm_up")
+    print(
+        "Discovery documents loaded: "
+        + ", ".join(f"{document_key} ({load_ms:.1f}ms)" for document_key, load_ms in discovery_load_ms.items())
     )
 
 
 # アプリケーション起動時の環境情報をログに出力
 print(f"Working directory: {os.getcwd()}")
-try:
-    base_path = sys._MEIPASS
-    print(f"Running in PyInstaller bundle. Base path: {base_path}")
-    print(f"Contents of base path: {os.listdir(base_path)}")
-except Exception:
+if is_pyinstaller_environment():
+    print(f"Running in PyInstaller bundle. Base path: {sys._MEIPASS}")
+else:
     print("Running in normal Python environment")
 
+mark_startup("app_ready")
+
 
 if __name__ == "__main__":
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
     run_options = {"debug": DEBUG}
     if is_pyinstaller_environment():
         run_options = {"debug": False, "use_reloader": False}
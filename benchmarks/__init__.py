@@ -0,0 +1 @@
+"""Benchmarks run against an in-process fake of the Google APIs."""
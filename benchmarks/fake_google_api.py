@@ -0,0 +1,585 @@
+"""In-process stand-in for the Google Calendar v3 and Sheets v4 APIs.
+
+:class:`FakeGoogleApi` implements the ``request()`` method of
+``httplib2.Http`` and can be passed as ``http=`` to
+:class:`gcal.calendar_manager.CalendarManager` and
+:class:`gsheets.spreadsheet_manager.SpreadsheetManager`. The managers keep
+building their service clients from the bundled discovery documents, so the
+full googleapiclient request path (URL building, batching, response parsing)
+is exercised without network access or Google quotas.
+
+Supported endpoints:
+
+* Calendar ``calendarList.list`` and ``events.list/get/insert/update/patch/delete``
+  including ``pageToken``/``syncToken`` paging and multipart batch requests.
+* Sheets ``spreadsheets.get``, ``spreadsheets.values.get`` and
+  ``spreadsheets.values.batchGet``.
+
+Latency, page size and error injection are configurable per instance, and
+``fields`` partial-response masks are honoured.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from email.parser import FeedParser
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httplib2
+
+
+JSON_CONTENT_TYPE = "application/json; charset=UTF-8"
+DEFAULT_CALENDAR_ID = "primary"
+MAX_PAGE_SIZE = 2500
+
+_STATUS_REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    410: "Gone",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+_ERROR_REASONS = {
+    403: "rateLimitExceeded",
+    404: "notFound",
+    409: "duplicate",
+    410: "deleted",
+    429: "rateLimitExceeded",
+}
+
+
+class FakeApiError(Exception):
+    """Error response raised by an endpoint handler."""
+
+    def __init__(self, status, message, reason=None, retry_after=None, after_commit=False):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason or _ERROR_REASONS.get(status, "backendError")
+        self.retry_after = retry_after
+        self.after_commit = after_commit
+
+
+def _parse_time(value):
+    """Parse an RFC 3339 timestamp or a date into an aware datetime."""
+    if "T" not in value:
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _event_boundary(event, field):
+    """Return the start or end of an event as an aware datetime."""
+    block = event.get(field, {})
+    value = block.get("dateTime") or block.get("date")
+    return _parse_time(value) if value else None
+
+
+def _add_field_path(tree, path, subtree=None):
+    """Add ``a/b/c`` (or ``a.b.c``) to a parsed fields tree. ``None`` selects a whole value."""
+    path = path.strip()
+    if not path:
+        return
+
+    node = tree
+    parts = path.replace(".", "/").split("/")
+    for part in parts[:-1]:
+        node = node.setdefault(part, {})
+        if node is None:
+            return
+    node[parts[-1]] = subtree
+
+
+def parse_fields(mask):
+    """Parse a partial-response mask such as ``items(id,start/dateTime),nextPageToken``.
+
+    :param mask: ``fields`` query parameter.
+    :type mask: str
+    :return: Nested dict; ``None`` leaves select the whole value.
+    :rtype: dict
+    """
+
+    def parse(position):
+        tree = {}
+        name = ""
+        while position < len(mask):
+            char = mask[position]
+            if char == ",":
+                _add_field_path(tree, name)
+                name = ""
+            elif char == "(":
+                subtree, position = parse(position + 1)
+                _add_field_path(tree, name, subtree)
+                name = ""
+            elif char == ")":
+                _add_field_path(tree, name)
+                return tree, position
+            else:
+                name += char
+            position += 1
+        _add_field_path(tree, name)
+        return tree, position
+
+    return parse(0)[0]
+
+
+def apply_fields(value, tree):
+    """Project a response onto a parsed fields tree."""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [apply_fields(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: apply_fields(value[key], subtree) for key, subtree in tree.items() if key in value}
+
+
+def _now_rfc3339():
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class FakeGoogleApi:
+    """Thread-safe fake of the Google Calendar and Sheets REST endpoints.
+
+    :param latency: Seconds slept per HTTP round trip (a batch counts once).
+    :type latency: float
+    :param page_size: Upper bound for ``maxResults`` of list calls.
+    :type page_size: int
+    :param error_rate: Probability that a request fails with ``error_status``.
+    :type error_rate: float
+    :param error_status: Status code of randomly injected errors.
+    :type error_status: int
+    :param seed: Seed of the random generator used for error injection.
+    :type seed: int | None
+
+    ``request_counts`` counts handled API calls per endpoint (batched calls
+    individually) and ``round_trips`` counts HTTP round trips.
+    """
+
+    def __init__(self, latency=0.0, page_size=250, error_rate=0.0, error_status=503, seed=None):
+        self.latency = latency
+        self.page_size = page_size
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.request_counts = Counter()
+        self.round_trips = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calendars = {}
+        self._spreadsheets = {}
+        self._queued_errors = []
+        self.add_calendar(DEFAULT_CALENDAR_ID, summary="Primary")
+
+    # ------------------------------------------------------------------
+    # Fixtures
+    # ------------------------------------------------------------------
+
+    def add_calendar(self, calendar_id, summary=None, time_zone="Asia/Tokyo"):
+        """Register an empty calendar.
+
+        :param calendar_id: Calendar id.
+        :type calendar_id: str
+        :param summary: Calendar name.
+        :type summary: str | None
+        :param time_zone: Calendar time zone.
+        :type time_zone: str
+        """
+        with self._lock:
+            self._calendars.setdefault(
+                calendar_id,
+                {
+                    "entry": {"id": calendar_id, "summary": summary or calendar_id, "timeZone": time_zone},
+                    "events": {},
+                    "deleted": set(),
+                    "changes": [],
+                    "sequence": 0,
+                    "sync_generation": 0,
+                },
+            )
+
+    def add_event(self, calendar_id, event):
+        """Store an event as if it had been inserted through the API.
+
+        :param calendar_id: Calendar id.
+        :type calendar_id: str
+        :param event: Event body. ``id`` is generated when missing.
+        :type event: dict
+        :return: Stored event.
+        :rtype: dict
+        """
+        self.add_calendar(calendar_id)
+        with self._lock:
+            return self._insert_event(self._calendars[calendar_id], dict(event))
+
+    def events(self, calendar_id):
+        """Return a snapshot of the live events of a calendar.
+
+        :param calendar_id: Calendar id.
+        :type calendar_id: str
+        :return: Events.
+        :rtype: list[dict]
+        """
+        with self._lock:
+            return list(self._calendars[calendar_id]["events"].values())
+
+    def set_sheet_values(self, spreadsheet_id, sheet_title, values, title=None):
+        """Create or replace the values of one sheet.
+
+        :param spreadsheet_id: Spreadsheet id.
+        :type spreadsheet_id: str
+        :param sheet_title: Sheet (tab) title.
+        :type sheet_title: str
+        :param values: Rows of cell values.
+        :type values: list[list]
+        :param title: Spreadsheet title.
+        :type title: str | None
+        """
+        with self._lock:
+            spreadsheet = self._spreadsheets.setdefault(
+                spreadsheet_id, {"title": title or spreadsheet_id, "sheets": {}}
+            )
+            if title:
+                spreadsheet["title"] = title
+            spreadsheet["sheets"][sheet_title] = [list(row) for row in values]
+
+    def fail_next(self, status, count=1, reason=None, retry_after=None, after_commit=False):
+        """Make the next ``count`` requests fail with ``status``.
+
+        Requests inside a batch are counted individually.
+
+        :param status: HTTP status code to return.
+        :type status: int
+        :param count: Number of failing requests.
+        :type count: int
+        :param reason: Error reason, e.g. ``userRateLimitExceeded`` for 403.
+        :type reason: str | None
+        :param retry_after: ``Retry-After`` header value in seconds.
+        :type retry_after: int | None
+        :param after_commit: Apply the request before failing, like a
+            connection that drops after the server committed the write.
+        :type after_commit: bool
+        """
+        with self._lock:
+            for _ in range(count):
+                self._queued_errors.append(FakeApiError(status, "Injected error", reason, retry_after, after_commit))
+
+    def expire_sync_tokens(self, calendar_id):
+        """Invalidate every issued sync token so the next delta sync gets 410.
+
+        Tokens issued by later full syncs stay valid.
+
+        :param calendar_id: Calendar id.
+        :type calendar_id: str
+        """
+        with self._lock:
+            self._calendars[calendar_id]["sync_generation"] += 1
+
+    # ------------------------------------------------------------------
+    # httplib2.Http interface
+    # ------------------------------------------------------------------
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None):
+        """Handle one HTTP round trip like ``httplib2.Http.request``.
+
+        :return: Response and content.
+        :rtype: tuple[httplib2.Response, bytes]
+        """
+        with self._lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        if urlsplit(uri).path.startswith("/batch/"):
+            return self._handle_batch(body, (headers or {}).get("content-type", ""))
+
+        status, payload, extra_headers = self._dispatch(method, uri, body)
+        return self._response(status, payload, extra_headers)
+
+    def async_transport(self):
+        """Return an ``httpx`` async transport that is served by :meth:`request`.
+
+        Pass it as ``httpx.AsyncClient(transport=...)`` to
+        :class:`gcal.async_calendar_manager.AsyncCalendarManager`. Requests
+        run on worker threads, so the latency of concurrent requests overlaps.
+
+        :return: Async transport.
+        :rtype: httpx.AsyncBaseTransport
+        """
+        import httpx
+
+        fake_api = self
+
+        class FakeAsyncTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                body = await request.aread()
+                response, content = await asyncio.to_thread(
+                    fake_api.request,
+                    str(request.url),
+                    method=request.method,
+                    body=body or None,
+                    headers=dict(request.headers),
+                )
+                headers = {key: value for key, value in response.items() if key != "status"}
+                return httpx.Response(response.status, headers=headers, content=content)
+
+        return FakeAsyncTransport()
+
+    # ------------------------------------------------------------------
+    # Dispatching
+    # ------------------------------------------------------------------
+
+    def _response(self, status, payload, extra_headers=None):
+        response_headers = {"status": str(status), "content-type": JSON_CONTENT_TYPE}
+        response_headers.update(extra_headers or {})
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        return httplib2.Response(response_headers), content
+
+    def _take_injected_error(self):
+        """Return the next queued or random error, if any. Caller holds the lock."""
+        if self._queued_errors:
+            return self._queued_errors.pop(0)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return FakeApiError(self.error_status, "Injected random error")
+        return None
+
+    def _dispatch(self, method, uri, body):
+        """Route a single request.
+
+        :return: Status, JSON payload (``None`` for empty bodies) and headers.
+        :rtype: tuple[int, dict | None, dict]
+        """
+        parts = urlsplit(uri)
+        segments = [unquote(segment) for segment in parts.path.strip("/").split("/")]
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        data = json.loads(body) if body else None
+
+        with self._lock:
+            try:
+                error = self._take_injected_error()
+                if error is not None and not error.after_commit:
+                    raise error
+
+                if segments[:2] == ["calendar", "v3"]:
+                    endpoint, status, payload = self._route_calendar(method, segments[2:], query, data)
+                elif segments[:2] == ["v4", "spreadsheets"]:
+                    endpoint, status, payload = self._route_sheets(method, segments[2:], parse_qs(parts.query))
+                else:
+                    raise FakeApiError(404, f"Unknown endpoint: {parts.path}")
+                if error is not None:
+                    raise error
+            except FakeApiError as exc:
+                self.request_counts[f"error:{exc.status}"] += 1
+                extra_headers = {"retry-after": str(exc.retry_after)} if exc.retry_after is not None else {}
+                payload = {
+                    "error": {
+                        "code": exc.status,
+                        "message": str(exc),
+                        "errors": [{"reason": exc.reason, "message": str(exc)}],
+                    }
+                }
+                return exc.status, payload, extra_headers
+
+            self.request_counts[endpoint] += 1
+            if payload is not None and "fields" in query:
+                payload = apply_fields(payload, parse_fields(query["fields"]))
+            return status, payload, {}
+
+    def _route_calendar(self, method, segments, query, data):
+        if segments == ["users", "me", "calendarList"] and method == "GET":
+            items = [calendar["entry"] for calendar in self._calendars.values()]
+            return "calendarList.list", 200, {"kind": "calendar#calendarList", "items": items}
+
+        if len(segments) < 3 or segments[0] != "calendars" or segments[2] != "events":
+            raise FakeApiError(404, "Unknown calendar endpoint")
+
+        calendar = self._calendars.get(segments[1])
+        if calendar is None:
+            raise FakeApiError(404, "Calendar not found")
+
+        if len(segments) == 3:
+            if method == "GET":
+                return "events.list", 200, self._list_events(calendar, query)
+            if method == "POST":
+                return "events.insert", 200, self._insert_event(calendar, dict(data or {}))
+            raise FakeApiError(400, f"Unsupported method: {method}")
+
+        event_id = segments[3]
+        if event_id in calendar["deleted"]:
+            raise FakeApiError(410, "Resource has been deleted")
+        event = calendar["events"].get(event_id)
+        if event is None:
+            raise FakeApiError(404, "Not Found")
+
+        if method == "GET":
+            return "events.get", 200, event
+        if method == "PUT":
+            return "events.update", 200, self._save_event(calendar, {**(data or {}), "id": event_id})
+        if method == "PATCH":
+            return "events.patch", 200, self._save_event(calendar, {**event, **(data or {}), "id": event_id})
+        if method == "DELETE":
+            del calendar["events"][event_id]
+            calendar["deleted"].add(event_id)
+            self._record_change(calendar, event_id)
+            return "events.delete", 204, None
+        raise FakeApiError(400, f"Unsupported method: {method}")
+
+    @staticmethod
+    def _value_range(spreadsheet, range_name):
+        """Return the ``ValueRange`` of one A1 range (the whole sheet is returned)."""
+        sheet_title = range_name.split("!", 1)[0].strip("'") if "!" in range_name else range_name
+        if sheet_title not in spreadsheet["sheets"]:
+            raise FakeApiError(400, f"Unable to parse range: {range_name}")
+        payload = {"range": range_name, "majorDimension": "ROWS"}
+        values = spreadsheet["sheets"][sheet_title]
+        if values:
+            payload["values"] = values
+        return payload
+
+    def _route_sheets(self, method, segments, query):
+        """Route a Sheets request. ``query`` maps each parameter to all of its values."""
+        if method != "GET" or not segments:
+            raise FakeApiError(400, "Unsupported spreadsheet request")
+
+        spreadsheet = self._spreadsheets.get(segments[0])
+        if spreadsheet is None:
+            raise FakeApiError(404, "Requested entity was not found.")
+
+        if len(segments) == 1:
+            sheets = [
+                {"properties": {"sheetId": index, "title": sheet_title, "index": index}}
+                for index, sheet_title in enumerate(spreadsheet["sheets"])
+            ]
+            payload = {
+                "spreadsheetId": segments[0],
+                "properties": {"title": spreadsheet["title"]},
+                "sheets": sheets,
+            }
+            return "spreadsheets.get", 200, payload
+
+        if len(segments) == 3 and segments[1] == "values":
+            return "spreadsheets.values.get", 200, self._value_range(spreadsheet, segments[2])
+
+        if len(segments) == 2 and segments[1] == "values:batchGet":
+            value_ranges = [self._value_range(spreadsheet, range_name) for range_name in query.get("ranges", [])]
+            payload = {"spreadsheetId": segments[0], "valueRanges": value_ranges}
+            return "spreadsheets.values.batchGet", 200, payload
+
+        raise FakeApiError(404, "Unknown spreadsheet endpoint")
+
+    # ------------------------------------------------------------------
+    # Calendar state
+    # ------------------------------------------------------------------
+
+    def _record_change(self, calendar, event_id):
+        calendar["sequence"] += 1
+        calendar["changes"].append((calendar["sequence"], event_id))
+
+    def _save_event(self, calendar, event):
+        event["updated"] = _now_rfc3339()
+        event["etag"] = f'"{uuid.uuid4().hex}"'
+        event.setdefault("status", "confirmed")
+        calendar["events"][event["id"]] = event
+        self._record_change(calendar, event["id"])
+        return event
+
+    def _insert_event(self, calendar, event):
+        event.setdefault("id", uuid.uuid4().hex)
+        if event["id"] in calendar["events"] or event["id"] in calendar["deleted"]:
+            raise FakeApiError(409, "The requested identifier already exists.")
+        event.setdefault("created", _now_rfc3339())
+        event.setdefault("htmlLink", f"https://calendar.google.com/event?eid={event['id']}")
+        return self._save_event(calendar, event)
+
+    def _page(self, items, query):
+        """Slice ``items`` according to ``maxResults`` and ``pageToken``."""
+        max_results = min(int(query.get("maxResults", 250)), self.page_size, MAX_PAGE_SIZE)
+        offset = int(query.get("pageToken", 0))
+        page = items[offset : offset + max_results]
+        next_offset = offset + max_results
+        return page, str(next_offset) if next_offset < len(items) else None
+
+    def _list_events(self, calendar, query):
+        if "syncToken" in query:
+            generation, _, since = query["syncToken"].partition(":")
+            if int(generation) != calendar["sync_generation"]:
+                raise FakeApiError(410, "Sync token is no longer valid, a full sync is required.", "fullSyncRequired")
+
+            since = int(since)
+            changed_ids = dict.fromkeys(event_id for sequence, event_id in calendar["changes"] if sequence > since)
+            items = [
+                calendar["events"].get(event_id) or {"id": event_id, "status": "cancelled"}
+                for event_id in changed_ids
+            ]
+        else:
+            items = list(calendar["events"].values())
+            if "timeMin" in query:
+                time_min = _parse_time(query["timeMin"])
+                items = [event for event in items if _event_boundary(event, "end") > time_min]
+            if "timeMax" in query:
+                time_max = _parse_time(query["timeMax"])
+                items = [event for event in items if _event_boundary(event, "start") < time_max]
+            if query.get("orderBy") == "startTime":
+                items.sort(key=lambda event: _event_boundary(event, "start"))
+
+        page, next_page_token = self._page(items, query)
+        payload = {"kind": "calendar#events", "items": page}
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        else:
+            # "<generation>:<sequence>"; expire_sync_tokens() bumps the generation.
+            payload["nextSyncToken"] = f"{calendar['sync_generation']}:{calendar['sequence']}"
+        return payload
+
+    # ------------------------------------------------------------------
+    # Batch requests
+    # ------------------------------------------------------------------
+
+    def _handle_batch(self, body, content_type):
+        """Answer a ``multipart/mixed`` batch request."""
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+
+        parser = FeedParser()
+        parser.feed(f"content-type: {content_type}\r\n\r\n{body}")
+        message = parser.close()
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for part in message.get_payload():
+            request_line, _, rest = part.get_payload().partition("\n")
+            method, target, _protocol = request_line.strip().split(" ", 2)
+            _headers, _, part_body = rest.replace("\r\n", "\n").partition("\n\n")
+            status, payload, extra_headers = self._dispatch(
+                method, f"https://www.googleapis.com{target}", part_body.strip() or None
+            )
+
+            content = "" if payload is None else json.dumps(payload)
+            header_lines = [f"HTTP/1.1 {status} {_STATUS_REASONS.get(status, 'Error')}"]
+            header_lines.append(f"Content-Type: {JSON_CONTENT_TYPE}")
+            header_lines.extend(f"{name.title()}: {value}" for name, value in extra_headers.items())
+            chunks.append(
+                "\r\n".join(
+                    [
+                        f"--{boundary}",
+                        "Content-Type: application/http",
+                        f"Content-ID: <response-{part['Content-ID'].strip('<>')}>",
+                        "",
+                        *header_lines,
+                        "",
+                        content,
+                    ]
+                )
+            )
+        chunks.append(f"--{boundary}--")
+
+        response = httplib2.Response(
+            {"status": "200", "content-type": f"multipart/mixed; boundary={boundary}"}
+        )
+        return response, "\r\n".join(chunks).encode("utf-8")
@@ -0,0 +1,287 @@
+"""Benchmarks for the Flask pages and bulk operations against the fake Google API.
+
+Usage::
+
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 10,1000 --latency 0.05 --error-rate 0.01
+
+For every size the fake calendar is seeded with that many future events and
+the fake spreadsheet with that many rows, then ``/``, ``/multi``,
+``/spreadsheet``, flushing the future events, creating that many demo
+events in bulk and flushing them again through
+:class:`gcal.async_calendar_manager.AsyncCalendarManager` are timed. No
+Google account or network access is needed.
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from benchmarks.fake_google_api import FakeGoogleApi
+from core.constants import JST
+from core.demo_plan_service import build_demo_plans
+from core.event_cache import get_event_cache
+from core.event_pages import get_event_page_cache
+from core.spreadsheet_cache import get_spreadsheet_cache
+from core.manager_pool import manager_pool
+from core.multi_demo_service import create_missing_demo_events, flush_future_events
+from core.spreadsheet_demo_service import SPREADSHEET_REQUIRED_FIELDS
+from gcal.async_calendar_manager import AsyncCalendarManager
+from gcal.calendar_manager import CalendarManager
+from gsheets.spreadsheet_manager import SpreadsheetManager
+
+
+BENCHMARK_CALENDAR_ID = "benchmark@group.calendar.google.com"
+BENCHMARK_SPREADSHEET_ID = "benchmark-spreadsheet"
+BENCHMARK_SHEET_TITLE = "Plans"
+DEFAULT_SIZES = (10, 1000, 10000)
+
+
+class BenchmarkSession(dict):
+    """Minimal stand-in for the Flask session used by the service functions."""
+
+    modified = False
+
+
+def build_benchmark_config():
+    """Return a ``config.json`` equivalent pointing at the fake resources.
+
+    The client-side rate limit is lifted so the numbers reflect the code
+    paths, not the token bucket.
+
+    :return: Config.
+    :rtype: dict
+    """
+    return {
+        "calendar_settings": {"timezone": "Asia/Tokyo", "target_calendar_id": BENCHMARK_CALENDAR_ID},
+        "spreadsheet_settings": {
+            "spreadsheet_id": BENCHMARK_SPREADSHEET_ID,
+            "range_name": f"{BENCHMARK_SHEET_TITLE}!A:Z",
+        },
+        "api_settings": {"requests_per_second": 1_000_000, "burst": 1_000_000},
+    }
+
+
+def build_benchmark_key_info():
+    """Return a throwaway service account key. It is never sent anywhere.
+
+    :return: Service account key info.
+    :rtype: dict
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("utf-8")
+    return {
+        "type": "service_account",
+        "project_id": "benchmark",
+        "private_key_id": "benchmark",
+        "private_key": private_key_pem,
+        "client_email": "benchmark@benchmark.iam.gserviceaccount.com",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+
+
+def build_benchmark_plans(size, base_date=None):
+    """Return ``size`` demo plans spread over the next 30 days.
+
+    :param size: Number of plans.
+    :type size: int
+    :param base_date: Base date of the schedule.
+    :type base_date: datetime.date | None
+    :return: Demo plans.
+    :rtype: list[dict]
+    """
+    templates = [
+        {
+            "slot_key": f"bench-{index:05d}",
+            "day_offset": 1 + index % 30,
+            "assignee": f"担当{index % 7}",
+            "summary": f"ベンチマーク予定 {index}",
+            "location": "オンライン",
+            "description": "ベンチマーク用の予定です",
+            "start_hour": 9 + index % 9,
+            "start_minute": (index * 5) % 60,
+            "duration_minutes": 30,
+        }
+        for index in range(size)
+    ]
+    return build_demo_plans(templates, base_date=base_date)
+
+
+def seed_fake_api(fake_api, size):
+    """Seed the fake calendar and spreadsheet with ``size`` entries each.
+
+    :param fake_api: Fake API instance.
+    :type fake_api: FakeGoogleApi
+    :param size: Number of events and spreadsheet rows.
+    :type size: int
+    """
+    fake_api.add_calendar(BENCHMARK_CALENDAR_ID, summary="Benchmark")
+    rows = [list(SPREADSHEET_REQUIRED_FIELDS)]
+    for plan in build_benchmark_plans(size):
+        fake_api.add_event(
+            BENCHMARK_CALENDAR_ID,
+            {
+                "summary": f"{plan.assignee} | {plan.summary}",
+                "location": plan.location,
+                "description": plan.description,
+                "start": {"dateTime": plan.start_at.isoformat(), "timeZone": "Asia/Tokyo"},
+                "end": {"dateTime": plan.end_at.isoformat(), "timeZone": "Asia/Tokyo"},
+            },
+        )
+        rows.append(
+            [
+                plan.slot_key,
+                plan.target_date.strftime("%Y/%m/%d"),
+                plan.assignee,
+                plan.summary,
+                plan.location,
+                plan.description,
+                str(plan.start_hour),
+                str(plan.start_minute),
+                str(plan.duration_minutes),
+            ]
+        )
+    fake_api.set_sheet_values(BENCHMARK_SPREADSHEET_ID, BENCHMARK_SHEET_TITLE, rows, title="Benchmark")
+
+
+def measure(label, size, fake_api, func, repeat=1):
+    """Run ``func`` ``repeat`` times and return a result row.
+
+    Output printed by the application is discarded while measuring.
+
+    :return: Label, size, best seconds, median seconds, HTTP round trips and
+        API calls per run.
+    :rtype: tuple
+    """
+    timings = []
+    round_trips_before = fake_api.round_trips
+    api_calls_before = sum(fake_api.request_counts.values())
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started_at = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started_at)
+    round_trips = (fake_api.round_trips - round_trips_before) / repeat
+    api_calls = (sum(fake_api.request_counts.values()) - api_calls_before) / repeat
+    return label, size, min(timings), statistics.median(timings), round_trips, api_calls
+
+
+def run_size(size, key_info, args):
+    """Run every scenario for one data size.
+
+    :return: Result rows.
+    :rtype: list[tuple]
+    """
+    from app import app
+
+    fake_api = FakeGoogleApi(
+        latency=args.latency,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        seed=size,
+    )
+    seed_fake_api(fake_api, size)
+
+    config = build_benchmark_config()
+    with contextlib.redirect_stdout(io.StringIO()):
+        calendar_manager = CalendarManager(config=config, key_info=key_info, http=fake_api)
+        spreadsheet_manager = SpreadsheetManager(config=config, key_info=key_info, http=fake_api)
+    manager_pool.pin(calendar_manager)
+    manager_pool.pin(spreadsheet_manager)
+    get_event_cache(BENCHMARK_CALENDAR_ID).invalidate()
+    get_spreadsheet_cache(BENCHMARK_SPREADSHEET_ID).invalidate()
+    get_event_page_cache(BENCHMARK_CALENDAR_ID).invalidate()
+
+    client = app.test_client()
+
+    def get_page(path):
+        response = client.get(path)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} returned {response.status_code}")
+        # Streamed pages are only rendered while the body is read.
+        response.get_data()
+        response.close()
+
+    results = [
+        measure("GET / (cold cache)", size, fake_api, lambda: get_page("/")),
+        measure("GET /", size, fake_api, lambda: get_page("/"), args.repeat),
+        measure("GET /multi (cold cache)", size, fake_api, lambda: get_page("/multi")),
+        measure("GET /multi", size, fake_api, lambda: get_page("/multi"), args.repeat),
+        measure("GET /spreadsheet (cold cache)", size, fake_api, lambda: get_page("/spreadsheet")),
+        measure("GET /spreadsheet", size, fake_api, lambda: get_page("/spreadsheet"), args.repeat),
+        measure(
+            "flush future events",
+            size,
+            fake_api,
+            lambda: flush_future_events(calendar_manager, BenchmarkSession()),
+        ),
+    ]
+
+    plans = build_benchmark_plans(size, base_date=datetime.now(JST).date() + timedelta(days=1))
+    results.append(
+        measure(
+            "bulk create",
+            size,
+            fake_api,
+            lambda: create_missing_demo_events(calendar_manager, BenchmarkSession(), plans),
+        )
+    )
+
+    created = len(fake_api.events(BENCHMARK_CALENDAR_ID))
+    if created != size:
+        print(f"警告: {size}件中{created}件しか作成されませんでした")
+
+    def flush_async():
+        client = httpx.AsyncClient(transport=fake_api.async_transport())
+        async_manager = AsyncCalendarManager(calendar_manager, client=client, authorize=False)
+        return flush_future_events(calendar_manager, BenchmarkSession(), async_manager=async_manager)
+
+    results.append(measure("flush future events (async)", size, fake_api, flush_async))
+
+    manager_pool.unpin(CalendarManager)
+    manager_pool.unpin(SpreadsheetManager)
+    return results
+
+
+def print_results(results):
+    """Print result rows as a table."""
+    print(f"{'scenario':<32}{'size':>8}{'best [s]':>12}{'median [s]':>12}{'round trips':>13}{'API calls':>11}")
+    for label, size, best, median, round_trips, api_calls in results:
+        print(f"{label:<32}{size:>8}{best:>12.4f}{median:>12.4f}{round_trips:>13.1f}{api_calls:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="偽のGoogle APIを使ったベンチマーク")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="カンマ区切りのイベント件数 (既定: 10,1000,10000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="ページ表示の計測回数")
+    parser.add_argument("--latency", type=float, default=0.0, help="HTTP往復ごとの疑似遅延（秒）")
+    parser.add_argument("--page-size", type=int, default=250, help="一覧APIの1ページ最大件数")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="一時エラーを返す確率")
+    args = parser.parse_args()
+
+    key_info = build_benchmark_key_info()
+    results = []
+    for size in (int(value) for value in args.sizes.split(",") if value.strip()):
+        print(f"{size}件で計測中...")
+        results.extend(run_size(size, key_info, args))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Cold-start benchmark based on ``python -X importtime``.
+
+Usage::
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --module gui --budget-ms 150
+
+Each run starts a fresh interpreter, imports the target module and reports
+the import time, the slowest imports and whether any of the deferred Google
+API / crypto modules were loaded at import time. For ``app`` the time until
+the first response has been served is measured as well. The exit status is
+non-zero when the budget is exceeded or a deferred module was imported.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from core.manager_pool import PROJECT_ROOT
+from core.startup import DEFERRED_MODULES
+
+
+DEFAULT_IMPORT_BUDGET_MS = 300.0
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+FIRST_RESPONSE_SCRIPT = """
+import contextlib, io, json
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+    app.app.test_client().get("/auth")
+report = app.app.test_client().get("/startup").get_json()
+print(json.dumps(report))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output.
+
+    :param stderr: Standard error of the measured interpreter.
+    :type stderr: str
+    :return: ``(module, cumulative_ms, depth)`` per imported module.
+    :rtype: list[tuple[str, float, int]]
+    """
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            _self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(cumulative_us) / 1000, len(indent) // 2))
+    return imports
+
+
+def measure_import(module):
+    """Import ``module`` in a fresh interpreter and return the parsed timings.
+
+    :param module: Module to import.
+    :type module: str
+    :return: Imports of the target module and its dependencies.
+    :rtype: list[tuple[str, float, int]]
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_first_response():
+    """Start the Flask app in a fresh interpreter and return its startup report.
+
+    :return: Report of ``/startup``.
+    :rtype: dict
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_RESPONSE_SCRIPT],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONWARNINGS": "ignore"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="起動時間（インポート時間）のベンチマーク")
+    parser.add_argument("--module", default="app", help="計測するモジュール (既定: app)")
+    parser.add_argument("--runs", type=int, default=5, help="計測回数")
+    parser.add_argument("--top", type=int, default=15, help="表示する遅いインポートの件数")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_MS,
+        help="インポート時間の予算（ミリ秒）",
+    )
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.runs)]
+    totals = []
+    for imports in runs:
+        totals.append(next(cumulative for module, cumulative, _depth in imports if module == args.module))
+    median_ms = statistics.median(totals)
+
+    print(f"{args.module} のインポート時間: 中央値 {median_ms:.1f}ms / 最小 {min(totals):.1f}ms ({args.runs}回)")
+    print(f"遅いインポート上位{args.top}件:")
+    slowest = sorted(runs[-1], key=lambda item: item[1], reverse=True)[: args.top]
+    for module, cumulative_ms, depth in slowest:
+        print(f"  {cumulative_ms:8.1f}ms  {'  ' * depth}{module}")
+
+    imported_modules = {module for module, _cumulative, _depth in runs[-1]}
+    eager_modules = [name for name in DEFERRED_MODULES if name in imported_modules]
+    if eager_modules:
+        print(f"起動時に読み込まれた遅延対象モジュール: {', '.join(eager_modules)}")
+
+    if args.module == "app":
+        report = measure_first_response()
+        print("起動段階（ミリ秒）:")
+        for stage, elapsed_ms in sorted(report["stages_ms"].items(), key=lambda item: item[1]):
+            print(f"  {stage:<16}{elapsed_ms:8.1f}")
+
+    over_budget = median_ms > args.budget_ms
+    if over_budget:
+        print(f"予算超過: {median_ms:.1f}ms > {args.budget_ms:.1f}ms")
+    sys.exit(1 if over_budget or eager_modules else 0)
+
+
+if __name__ == "__main__":
+    main()
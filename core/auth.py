@@ -1,23 +1,109 @@
-"""Authentication and credential setup helpers."""
+"""Authentication and credential setup helpers.
 
+The Google API managers and ``crypto_utils`` pull in googleapiclient,
+google-auth and cryptography, so they are imported on first use to keep
+the app's cold start short.
+"""
+
+import hashlib
 import os
-import tempfile
+import threading
+import time
 from functools import wraps
 
 from flask import flash, redirect, session, url_for
 
+from core.constants import CREDENTIALS_CACHE_TTL_SECONDS
+from core.manager_pool import manager_pool
 from core.runtime import is_pyinstaller_environment, resource_path
-from crypto_utils import decrypt_file
-from gcal.calendar_manager import CalendarManager
-from gsheets.spreadsheet_manager import SpreadsheetManager
+
+
+# (password fingerprint, encrypted files mtime) -> (credentials bundle, expiry)
+_credentials_cache = {}
+_credentials_cache_lock = threading.Lock()
+# cache key -> lock held by the thread decrypting that key's bundle
+_credentials_load_locks = {}
+_FINGERPRINT_SALT = os.urandom(16)
+
+
+def _password_fingerprint(password):
+    """Return a process-local fingerprint of the credentials password.
+
+    :param password: Credentials password.
+    :type password: str
+    :return: Hex digest used as a cache key.
+    :rtype: str
+    """
+    return hashlib.sha256(_FINGERPRINT_SALT + password.encode("utf-8")).hexdigest()
+
+
+def _find_encrypted_files(encrypted_dir):
+    """List the encrypted credential files below ``encrypted_dir``.
+
+    A single-file bundle takes precedence over legacy per-file
+    ``.encrypted`` files.
+
+    :param encrypted_dir: Encrypted credentials directory.
+    :type encrypted_dir: str
+    :return: Encrypted file paths.
+    :rtype: list[str]
+    """
+    from crypto_utils import BUNDLE_FILE_NAME
+
+    bundle_path = os.path.join(encrypted_dir, BUNDLE_FILE_NAME)
+    if os.path.exists(bundle_path):
+        return [bundle_path]
+
+    encrypted_files = []
+    for root, _dirs, files in os.walk(encrypted_dir):
+        for file_name in files:
+            if file_name.endswith(".encrypted"):
+                encrypted_files.append(os.path.join(root, file_name))
+    return encrypted_files
+
+
+def _purge_expired_credentials(now):
+    """Drop expired cache entries. Caller must hold the cache lock."""
+    for cache_key, (bundle, expires_at) in list(_credentials_cache.items()):
+        if expires_at <= now:
+            del _credentials_cache[cache_key]
+            manager_pool.discard_bundle(bundle["bundle_id"])
+
+
+def evict_credentials_cache(password=None):
+    """Evict decrypted credentials from the process-wide cache.
+
+    :param password: Evict only entries for this password. ``None`` evicts all.
+    :type password: str | None
+    :return: Number of evicted entries.
+    :rtype: int
+    """
+    fingerprint = _password_fingerprint(password) if password is not None else None
+    evicted = 0
+    with _credentials_cache_lock:
+        for cache_key, (bundle, _expires_at) in list(_credentials_cache.items()):
+            if fingerprint is not None and cache_key[0] != fingerprint:
+                continue
+            del _credentials_cache[cache_key]
+            manager_pool.discard_bundle(bundle["bundle_id"])
+            evicted += 1
+    return evicted
 
 
 def setup_credentials(session_obj):
-    """Decrypt bundled credentials into a temporary directory.
+    """Decrypt bundled credentials in memory.
+
+    Decrypted credentials are cached per process, keyed by a fingerprint of
+    the password and the modification time of the encrypted files, so the
+    key derivation runs once per password instead of once per request.
+    It runs outside the cache lock; concurrent requests for the same key
+    wait for one derivation instead of starting their own. Nothing is
+    written to disk.
 
     :param session_obj: Flask session object.
-    :return: Tuple of temporary directory path and error message.
-    :rtype: tuple[str | None, str | None]
+    :return: Tuple of credentials bundle and error message. The bundle holds
+        ``config``, ``key_info``, ``key_name`` and ``bundle_id``.
+    :rtype: tuple[dict | None, str | None]
     """
     if "credentials_password" not in session_obj:
         return None, "認証情報のパスワードが設定されていません。"
@@ -26,28 +112,40 @@ def setup_credentials(session_obj):
 
     try:
         encrypted_dir = resource_path("encrypted_credentials")
-        encrypted_files = []
-
-        for root, _dirs, files in os.walk(encrypted_dir):
-            for file_name in files:
-                if file_name.endswith(".encrypted"):
-                    encrypted_files.append(os.path.join(root, file_name))
+        encrypted_files = _find_encrypted_files(encrypted_dir)
 
         if not encrypted_files:
             return None, "暗号化された認証情報ファイルが見つかりません。"
 
-        temp_dir = tempfile.mkdtemp(prefix="app_credentials_")
-
-        for encrypted_file in encrypted_files:
-            relative_path = os.path.relpath(encrypted_file, encrypted_dir)
-            if relative_path.endswith(".encrypted"):
-                relative_path = relative_path[:-10]
-
-            output_path = os.path.join(temp_dir, relative_path)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            decrypt_file(encrypted_file, password, output_path)
-
-        return temp_dir, None
+        bundle_mtime = max(os.path.getmtime(path) for path in encrypted_files)
+        cache_key = (_password_fingerprint(password), bundle_mtime)
+
+        with _credentials_cache_lock:
+            _purge_expired_credentials(time.monotonic())
+            cached = _credentials_cache.get(cache_key)
+            if cached:
+                return cached[0], None
+            load_lock = _credentials_load_locks.setdefault(cache_key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have decrypted the bundle while we waited.
+            with _credentials_cache_lock:
+                cached = _credentials_cache.get(cache_key)
+                if cached:
+                    return cached[0], None
+
+            from crypto_utils import load_credentials_bundle
+
+            try:
+                bundle = load_credentials_bundle(encrypted_dir, password)
+                bundle["bundle_id"] = f"{cache_key[0]}:{bundle_mtime}"
+                with _credentials_cache_lock:
+                    _credentials_cache[cache_key] = (bundle, time.monotonic() + CREDENTIALS_CACHE_TTL_SECONDS)
+            finally:
+                with _credentials_cache_lock:
+                    if _credentials_load_locks.get(cache_key) is load_lock:
+                        del _credentials_load_locks[cache_key]
+            return bundle, None
     except Exception as exc:
         return None, f"認証情報の復号化エラー: {str(exc)}"
 
@@ -70,7 +168,7 @@ def requires_auth(view_func):
 
 
 def _build_manager(session_obj, manager_class, manager_label):
-    """Create a Google API manager for the current runtime.
+    """Return the pooled Google API manager for the current runtime.
 
     :param session_obj: Flask session object.
     :param manager_class: Manager class to instantiate.
@@ -83,40 +181,43 @@ def _build_manager(session_obj, manager_class, manager_label):
             return None
 
         try:
-            creds_dir, error = setup_credentials(session_obj)
-            if error or not creds_dir:
+            bundle, error = setup_credentials(session_obj)
+            if error or not bundle:
                 print(f"認証情報エラー: {error}")
                 return None
 
-            config_file = os.path.join(creds_dir, "config.json")
-            return manager_class(config_file=config_file, key_dir=creds_dir)
+            return manager_pool.get_for_bundle(manager_class, bundle)
         except Exception as exc:
             print(f"{manager_label}の初期化エラー: {exc}")
             return None
 
     print("通常のPython環境で実行中")
     try:
-        return manager_class()
+        return manager_pool.get(manager_class)
     except Exception as exc:
         print(f"{manager_label}の初期化エラー: {exc}")
         return None
 
 
 def get_calendar_manager(session_obj):
-    """Create a :class:`CalendarManager` for the current runtime.
+    """Return a shared :class:`CalendarManager` for the current runtime.
 
     :param session_obj: Flask session object.
     :return: Calendar manager instance or ``None``.
     :rtype: CalendarManager | None
     """
+    from gcal.calendar_manager import CalendarManager
+
     return _build_manager(session_obj, CalendarManager, "カレンダーマネージャー")
 
 
 def get_spreadsheet_manager(session_obj):
-    """Create a :class:`SpreadsheetManager` for the current runtime.
+    """Return a shared :class:`SpreadsheetManager` for the current runtime.
 
     :param session_obj: Flask session object.
     :return: Spreadsheet manager instance or ``None``.
     :rtype: SpreadsheetManager | None
     """
+    from gsheets.spreadsheet_manager import SpreadsheetManager
+
     return _build_manager(session_obj, SpreadsheetManager, "スプレッドシートマネージャー")
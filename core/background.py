@@ -0,0 +1,208 @@
+"""Background execution of slow Google API work for the Tk GUI.
+
+Tk widgets may only be touched from the thread running the main loop. The
+:class:`BackgroundWorker` runs task functions on a worker thread and hands
+their progress messages and results back through a queue that the main
+loop polls with ``root.after``, so every callback runs on the UI thread.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_POLL_INTERVAL_MS = 50
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task function once its task has been cancelled."""
+
+
+class BackgroundTask:
+    """Handle of one submitted task. It is passed to the task function."""
+
+    def __init__(self, name, worker):
+        self.name = name
+        self._worker = worker
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._state = "queued"
+
+    @property
+    def cancelled(self):
+        """Whether :meth:`cancel` has been called."""
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Ask the task to stop at its next cancellation point."""
+        self._cancel_event.set()
+
+    def raise_if_cancelled(self):
+        """Raise :class:`TaskCancelled` if the task has been cancelled."""
+        if self.cancelled:
+            raise TaskCancelled(self.name)
+
+    def report(self, message):
+        """Send a progress message to the UI thread.
+
+        This is also a cancellation point: it raises :class:`TaskCancelled`
+        once the task has been cancelled.
+
+        :param message: Progress message.
+        :type message: str
+        """
+        self._worker._post(self, "progress", message)
+        self.raise_if_cancelled()
+
+    def _start(self):
+        """Mark the task as running unless it was cancelled while queued."""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._state = "running"
+            return True
+
+    def _is_queued(self):
+        with self._lock:
+            return self._state == "queued"
+
+
+class BackgroundWorker:
+    """Run task functions off the Tk main thread, one at a time.
+
+    Tasks are identified by name. Submitting a name that is still queued is
+    a no-op; submitting it while it runs is ignored, or with ``rerun=True``
+    runs it once more after the current run, however many times it was
+    submitted in between.
+    """
+
+    def __init__(self, root, poll_interval_ms=DEFAULT_POLL_INTERVAL_MS):
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-task")
+        self._messages = queue.SimpleQueue()
+        # Only touched on the UI thread.
+        self._tasks = {}
+        self._reruns = {}
+        self._polling = False
+
+    @property
+    def busy(self):
+        """Whether any task is queued or running."""
+        return bool(self._tasks)
+
+    def submit(self, name, func, on_done=None, on_error=None, on_progress=None, on_cancel=None, rerun=False):
+        """Queue ``func(task)`` on the worker thread. Call from the UI thread only.
+
+        :param name: Task name used for coalescing, e.g. ``refresh``.
+        :type name: str
+        :param func: Function run on the worker thread with the
+            :class:`BackgroundTask` as its only argument.
+        :param on_done: Called on the UI thread with the return value.
+        :param on_error: Called on the UI thread with the raised exception.
+        :param on_progress: Called on the UI thread with each progress message.
+        :param on_cancel: Called on the UI thread when the task stops after a cancel.
+        :param rerun: Run once more after the current run if the task is already running.
+        :type rerun: bool
+        :return: The new task, or the already active task of the same name.
+        :rtype: BackgroundTask
+        """
+        callbacks = {"done": on_done, "error": on_error, "progress": on_progress, "cancelled": on_cancel}
+        entry = self._tasks.get(name)
+        if entry is not None:
+            current = entry[0]
+            if rerun and not current._is_queued() and not current.cancelled:
+                self._reruns[name] = (func, callbacks)
+            return current
+
+        task = BackgroundTask(name, self)
+        self._tasks[name] = (task, callbacks)
+        self._executor.submit(self._run, task, func)
+        self._ensure_polling()
+        return task
+
+    def cancel(self, name=None):
+        """Cancel the named task, or every task. Call from the UI thread only.
+
+        :param name: Task name, or ``None`` for all tasks.
+        :type name: str | None
+        """
+        names = [name] if name is not None else list(self._tasks)
+        for task_name in names:
+            self._reruns.pop(task_name, None)
+            entry = self._tasks.get(task_name)
+            if entry is not None:
+                entry[0].cancel()
+
+    def shutdown(self):
+        """Cancel every task and stop the worker thread without waiting for it."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _post(self, task, kind, payload=None):
+        self._messages.put((task, kind, payload))
+
+    def _run(self, task, func):
+        """Run a task on the worker thread and post its outcome."""
+        if not task._start():
+            self._post(task, "cancelled")
+            return
+
+        try:
+            result = func(task)
+        except TaskCancelled:
+            self._post(task, "cancelled")
+        except Exception as exc:
+            self._post(task, "error", exc)
+        else:
+            self._post(task, "done", result)
+
+    def _ensure_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval_ms, self._poll)
+
+    def _poll(self):
+        """Deliver queued messages to their callbacks on the UI thread."""
+        while True:
+            try:
+                task, kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            self._dispatch(task, kind, payload)
+
+        if self._tasks:
+            self.root.after(self.poll_interval_ms, self._poll)
+        else:
+            self._polling = False
+
+    def _dispatch(self, task, kind, payload):
+        entry = self._tasks.get(task.name)
+        if entry is None or entry[0] is not task:
+            return
+        callbacks = entry[1]
+
+        if kind == "progress":
+            if callbacks["progress"]:
+                callbacks["progress"](payload)
+            return
+
+        del self._tasks[task.name]
+        callback = callbacks[kind]
+        if callback:
+            if kind == "cancelled":
+                callback()
+            else:
+                callback(payload)
+
+        rerun = self._reruns.pop(task.name, None)
+        if rerun is not None:
+            func, rerun_callbacks = rerun
+            self.submit(
+                task.name,
+                func,
+                on_done=rerun_callbacks["done"],
+                on_error=rerun_callbacks["error"],
+                on_progress=rerun_callbacks["progress"],
+                on_cancel=rerun_callbacks["cancelled"],
+            )
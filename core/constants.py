@@ -6,3 +6,18 @@ from zoneinfo import ZoneInfo
 JST = ZoneInfo("Asia/Tokyo")
 MULTI_DEMO_SESSION_KEY = "multi_demo_event_ids"
 MULTI_DEMO_SLOT_MARKER = "DEMO_MULTI_SLOT:"
+MULTI_DEMO_SLOT_PROPERTY = "demo_slot_key"
+CREDENTIALS_CACHE_TTL_SECONDS = 30 * 60
+
+# Partial-response ``fields`` masks for Calendar API calls, per view.
+EVENT_FIELDS_LIST = "items(id,status,summary,location,start,end),nextPageToken"
+EVENT_FIELDS_DETAIL = "id,status,summary,description,location,start,end"
+EVENT_FIELDS_SYNC = (
+    "items(id,status,summary,description,location,start,end,extendedProperties/private),"
+    "nextPageToken,nextSyncToken"
+)
+EVENT_FIELD_PRESETS = {
+    "list": EVENT_FIELDS_LIST,
+    "detail": EVENT_FIELDS_DETAIL,
+    "sync": EVENT_FIELDS_SYNC,
+}
@@ -16,6 +16,7 @@ REQUIRED_DEMO_PLAN_FIELDS = (
     "start_minute",
     "duration_minutes",
 )
+WEEKDAY_LABELS = ("月", "火", "水", "木", "金", "土", "日")
 
 
 def normalize_demo_plan_template(row):
@@ -43,6 +44,109 @@ def normalize_demo_plan_template(row):
     }
 
 
+class DemoPlan:
+    """One dated demo slot.
+
+    Plans are created for every row of large imports, so they use
+    ``__slots__`` and compute their display labels on access instead of
+    storing them.
+    """
+
+    __slots__ = (
+        "slot_key",
+        "assignee",
+        "summary",
+        "location",
+        "description",
+        "start_hour",
+        "start_minute",
+        "duration_minutes",
+        "target_date",
+        "start_at",
+        "end_at",
+        "day_offset",
+        "day",
+        "source_range",
+    )
+
+    def __init__(
+        self,
+        slot_key,
+        assignee,
+        summary,
+        location,
+        description,
+        start_hour,
+        start_minute,
+        duration_minutes,
+        target_date,
+        day_offset=None,
+        day=None,
+        source_range=None,
+    ):
+        self.slot_key = slot_key
+        self.assignee = assignee
+        self.summary = summary
+        self.location = location
+        self.description = description
+        self.start_hour = start_hour
+        self.start_minute = start_minute
+        self.duration_minutes = duration_minutes
+        self.target_date = target_date
+        self.day_offset = day_offset
+        self.day = day
+        self.source_range = source_range
+        self.start_at = datetime(
+            target_date.year,
+            target_date.month,
+            target_date.day,
+            start_hour,
+            start_minute,
+            tzinfo=JST,
+        )
+        self.end_at = self.start_at + timedelta(minutes=duration_minutes)
+
+    def __repr__(self):
+        return f"DemoPlan(slot_key={self.slot_key!r}, start_at={self.start_at.isoformat()})"
+
+    @property
+    def weekday_label(self):
+        """Japanese weekday of the target date, e.g. ``月``."""
+        return WEEKDAY_LABELS[self.target_date.weekday()]
+
+    @property
+    def planned_time_label(self):
+        """Planned time range, e.g. ``2024-01-01 10:00 - 10:30``."""
+        return f"{self.start_at.strftime('%Y-%m-%d %H:%M')} - {self.end_at.strftime('%H:%M')}"
+
+
+def build_demo_plan(template, base_date, source_range=None):
+    """Build a dated demo plan from a normalized ``day_offset`` template.
+
+    :param template: Normalized template.
+    :type template: dict
+    :param base_date: Base date the day offset is counted from.
+    :type base_date: datetime.date
+    :param source_range: Spreadsheet range the template was read from.
+    :type source_range: str | None
+    :return: Demo plan.
+    :rtype: DemoPlan
+    """
+    return DemoPlan(
+        template["slot_key"],
+        template["assignee"],
+        template["summary"],
+        template["location"],
+        template["description"],
+        template["start_hour"],
+        template["start_minute"],
+        template["duration_minutes"],
+        base_date + timedelta(days=template["day_offset"]),
+        day_offset=template["day_offset"],
+        source_range=source_range,
+    )
+
+
 def build_demo_plans(plan_templates, base_date=None):
     """Build dated demo plans from normalized templates.
 
@@ -51,32 +155,9 @@ def build_demo_plans(plan_templates, base_date=None):
     :param base_date: Base date used for the generated schedule.
     :type base_date: datetime.date | None
     :return: Planned demo schedule rows.
-    :rtype: list[dict]
+    :rtype: list[DemoPlan]
     """
     if base_date is None:
         base_date = datetime.now(JST).date()
 
-    plans = []
-    for template in plan_templates:
-        target_date = base_date + timedelta(days=template["day_offset"])
-        start_at = datetime(
-            target_date.year,
-            target_date.month,
-            target_date.day,
-            template["start_hour"],
-            template["start_minute"],
-            tzinfo=JST,
-        )
-        end_at = start_at + timedelta(minutes=template["duration_minutes"])
-        plans.append(
-            {
-                **template,
-                "target_date": target_date,
-                "start_at": start_at,
-                "end_at": end_at,
-                "weekday_label": ["月", "火", "水", "木", "金", "土", "日"][target_date.weekday()],
-                "planned_time_label": f"{start_at.strftime('%Y-%m-%d %H:%M')} - {end_at.strftime('%H:%M')}",
-            }
-        )
-
-    return plans
+    return [build_demo_plan(template, base_date) for template in plan_templates]
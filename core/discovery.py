@@ -0,0 +1,143 @@
+"""Offline, in-memory cache of Google API discovery documents.
+
+``googleapiclient.discovery.build`` reads and parses the discovery JSON on
+every call. The documents used by this app are shipped in ``discovery/``
+(also inside the PyInstaller bundle), parsed once per process and turned
+into service clients with ``build_from_document``, so no network fetch is
+ever attempted. googleapiclient itself is imported on first use.
+"""
+
+import json
+import os
+import threading
+import time
+
+from core.runtime import resource_path
+
+
+DISCOVERY_DIR = "discovery"
+APP_DISCOVERY_DOCUMENTS = (("calendar", "v3"), ("sheets", "v4"))
+
+_documents = {}
+_timings = {}
+# googleapiclient fixes up the method descriptions of the shared document in
+# place: build_from_document for top-level methods, and every accessor call
+# such as ``service.events()`` for the methods of that nested resource. The
+# accessors run outside this lock on any thread, so the first build of a
+# document calls each of them once under the lock (see
+# _prepare_nested_resources). Later calls then only re-assign equal values to
+# keys that already exist.
+_documents_lock = threading.Lock()
+
+
+def _read_discovery_document(service_name, version):
+    """Return the raw discovery document and where it was read from.
+
+    The copy in ``discovery/`` is preferred; the static documents shipped
+    with google-api-python-client are used as a fallback.
+
+    :return: Document text and source label.
+    :rtype: tuple[str, str]
+    """
+    path = resource_path(os.path.join(DISCOVERY_DIR, f"{service_name}.{version}.json"))
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as file_obj:
+            return file_obj.read(), path
+
+    from googleapiclient.discovery_cache import get_static_doc
+
+    content = get_static_doc(service_name, version)
+    if content is None:
+        raise FileNotFoundError(f"Discovery文書が見つかりません: {service_name}.{version}")
+    return content, "googleapiclient"
+
+
+def _load_locked(service_name, version):
+    """Return the parsed document. Caller must hold the documents lock."""
+    document_key = f"{service_name}.{version}"
+    document = _documents.get(document_key)
+    if document is None:
+        started_at = time.perf_counter()
+        content, source = _read_discovery_document(service_name, version)
+        document = json.loads(content)
+        _documents[document_key] = document
+        _timings[document_key] = {
+            "source": source,
+            "load_ms": (time.perf_counter() - started_at) * 1000,
+            "builds": 0,
+            "build_ms": 0.0,
+        }
+    return document
+
+
+def load_discovery_document(service_name, version):
+    """Return the parsed discovery document, loading it on first use.
+
+    :param service_name: API name, e.g. ``calendar``.
+    :type service_name: str
+    :param version: API version, e.g. ``v3``.
+    :type version: str
+    :return: Parsed discovery document.
+    :rtype: dict
+    """
+    with _documents_lock:
+        return _load_locked(service_name, version)
+
+
+def _prepare_nested_resources(resource, resource_desc):
+    """Call every nested resource accessor once so its methods are fixed up.
+
+    Caller must hold the documents lock.
+    """
+    from googleapiclient.discovery import fix_method_name
+
+    for name, nested_desc in resource_desc.get("resources", {}).items():
+        nested = getattr(resource, fix_method_name(name))()
+        _prepare_nested_resources(nested, nested_desc)
+
+
+def build_service(service_name, version, **kwargs):
+    """Build a service client from the cached discovery document.
+
+    :param service_name: API name, e.g. ``calendar``.
+    :type service_name: str
+    :param version: API version, e.g. ``v3``.
+    :type version: str
+    :param kwargs: Passed to ``build_from_document`` (``http``, ``requestBuilder``...).
+    :return: Google API service resource.
+    """
+    from googleapiclient.discovery import build_from_document
+
+    with _documents_lock:
+        document = _load_locked(service_name, version)
+        started_at = time.perf_counter()
+        service = build_from_document(document, **kwargs)
+        timing = _timings[f"{service_name}.{version}"]
+        if not timing["builds"]:
+            _prepare_nested_resources(service, document)
+        timing["builds"] += 1
+        timing["build_ms"] += (time.perf_counter() - started_at) * 1000
+    return service
+
+
+def preload_discovery_documents(documents=APP_DISCOVERY_DOCUMENTS):
+    """Parse the app's discovery documents ahead of the first request.
+
+    :param documents: ``(service_name, version)`` pairs.
+    :type documents: tuple[tuple[str, str], ...]
+    :return: Load time in milliseconds per document.
+    :rtype: dict
+    """
+    for service_name, version in documents:
+        load_discovery_document(service_name, version)
+    return {document_key: timing["load_ms"] for document_key, timing in get_discovery_timings().items()}
+
+
+def get_discovery_timings():
+    """Return load and build timings per discovery document.
+
+    :return: ``{"calendar.v3": {"source", "load_ms", "builds", "build_ms"}}``.
+    :rtype: dict
+    """
+    with _documents_lock:
+        return {document_key: dict(timing) for document_key, timing in _timings.items()}
@@ -0,0 +1,248 @@
+"""Read-through cache of Google Calendar events refreshed with sync tokens."""
+
+import threading
+from datetime import datetime
+
+from core.constants import EVENT_FIELDS_SYNC, JST, MULTI_DEMO_SLOT_MARKER, MULTI_DEMO_SLOT_PROPERTY
+
+
+def parse_event_boundary(event_time):
+    """Convert a Calendar event time block into an aware datetime.
+
+    :param event_time: ``start`` or ``end`` block of an event.
+    :type event_time: dict | None
+    :return: Aware datetime or ``None``.
+    :rtype: datetime | None
+    """
+    if not event_time:
+        return None
+
+    if event_time.get("dateTime"):
+        return datetime.fromisoformat(event_time["dateTime"].replace("Z", "+00:00"))
+
+    if event_time.get("date"):
+        return datetime.fromisoformat(event_time["date"]).replace(tzinfo=JST)
+
+    return None
+
+
+def extract_event_slot_key(event):
+    """Return the demo slot key an event belongs to.
+
+    The ``demo_slot_key`` private extended property is preferred. Events
+    created before it existed carry the key as a marker line in the
+    description and are still recognised.
+
+    :param event: Calendar event.
+    :type event: dict
+    :return: Slot key or ``None``.
+    :rtype: str | None
+    """
+    private_properties = event.get("extendedProperties", {}).get("private", {})
+    slot_key = private_properties.get(MULTI_DEMO_SLOT_PROPERTY)
+    if slot_key:
+        return slot_key
+
+    description = event.get("description")
+    if not description or MULTI_DEMO_SLOT_MARKER not in description:
+        return None
+
+    for line in description.splitlines():
+        if line.startswith(MULTI_DEMO_SLOT_MARKER):
+            return line.replace(MULTI_DEMO_SLOT_MARKER, "", 1).strip() or None
+
+    return None
+
+
+class CalendarEventCache:
+    """Local copy of one calendar kept current with ``nextSyncToken``.
+
+    The first refresh performs a full load. Later refreshes send the stored
+    sync token and only apply the returned inserts, updates and cancellations.
+    The Calendar API rejects ``timeMin``/``orderBy`` together with sync
+    tokens, so the whole calendar is mirrored and time filtering and ordering
+    happen locally.
+
+    Only the fields used by the demo pages are requested
+    (:data:`core.constants.EVENT_FIELDS_SYNC`).
+
+    A ``slot_key -> event ids`` index is maintained alongside the events so
+    demo slot lookups do not scan the calendar.
+    """
+
+    def __init__(self, calendar_id):
+        self.calendar_id = calendar_id
+        self._events = {}
+        self._slot_index = {}
+        self._sync_token = None
+        self._lock = threading.Lock()
+
+    def _store_event(self, event):
+        """Insert or replace an event and keep the slot index current."""
+        self._discard_event(event["id"])
+        self._events[event["id"]] = event
+        slot_key = extract_event_slot_key(event)
+        if slot_key:
+            self._slot_index.setdefault(slot_key, {})[event["id"]] = None
+
+    def _discard_event(self, event_id):
+        """Remove an event and its slot index entry."""
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return
+
+        slot_key = extract_event_slot_key(event)
+        slot_events = self._slot_index.get(slot_key)
+        if slot_events is not None:
+            slot_events.pop(event_id, None)
+            if not slot_events:
+                del self._slot_index[slot_key]
+
+    def _list_all_pages(self, calendar_manager, sync_token=None):
+        """Fetch every page of a full or incremental listing.
+
+        :return: Listed events and the next sync token.
+        :rtype: tuple[list[dict], str | None]
+        """
+        events = []
+        page_token = None
+
+        while True:
+            params = {
+                "calendarId": self.calendar_id,
+                "singleEvents": True,
+                "maxResults": 2500,
+                "fields": EVENT_FIELDS_SYNC,
+            }
+            if sync_token:
+                params["syncToken"] = sync_token
+            if page_token:
+                params["pageToken"] = page_token
+
+            result = calendar_manager.execute(calendar_manager.service.events().list(**params))
+            events.extend(result.get("items", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return events, result.get("nextSyncToken")
+
+    def _full_sync(self, calendar_manager):
+        """Replace the cache with a full listing of the calendar."""
+        events, sync_token = self._list_all_pages(calendar_manager)
+        self._events = {}
+        self._slot_index = {}
+        for event in events:
+            if event.get("id") and event.get("status") != "cancelled":
+                self._store_event(event)
+        self._sync_token = sync_token
+
+    def _apply_delta(self, calendar_manager):
+        """Apply changes since the stored sync token."""
+        events, sync_token = self._list_all_pages(calendar_manager, sync_token=self._sync_token)
+        for event in events:
+            event_id = event.get("id")
+            if not event_id:
+                continue
+            if event.get("status") == "cancelled":
+                self._discard_event(event_id)
+            else:
+                self._store_event(event)
+        self._sync_token = sync_token
+
+    def refresh(self, calendar_manager):
+        """Bring the cache up to date, falling back to a full resync on 410.
+
+        :param calendar_manager: Calendar manager instance.
+        """
+        from googleapiclient.errors import HttpError
+
+        with self._lock:
+            if self._sync_token:
+                try:
+                    self._apply_delta(calendar_manager)
+                    return
+                except HttpError as exc:
+                    if exc.resp.status != 410:
+                        raise
+                    print("同期トークンが失効したため全件を再取得します")
+
+            self._full_sync(calendar_manager)
+
+    def invalidate(self):
+        """Forget the cached events so the next refresh is a full load."""
+        with self._lock:
+            self._events = {}
+            self._slot_index = {}
+            self._sync_token = None
+
+    def get(self, event_id):
+        """Return a cached event by id.
+
+        :param event_id: Event id.
+        :type event_id: str
+        :return: Cached event or ``None``.
+        :rtype: dict | None
+        """
+        return self._events.get(event_id)
+
+    def find_slot_event(self, slot_key, start_time):
+        """Return the earliest event of a slot ending after ``start_time``.
+
+        :param slot_key: Demo slot key.
+        :type slot_key: str
+        :param start_time: Lower bound (exclusive) for the event end time.
+        :type start_time: datetime
+        :return: Event or ``None``.
+        :rtype: dict | None
+        """
+        with self._lock:
+            events = [self._events[event_id] for event_id in self._slot_index.get(slot_key, ())]
+
+        candidates = []
+        for event in events:
+            end_at = parse_event_boundary(event.get("end"))
+            if end_at is not None and end_at > start_time:
+                candidates.append((parse_event_boundary(event.get("start")) or end_at, event))
+
+        if not candidates:
+            return None
+        return min(candidates, key=lambda item: item[0])[1]
+
+    def future_events(self, start_time):
+        """Return cached events ending after ``start_time`` ordered by start.
+
+        :param start_time: Lower bound (exclusive) for the event end time.
+        :type start_time: datetime
+        :return: Events.
+        :rtype: list[dict]
+        """
+        with self._lock:
+            events = list(self._events.values())
+
+        future = []
+        for event in events:
+            end_at = parse_event_boundary(event.get("end"))
+            if end_at is not None and end_at > start_time:
+                future.append((parse_event_boundary(event.get("start")) or end_at, event))
+
+        future.sort(key=lambda item: item[0])
+        return [event for _start_at, event in future]
+
+
+_event_caches = {}
+_event_caches_lock = threading.Lock()
+
+
+def get_event_cache(calendar_id):
+    """Return the process-wide event cache for ``calendar_id``.
+
+    :param calendar_id: Calendar id.
+    :type calendar_id: str
+    :return: Event cache.
+    :rtype: CalendarEventCache
+    """
+    with _event_caches_lock:
+        cache = _event_caches.get(calendar_id)
+        if cache is None:
+            cache = CalendarEventCache(calendar_id)
+            _event_caches[calendar_id] = cache
+        return cache
@@ -0,0 +1,163 @@
+"""Per-window cache of Calendar ``events.list`` pages for the event list page."""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+
+
+DEFAULT_EVENT_PAGE_CACHE_TTL_SECONDS = 60
+# Windows kept per calendar; the least recently used one is dropped first.
+MAX_CACHED_WINDOWS = 32
+
+
+class EventPageCache:
+    """Pages of time-windowed event listings of one calendar.
+
+    Pages are keyed by window (``timeMin``, ``timeMax``, ``maxResults``) and
+    the ``pageToken`` that was sent for them. Each page also records the
+    token of the page before it, so moving back through a window is served
+    from memory as well.
+
+    All pages of a window expire together ``ttl_seconds`` after its first
+    page was loaded, so the token chain always comes from one listing.
+    Writes made through the calendar managers call :meth:`invalidate`.
+    """
+
+    def __init__(self, calendar_id, max_windows=MAX_CACHED_WINDOWS):
+        self.calendar_id = calendar_id
+        self.max_windows = max_windows
+        self._windows = OrderedDict()
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def _window(self, window_key, ttl_seconds):
+        """Return the live entry of a window, creating it. Caller must hold the lock."""
+        now = time.monotonic()
+        window = self._windows.get(window_key)
+        if window is not None and now - window["loaded_at"] >= ttl_seconds:
+            self._counts["expirations"] += 1
+            window = None
+
+        if window is None:
+            # First page: number 1, no previous page.
+            window = {"loaded_at": now, "pages": {}, "loading": {}, "previous": {None: None}, "numbers": {None: 1}}
+            self._windows[window_key] = window
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+        self._windows.move_to_end(window_key)
+        return window
+
+    def get_page(self, window_key, page_token, loader, ttl_seconds=DEFAULT_EVENT_PAGE_CACHE_TTL_SECONDS):
+        """Return one page of a window, calling ``loader`` when it is not cached.
+
+        :param window_key: ``(time_min, time_max, max_results)`` of the listing.
+        :type window_key: tuple
+        :param page_token: ``pageToken`` of the page, or ``None`` for the first page.
+        :type page_token: str | None
+        :param loader: Callable returning ``(events, next_page_token)``.
+        :param ttl_seconds: Seconds the pages of a window are served from memory.
+        :type ttl_seconds: float
+        :return: ``{"events", "page_token", "next_page_token", "previous_page_token",
+            "has_previous", "page_number"}``. ``previous_page_token`` and
+            ``page_number`` are ``None`` when the page was reached through a
+            token the cache has not seen.
+        :rtype: dict
+        """
+        with self._lock:
+            window = self._window(window_key, ttl_seconds)
+            page = window["pages"].get(page_token)
+            if page is not None:
+                self._counts["hits"] += 1
+                return self._page_result(window, page_token, page)
+            load_lock = window["loading"].setdefault(page_token, threading.Lock())
+
+        # The Calendar API is called outside the cache lock; only one thread
+        # loads a given page, the others wait for it and share its result.
+        with load_lock:
+            with self._lock:
+                page = window["pages"].get(page_token)
+                if page is not None:
+                    self._counts["hits"] += 1
+                    return self._page_result(window, page_token, page)
+
+            events, next_page_token = loader()
+
+            with self._lock:
+                self._counts["misses"] += 1
+                page = {"events": events, "next_page_token": next_page_token}
+                window["pages"][page_token] = page
+                window["loading"].pop(page_token, None)
+                return self._page_result(window, page_token, page)
+
+    @staticmethod
+    def _page_result(window, page_token, page):
+        """Link ``page`` to the next one and build the result. Caller must hold the lock."""
+        next_page_token = page["next_page_token"]
+        number = window["numbers"].get(page_token)
+        if next_page_token:
+            window["previous"].setdefault(next_page_token, page_token)
+            if number is not None:
+                window["numbers"].setdefault(next_page_token, number + 1)
+
+        return {
+            "events": page["events"],
+            "page_token": page_token,
+            "next_page_token": next_page_token,
+            "previous_page_token": window["previous"].get(page_token),
+            "has_previous": page_token is not None,
+            "page_number": number,
+        }
+
+    def invalidate(self):
+        """Drop every cached page so the next read goes to the Calendar API."""
+        with self._lock:
+            if self._windows:
+                self._counts["invalidations"] += 1
+            self._windows.clear()
+
+    def stats(self):
+        """Return cache counters.
+
+        :return: ``{"windows", "pages", "hits", "misses", "expirations", "invalidations"}``.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "windows": len(self._windows),
+                "pages": sum(len(window["pages"]) for window in self._windows.values()),
+                "hits": self._counts["hits"],
+                "misses": self._counts["misses"],
+                "expirations": self._counts["expirations"],
+                "invalidations": self._counts["invalidations"],
+            }
+
+
+_event_page_caches = {}
+_event_page_caches_lock = threading.Lock()
+
+
+def get_event_page_cache(calendar_id):
+    """Return the process-wide page cache for ``calendar_id``.
+
+    :param calendar_id: Calendar id.
+    :type calendar_id: str
+    :return: Event page cache.
+    :rtype: EventPageCache
+    """
+    with _event_page_caches_lock:
+        cache = _event_page_caches.get(calendar_id)
+        if cache is None:
+            cache = EventPageCache(calendar_id)
+            _event_page_caches[calendar_id] = cache
+        return cache
+
+
+def get_event_page_cache_stats():
+    """Return the counters of every event page cache.
+
+    :return: Stats per calendar id.
+    :rtype: dict
+    """
+    with _event_page_caches_lock:
+        caches = dict(_event_page_caches)
+    return {calendar_id: cache.stats() for calendar_id, cache in caches.items()}
@@ -0,0 +1,313 @@
+"""Shared execution layer for Google API requests.
+
+Every request made by :class:`gcal.calendar_manager.CalendarManager` and
+:class:`gsheets.spreadsheet_manager.SpreadsheetManager` goes through
+:func:`execute_request` or :func:`execute_batch`. They retry transient
+failures with jittered exponential backoff, honour ``Retry-After`` and pace
+calls through a client-side token bucket per Google Cloud project.
+
+Retries are safe for inserts too: Calendar events are inserted with a
+client-generated id, so an insert whose first attempt was committed before
+the error fails with 409 on retry (see :func:`is_duplicate_error`) instead
+of creating a second event.
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from googleapiclient.errors import HttpError
+
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_REASONS = ("ratelimitexceeded", "userratelimitexceeded", "quotaexceeded")
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 32.0
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_BURST = 20
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to stay under a per-project quota."""
+
+    def __init__(self, rate=DEFAULT_REQUESTS_PER_SECOND, capacity=DEFAULT_BURST):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until ``tokens`` tokens are available and consume them.
+
+        :param tokens: Number of API calls about to be made.
+        :type tokens: int
+        """
+        while True:
+            wait_seconds = self._try_acquire(tokens)
+            if not wait_seconds:
+                return
+            time.sleep(wait_seconds)
+
+    async def acquire_async(self, tokens=1):
+        """Wait without blocking the event loop until ``tokens`` are available.
+
+        :param tokens: Number of API calls about to be made.
+        :type tokens: int
+        """
+        while True:
+            wait_seconds = self._try_acquire(tokens)
+            if not wait_seconds:
+                return
+            await asyncio.sleep(wait_seconds)
+
+    def _try_acquire(self, tokens):
+        """Consume ``tokens`` if available, otherwise return how long to wait.
+
+        :return: ``0`` when the tokens were consumed, else seconds to wait.
+        :rtype: float
+        """
+        tokens = min(float(tokens), self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+
+_token_buckets = {}
+_token_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(quota_key, rate=DEFAULT_REQUESTS_PER_SECOND, capacity=DEFAULT_BURST):
+    """Return the process-wide token bucket for a quota key.
+
+    :param quota_key: Usually the Google Cloud project id of the credentials.
+    :type quota_key: str
+    :param rate: Sustained requests per second.
+    :type rate: float
+    :param capacity: Burst size.
+    :type capacity: int
+    :return: Token bucket shared by every manager using the same project.
+    :rtype: TokenBucket
+    """
+    with _token_buckets_lock:
+        bucket = _token_buckets.get(quota_key)
+        if bucket is None:
+            bucket = TokenBucket(rate=rate, capacity=capacity)
+            _token_buckets[quota_key] = bucket
+        return bucket
+
+
+def build_rate_limiter(config, credentials):
+    """Return the token bucket for a manager's config and credentials.
+
+    ``api_settings.requests_per_second`` and ``api_settings.burst`` in
+    ``config.json`` override the defaults.
+
+    :param config: Parsed ``config.json``.
+    :type config: dict
+    :param credentials: Google credentials of the manager.
+    :return: Token bucket.
+    :rtype: TokenBucket
+    """
+    api_settings = config.get("api_settings", {})
+    quota_key = getattr(credentials, "project_id", None) or getattr(credentials, "service_account_email", None)
+    return get_token_bucket(
+        quota_key or "default",
+        rate=api_settings.get("requests_per_second", DEFAULT_REQUESTS_PER_SECOND),
+        capacity=api_settings.get("burst", DEFAULT_BURST),
+    )
+
+
+def is_rate_limit_error(exception):
+    """Return whether ``exception`` is a 429 or a 403 rate-limit error.
+
+    :param exception: Raised exception.
+    :return: ``True`` for rate-limit errors.
+    :rtype: bool
+    """
+    if not isinstance(exception, HttpError):
+        return False
+
+    if exception.resp.status == 429:
+        return True
+
+    if exception.resp.status == 403:
+        content = exception.content.decode("utf-8", errors="ignore").lower() if exception.content else ""
+        return any(reason in content for reason in RATE_LIMIT_REASONS)
+
+    return False
+
+
+def is_retryable_error(exception):
+    """Return whether a failed request should be retried.
+
+    :param exception: Raised exception.
+    :return: ``True`` for rate limits, retryable status codes and network errors.
+    :rtype: bool
+    """
+    if isinstance(exception, HttpError):
+        return exception.resp.status in RETRYABLE_STATUS_CODES or is_rate_limit_error(exception)
+
+    return isinstance(exception, (ConnectionError, TimeoutError, socket.timeout))
+
+
+def is_duplicate_error(exception):
+    """Return whether ``exception`` is a 409 for an id that already exists.
+
+    :param exception: Raised exception, or ``None``.
+    :return: ``True`` when a retried insert had already been committed.
+    :rtype: bool
+    """
+    return isinstance(exception, HttpError) and exception.resp.status == 409
+
+
+def _retry_after_seconds(exception):
+    """Return the ``Retry-After`` delay of an HTTP error, if any."""
+    resp = getattr(exception, "resp", None)
+    retry_after = resp.get("retry-after") if resp is not None else None
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempt, exception=None):
+    """Return how long to wait before retry ``attempt``.
+
+    :param attempt: Zero-based retry attempt.
+    :type attempt: int
+    :param exception: Error that triggered the retry.
+    :return: Delay in seconds.
+    :rtype: float
+    """
+    retry_after = _retry_after_seconds(exception) if exception is not None else None
+    if retry_after is not None:
+        return retry_after
+
+    backoff = min(BACKOFF_BASE_SECONDS * 2**attempt, BACKOFF_MAX_SECONDS)
+    return random.uniform(0, backoff) + backoff / 2
+
+
+def execute_request(request, rate_limiter=None, max_retries=DEFAULT_MAX_RETRIES):
+    """Execute a Google API request with rate limiting and retries.
+
+    :param request: ``googleapiclient.http.HttpRequest``.
+    :param rate_limiter: Token bucket to draw from before each attempt.
+    :type rate_limiter: TokenBucket | None
+    :param max_retries: Maximum number of retries.
+    :type max_retries: int
+    :return: Decoded response.
+    :raises Exception: The last error when it is not retryable or retries run out.
+    """
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            return request.execute()
+        except Exception as exc:
+            if attempt == max_retries or not is_retryable_error(exc):
+                raise
+
+            delay = retry_delay(attempt, exc)
+            print(f"Google APIの一時的なエラーのため{delay:.1f}秒後に再試行します: {exc}")
+            time.sleep(delay)
+
+
+async def execute_request_async(send, rate_limiter=None, max_retries=DEFAULT_MAX_RETRIES):
+    """Asyncio counterpart of :func:`execute_request`.
+
+    :param send: Coroutine function performing one attempt of the request.
+    :param rate_limiter: Token bucket to draw from before each attempt.
+    :type rate_limiter: TokenBucket | None
+    :param max_retries: Maximum number of retries.
+    :type max_retries: int
+    :return: Result of ``send``.
+    :raises Exception: The last error when it is not retryable or retries run out.
+    """
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+
+        try:
+            return await send()
+        except Exception as exc:
+            if attempt == max_retries or not is_retryable_error(exc):
+                raise
+
+            delay = retry_delay(attempt, exc)
+            print(f"Google APIの一時的なエラーのため{delay:.1f}秒後に再試行します: {exc}")
+            await asyncio.sleep(delay)
+
+
+def execute_batch(service, keyed_requests, rate_limiter=None, max_retries=DEFAULT_MAX_RETRIES):
+    """Execute requests in one batch, retrying only the retryable items.
+
+    :param service: Google API service resource.
+    :param keyed_requests: ``(key, HttpRequest)`` pairs for one batch.
+    :type keyed_requests: list[tuple]
+    :param rate_limiter: Token bucket to draw from before each attempt.
+    :type rate_limiter: TokenBucket | None
+    :param max_retries: Maximum number of retries.
+    :type max_retries: int
+    :return: Key to ``(response, exception)`` mapping.
+    :rtype: dict
+    """
+    results = {}
+    pending = list(keyed_requests)
+
+    for attempt in range(max_retries + 1):
+        retry_items = []
+        retry_errors = []
+
+        def handle_response(request_id, response, exception, pending=pending, attempt=attempt):
+            key, request = pending[int(request_id)]
+            if exception is not None and attempt < max_retries and is_retryable_error(exception):
+                retry_items.append((key, request))
+                retry_errors.append(exception)
+            else:
+                results[key] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=handle_response)
+        for index, (_key, request) in enumerate(pending):
+            batch.add(request, request_id=str(index))
+
+        if rate_limiter is not None:
+            rate_limiter.acquire(len(pending))
+
+        try:
+            batch.execute()
+        except Exception as exc:
+            if attempt == max_retries or not is_retryable_error(exc):
+                for key, _request in pending:
+                    results.setdefault(key, (None, exc))
+                return results
+            retry_errors.append(exc)
+            retry_items[:] = [(key, request) for key, request in pending if key not in results]
+
+        if not retry_items:
+            return results
+
+        delay = retry_delay(attempt, retry_errors[-1])
+        print(f"バッチ内の{len(retry_items)}件を{delay:.1f}秒後に再試行します")
+        time.sleep(delay)
+        pending = retry_items
+
+    return results
@@ -0,0 +1,175 @@
+"""Process-wide keep-alive HTTP transport for the Google API clients.
+
+Managers are shared across requests and threads by
+:class:`core.manager_pool.ManagerPool`, but ``httplib2.Http`` is not
+thread-safe, so no manager owns a connection: every manager sends through
+one :class:`PooledHttp`, a thread-safe pool of ``httplib2.Http`` objects
+whose sockets stay open between requests. Each API request borrows an idle
+``Http`` and hands it back, so a warm connection to googleapis.com is
+reused instead of doing a new TLS handshake.
+"""
+
+import threading
+from collections import Counter
+from urllib.parse import urlsplit
+
+
+DEFAULT_MAX_CONNECTIONS = 10
+# Same as httplib2.DEFAULT_MAX_REDIRECTS; httplib2 is imported with the first Http.
+DEFAULT_MAX_REDIRECTS = 5
+
+
+class PooledHttp:
+    """Thread-safe pool of keep-alive ``httplib2.Http`` objects.
+
+    Implements the ``request()`` interface of ``httplib2.Http`` so it can be
+    wrapped by ``google_auth_httplib2.AuthorizedHttp``. At most
+    ``max_connections`` requests are in flight; further callers wait for a
+    connection to be returned.
+    """
+
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, http_factory=None):
+        self.max_connections = max(1, int(max_connections))
+        self._http_factory = http_factory
+        # Most recently returned first: its sockets are the least likely to have timed out.
+        self._idle = []
+        self._created = 0
+        self._in_use = 0
+        self._counts = Counter()
+        self._condition = threading.Condition()
+
+    def _new_http(self):
+        if self._http_factory is not None:
+            return self._http_factory()
+        from googleapiclient.http import build_http
+
+        return build_http()
+
+    def _checkout(self):
+        """Borrow an idle ``Http``, creating one while under the limit."""
+        with self._condition:
+            while not self._idle and self._created >= self.max_connections:
+                self._counts["waits"] += 1
+                self._condition.wait()
+            self._in_use += 1
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return self._new_http()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def _checkin(self, http):
+        with self._condition:
+            self._in_use -= 1
+            self._idle.append(http)
+            self._condition.notify()
+
+    @staticmethod
+    def _has_open_connection(http, uri):
+        """Return whether ``http`` already holds an open socket for ``uri``."""
+        parts = urlsplit(uri)
+        connection = getattr(http, "connections", {}).get(f"{parts.scheme}:{parts.netloc}")
+        return connection is not None and getattr(connection, "sock", None) is not None
+
+    def request(
+        self,
+        uri,
+        method="GET",
+        body=None,
+        headers=None,
+        redirections=DEFAULT_MAX_REDIRECTS,
+        connection_type=None,
+        **_kwargs,
+    ):
+        """Send one request over a pooled connection.
+
+        :return: ``(response, content)`` as returned by ``httplib2.Http.request``.
+        :rtype: tuple[httplib2.Response, bytes]
+        """
+        http = self._checkout()
+        try:
+            reused = self._has_open_connection(http, uri)
+            with self._condition:
+                self._counts["hits" if reused else "misses"] += 1
+            return http.request(
+                uri,
+                method=method,
+                body=body,
+                headers=headers,
+                redirections=redirections,
+                connection_type=connection_type,
+            )
+        finally:
+            self._checkin(http)
+
+    def close(self):
+        """Close the sockets of every idle connection."""
+        with self._condition:
+            idle = list(self._idle)
+        for http in idle:
+            http.close()
+
+    def stats(self):
+        """Return pool usage counters.
+
+        ``hits`` are requests sent over an already open keep-alive connection,
+        ``misses`` the ones that had to connect (and do a TLS handshake) first.
+
+        :return: ``{"hits", "misses", "hit_rate", "waits", "created", "idle", "in_use", "max_connections"}``.
+        :rtype: dict
+        """
+        with self._condition:
+            hits = self._counts["hits"]
+            misses = self._counts["misses"]
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "waits": self._counts["waits"],
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "max_connections": self.max_connections,
+            }
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_http_pool(config=None):
+    """Return the process-wide connection pool, creating it on first use.
+
+    ``api_settings.max_connections`` in ``config.json`` sets the pool size;
+    it is read when the pool is created.
+
+    :param config: Parsed ``config.json``.
+    :type config: dict
+    :return: Connection pool shared by every manager.
+    :rtype: PooledHttp
+    """
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            api_settings = (config or {}).get("api_settings", {})
+            _shared_pool = PooledHttp(api_settings.get("max_connections", DEFAULT_MAX_CONNECTIONS))
+        return _shared_pool
+
+
+def get_http_pool_stats():
+    """Return the shared pool's counters, or ``None`` before it is created.
+
+    :return: See :meth:`PooledHttp.stats`.
+    :rtype: dict | None
+    """
+    with _shared_pool_lock:
+        pool = _shared_pool
+    return pool.stats() if pool is not None else None
@@ -0,0 +1,152 @@
+"""Process-wide registry of long-lived Google API managers."""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+class ManagerPool:
+    """Share manager instances across requests and threads.
+
+    Managers are keyed by manager class, credential source (a directory or
+    an in-memory credentials bundle) and impersonation subject. A
+    directory-backed entry is rebuilt when the modification time of its
+    ``config.json`` changes, so steady-state requests reuse the already built
+    Google API service client.
+
+    A manager can also be pinned for a class, e.g. one wired to the fake API
+    of ``benchmarks/fake_google_api.py``; it is then returned for every
+    credential source until unpinned.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._managers = {}
+        self._configs = {}
+        self._pinned = {}
+
+    def _read_subject(self, config_path, config_mtime):
+        """Return the impersonation subject configured in ``config_path``.
+
+        :param config_path: Absolute path of ``config.json``.
+        :type config_path: str
+        :param config_mtime: Modification time used to invalidate the parse.
+        :type config_mtime: float
+        :return: Impersonation email or ``None``.
+        :rtype: str | None
+        """
+        cached = self._configs.get(config_path)
+        if cached and cached[0] == config_mtime:
+            return cached[1]
+
+        with open(config_path, "r", encoding="utf-8") as file_obj:
+            config = json.load(file_obj)
+        subject = config.get("auth_settings", {}).get("impersonation_email") or None
+        self._configs[config_path] = (config_mtime, subject)
+        return subject
+
+    def _discard_stale_entries(self):
+        """Drop managers whose credential directory no longer exists."""
+        for pool_key in list(self._managers):
+            source = pool_key[1]
+            if isinstance(source, str) and not os.path.isdir(source):
+                del self._managers[pool_key]
+
+    def get(self, manager_class, config_file="credentials/config.json", key_dir="credentials"):
+        """Return a shared manager, building it on first use.
+
+        :param manager_class: Manager class to instantiate.
+        :param config_file: Config path relative to the project root or absolute.
+        :type config_file: str
+        :param key_dir: Key directory relative to the project root or absolute.
+        :type key_dir: str
+        :return: Manager instance.
+        """
+        config_path = os.path.join(PROJECT_ROOT, config_file)
+        key_path = os.path.join(PROJECT_ROOT, key_dir)
+        pinned = self._pinned.get(manager_class)
+        if pinned is not None:
+            return pinned
+
+        if not os.path.exists(config_path):
+            raise FileNotFoundError(f"設定ファイルが見つかりません: {config_path}")
+
+        with self._lock:
+            config_mtime = os.path.getmtime(config_path)
+            subject = self._read_subject(config_path, config_mtime)
+            pool_key = (manager_class, key_path, subject)
+
+            entry = self._managers.get(pool_key)
+            if entry and entry[0] == (config_path, config_mtime):
+                return entry[1]
+
+            self._discard_stale_entries()
+            manager = manager_class(config_file=config_file, key_dir=key_dir)
+            self._managers[pool_key] = ((config_path, config_mtime), manager)
+            return manager
+
+    def get_for_bundle(self, manager_class, bundle):
+        """Return a shared manager built from an in-memory credentials bundle.
+
+        :param manager_class: Manager class to instantiate.
+        :param bundle: Bundle returned by :func:`crypto_utils.load_credentials_bundle`
+            with an added ``bundle_id``.
+        :type bundle: dict
+        :return: Manager instance.
+        """
+        pinned = self._pinned.get(manager_class)
+        if pinned is not None:
+            return pinned
+
+        subject = bundle["config"].get("auth_settings", {}).get("impersonation_email") or None
+        pool_key = (manager_class, ("bundle", bundle["bundle_id"]), subject)
+
+        with self._lock:
+            entry = self._managers.get(pool_key)
+            if entry:
+                return entry[1]
+
+            manager = manager_class(config=bundle["config"], key_info=bundle["key_info"])
+            self._managers[pool_key] = (bundle["bundle_id"], manager)
+            return manager
+
+    def pin(self, manager):
+        """Serve ``manager`` for every request of its class.
+
+        :param manager: Prebuilt manager instance.
+        """
+        with self._lock:
+            self._pinned[type(manager)] = manager
+
+    def unpin(self, manager_class):
+        """Stop serving the manager pinned for ``manager_class``.
+
+        :param manager_class: Manager class.
+        """
+        with self._lock:
+            self._pinned.pop(manager_class, None)
+
+    def discard_bundle(self, bundle_id):
+        """Forget managers built from the given credentials bundle.
+
+        :param bundle_id: Identifier of the evicted bundle.
+        :type bundle_id: str
+        """
+        with self._lock:
+            for pool_key in list(self._managers):
+                if pool_key[1] == ("bundle", bundle_id):
+                    del self._managers[pool_key]
+
+    def clear(self):
+        """Forget every pooled and pinned manager."""
+        with self._lock:
+            self._managers.clear()
+            self._configs.clear()
+            self._pinned.clear()
+
+
+manager_pool = ManagerPool()
@@ -1,15 +1,23 @@
 """Services for the /multi sales demo page."""
 
+import asyncio
 import csv
 import os
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
-from core.constants import JST, MULTI_DEMO_SESSION_KEY, MULTI_DEMO_SLOT_MARKER
+from core.constants import JST, MULTI_DEMO_SESSION_KEY, MULTI_DEMO_SLOT_MARKER, MULTI_DEMO_SLOT_PROPERTY
 from core.demo_plan_service import build_demo_plans, normalize_demo_plan_template
+from core.event_cache import get_event_cache
 from core.runtime import resource_path
 
 
+# Events deleted per delete_events_batch() / delete_events() call when
+# flushing; progress is reported and cancellation checked between chunks.
+FLUSH_CHUNK_SIZE = 500
+# Rows per chunk when the /multi page is streamed.
+ROW_CHUNK_SIZE = 200
+
+
 def load_demo_plans_from_csv():
     """CSVファイルからデモ予定データを読み込む。
     
@@ -39,7 +47,7 @@ def build_multi_demo_plans(base_date=None):
     :param base_date: Base date used for the generated schedule.
     :type base_date: datetime.date | None
     :return: Planned demo schedule rows.
-    :rtype: list[dict]
+    :rtype: list[DemoPlan]
     """
     plan_templates = load_demo_plans_from_csv()
     return build_demo_plans(plan_templates, base_date=base_date)
@@ -48,37 +56,48 @@ def build_multi_demo_plans(base_date=None):
 def build_multi_demo_description(plan):
     """Build the description text for a demo event.
 
-    :param plan: Demo plan row.
-    :type plan: dict
+    The slot key is stored in the event's private extended properties, not
+    in the description.
+
+    :param plan: Demo plan.
+    :type plan: DemoPlan
     :return: Event description.
     :rtype: str
     """
     return "\n".join(
         [
             "営業デモ用の自動生成イベントです。",
-            f"担当: {plan['assignee']}",
-            f"想定内容: {plan['description']}",
-            f"{MULTI_DEMO_SLOT_MARKER}{plan['slot_key']}",
+            f"担当: {plan.assignee}",
+            f"想定内容: {plan.description}",
         ]
     )
 
 
-def extract_multi_demo_slot_key(description):
-    """Extract the demo slot key from an event description.
+def build_multi_demo_private_properties(plan):
+    """Build the private extended properties identifying a demo event.
 
-    :param description: Event description.
-    :type description: str
-    :return: Slot key or ``None``.
-    :rtype: str | None
+    :param plan: Demo plan.
+    :type plan: DemoPlan
+    :return: Private extended properties.
+    :rtype: dict
     """
-    if not description:
-        return None
+    return {MULTI_DEMO_SLOT_PROPERTY: plan.slot_key}
 
-    for line in description.splitlines():
-        if line.startswith(MULTI_DEMO_SLOT_MARKER):
-            return line.replace(MULTI_DEMO_SLOT_MARKER, "", 1).strip()
 
-    return None
+def strip_multi_demo_slot_marker(description):
+    """Remove legacy slot marker lines from an event description.
+
+    :param description: Raw event description.
+    :type description: str | None
+    :return: Description without marker lines.
+    :rtype: str
+    """
+    if not description:
+        return ""
+
+    return "\n".join(
+        line for line in description.splitlines() if not line.startswith(MULTI_DEMO_SLOT_MARKER)
+    ).strip()
 
 
 def get_multi_demo_session_ids(session_obj):
@@ -142,20 +161,95 @@ def format_demo_description_for_display(description):
     :return: Description suitable for the UI.
     :rtype: str
     """
-    if not description:
-        return "-"
+    return strip_multi_demo_slot_marker(description) or "-"
 
-    lines = []
-    for line in description.splitlines():
-        if line.startswith(MULTI_DEMO_SLOT_MARKER):
-            continue
-        lines.append(line)
 
-    return "\n".join(lines).strip() or "-"
+class SyncRow:
+    """A demo plan paired with its Google Calendar event, as shown in the UI.
+
+    Plan attributes (``slot_key``, ``planned_time_label``...) are read
+    through to the plan and the ``actual_*`` labels are formatted on access,
+    so a row only stores two references.
+    """
+
+    __slots__ = ("plan", "event", "_has_changes")
+
+    def __init__(self, plan, event=None):
+        self.plan = plan
+        self.event = event
+        self._has_changes = None
+
+    def __getattr__(self, name):
+        # Only reached for names the row does not define itself.
+        if name == "plan":
+            raise AttributeError(name)
+        return getattr(self.plan, name)
+
+    @property
+    def exists(self):
+        """Whether the event exists in Google Calendar."""
+        return self.event is not None
+
+    @property
+    def event_id(self):
+        """Google Calendar event id or ``None``."""
+        return self.event.get("id") if self.event else None
+
+    @property
+    def actual_summary(self):
+        """Summary of the event, ``-`` if missing."""
+        return self.event.get("summary", "-") if self.event else "-"
+
+    @property
+    def actual_location(self):
+        """Location of the event, ``-`` if missing."""
+        return self.event.get("location", "-") if self.event else "-"
+
+    @property
+    def actual_start(self):
+        """Formatted start of the event."""
+        return format_event_datetime_for_display(self.event.get("start")) if self.event else "-"
+
+    @property
+    def actual_end(self):
+        """Formatted end of the event."""
+        return format_event_datetime_for_display(self.event.get("end")) if self.event else "-"
+
+    @property
+    def actual_description(self):
+        """Event description without internal marker lines."""
+        raw_description = self.event.get("description", "-") if self.event else "-"
+        return format_demo_description_for_display(raw_description)
+
+    @property
+    def has_changes(self):
+        """Whether the event was edited on the Google side since it was created."""
+        if self._has_changes is None:
+            plan = self.plan
+            event = self.event
+            self._has_changes = bool(event) and any(
+                [
+                    event.get("summary", "") != f"{plan.assignee} | {plan.summary}",
+                    event.get("location", "") != plan.location,
+                    self.actual_start != plan.start_at.strftime("%Y-%m-%d %H:%M"),
+                    self.actual_end != plan.end_at.strftime("%Y-%m-%d %H:%M"),
+                    strip_multi_demo_slot_marker(event.get("description", "-"))
+                    != build_multi_demo_description(plan),
+                ]
+            )
+        return self._has_changes
+
+    @property
+    def status_label(self):
+        """Creation state shown in the UI."""
+        return "作成済み" if self.event else "未作成"
 
 
 def list_future_events(calendar_manager, start_time=None):
-    """Fetch all future events using pagination.
+    """Return all future events from the synced event cache.
+
+    The cache for the target calendar is refreshed first, which costs one
+    incremental sync call once the initial full load has happened.
 
     :param calendar_manager: Calendar manager instance.
     :param start_time: Lower bound time.
@@ -166,115 +260,106 @@ def list_future_events(calendar_manager, start_time=None):
     if start_time is None:
         start_time = datetime.now(JST)
 
-    time_min = start_time.astimezone(ZoneInfo("UTC")).isoformat().replace("+00:00", "Z")
-    events = []
-    page_token = None
-
-    while True:
-        params = {
-            "calendarId": calendar_manager.target_calendar_id,
-            "timeMin": time_min,
-            "singleEvents": True,
-            "orderBy": "startTime",
-            "maxResults": 2500,
-        }
-        if page_token:
-            params["pageToken"] = page_token
-
-        result = calendar_manager.service.events().list(**params).execute()
-        events.extend(result.get("items", []))
-        page_token = result.get("nextPageToken")
-        if not page_token:
-            break
-
-    return events
+    event_cache = get_event_cache(calendar_manager.target_calendar_id)
+    event_cache.refresh(calendar_manager)
+    return event_cache.future_events(start_time)
 
 
 def load_multi_demo_event_lookup(calendar_manager, session_obj, plans):
     """Resolve demo plans to actual Google Calendar events.
 
+    Events are resolved through the slot key index of the synced event
+    cache, so the cost is one incremental sync call plus one dictionary
+    lookup per plan.
+
     :param calendar_manager: Calendar manager instance.
     :param session_obj: Flask session object.
     :param plans: Demo plans.
-    :type plans: list[dict]
+    :type plans: list[DemoPlan]
     :return: Slot key to event mapping.
     :rtype: dict
     """
     session_ids = get_multi_demo_session_ids(session_obj)
+    event_cache = get_event_cache(calendar_manager.target_calendar_id)
+    event_cache.refresh(calendar_manager)
+    now = datetime.now(JST)
     event_lookup = {}
 
     for plan in plans:
-        event_id = session_ids.get(plan["slot_key"])
-        if not event_id:
-            continue
-
-        event = calendar_manager.get_event(event_id)
+        event = resolve_demo_event(event_cache, session_ids, plan.slot_key, now)
         if event:
-            event_lookup[plan["slot_key"]] = event
-        else:
-            session_ids.pop(plan["slot_key"], None)
-
-    future_events = list_future_events(calendar_manager)
-    for event in future_events:
-        slot_key = extract_multi_demo_slot_key(event.get("description", ""))
-        if not slot_key or slot_key in event_lookup:
-            continue
-
-        event_lookup[slot_key] = event
-        if event.get("id"):
-            session_ids[slot_key] = event["id"]
+            event_lookup[plan.slot_key] = event
 
     save_multi_demo_session_ids(session_obj, session_ids)
     return event_lookup
 
 
+def resolve_demo_event(event_cache, session_ids, slot_key, now):
+    """Return the calendar event of a demo slot.
+
+    The event id remembered in ``session_ids`` is tried first, then the slot
+    key index. ``session_ids`` is updated in place with the result.
+
+    :param event_cache: Synced event cache of the target calendar.
+    :type event_cache: core.event_cache.CalendarEventCache
+    :param session_ids: Slot key to event id mapping from the session.
+    :type session_ids: dict
+    :param slot_key: Demo slot key.
+    :type slot_key: str
+    :param now: Events ending before this time are ignored.
+    :type now: datetime
+    :return: Event or ``None``.
+    :rtype: dict | None
+    """
+    event_id = session_ids.get(slot_key)
+    event = event_cache.get(event_id) if event_id else None
+    if event is None:
+        session_ids.pop(slot_key, None)
+        event = event_cache.find_slot_event(slot_key, now)
+
+    if event:
+        session_ids[slot_key] = event["id"]
+    return event
+
+
+def iter_multi_demo_row_chunks(calendar_manager, session_obj, chunk_size=ROW_CHUNK_SIZE):
+    """Yield UI rows for the /multi page chunk by chunk.
+
+    Used for streamed responses: the CSV is read and the event cache synced
+    when the first chunk is requested. The session is only read, because a
+    streamed response has already sent its session cookie.
+
+    :param calendar_manager: Calendar manager instance.
+    :param session_obj: Flask session object.
+    :param chunk_size: Rows per chunk.
+    :type chunk_size: int
+    :return: Iterator of UI row lists.
+    :rtype: collections.abc.Iterator[list[SyncRow]]
+    """
+    plans = build_multi_demo_plans()
+    session_ids = get_multi_demo_session_ids(session_obj)
+    event_cache = get_event_cache(calendar_manager.target_calendar_id)
+    event_cache.refresh(calendar_manager)
+    now = datetime.now(JST)
+
+    for chunk_start in range(0, len(plans), chunk_size):
+        yield [
+            SyncRow(plan, resolve_demo_event(event_cache, session_ids, plan.slot_key, now))
+            for plan in plans[chunk_start : chunk_start + chunk_size]
+        ]
+
+
 def build_multi_demo_rows(calendar_manager, session_obj):
     """Build UI rows for the /multi page.
 
     :param calendar_manager: Calendar manager instance.
     :param session_obj: Flask session object.
     :return: UI rows.
-    :rtype: list[dict]
+    :rtype: list[SyncRow]
     """
     plans = build_multi_demo_plans()
     event_lookup = load_multi_demo_event_lookup(calendar_manager, session_obj, plans)
-    rows = []
-
-    for plan in plans:
-        event = event_lookup.get(plan["slot_key"])
-        actual_start = format_event_datetime_for_display(event.get("start")) if event else "-"
-        actual_end = format_event_datetime_for_display(event.get("end")) if event else "-"
-        actual_description = event.get("description", "-") if event else "-"
-        has_changes = False
-
-        if event:
-            has_changes = any(
-                [
-                    event.get("summary", "") != f"{plan['assignee']} | {plan['summary']}",
-                    event.get("location", "") != plan["location"],
-                    actual_start != plan["start_at"].strftime("%Y-%m-%d %H:%M"),
-                    actual_end != plan["end_at"].strftime("%Y-%m-%d %H:%M"),
-                    actual_description != build_multi_demo_description(plan),
-                ]
-            )
-
-        rows.append(
-            {
-                **plan,
-                "event": event,
-                "event_id": event.get("id") if event else None,
-                "exists": bool(event),
-                "status_label": "作成済み" if event else "未作成",
-                "actual_summary": event.get("summary", "-") if event else "-",
-                "actual_location": event.get("location", "-") if event else "-",
-                "actual_start": actual_start,
-                "actual_end": actual_end,
-                "actual_description": format_demo_description_for_display(actual_description),
-                "has_changes": has_changes,
-            }
-        )
-
-    return rows
+    return [SyncRow(plan, event_lookup.get(plan.slot_key)) for plan in plans]
 
 
 def create_multi_demo_events(calendar_manager, session_obj):
@@ -285,45 +370,86 @@ def create_multi_demo_events(calendar_manager, session_obj):
     :return: Created count, skipped count, failed summaries.
     :rtype: tuple[int, int, list[str]]
     """
-    plans = build_multi_demo_plans()
+    return create_missing_demo_events(calendar_manager, session_obj, build_multi_demo_plans())
+
+
+def create_missing_demo_events(calendar_manager, session_obj, plans):
+    """Create calendar events for plans that do not exist yet.
+
+    Missing events are inserted through batched HTTP requests, so the number
+    of round trips is roughly the number of missing plans divided by the
+    batch size. A plan whose slot key repeats an earlier plan's is counted
+    as skipped, so the three results always add up to ``len(plans)``.
+
+    :param calendar_manager: Calendar manager instance.
+    :param session_obj: Flask session object.
+    :param plans: Demo plans.
+    :type plans: list[DemoPlan]
+    :return: Created count, skipped count, failed summaries.
+    :rtype: tuple[int, int, list[str]]
+    """
     event_lookup = load_multi_demo_event_lookup(calendar_manager, session_obj, plans)
     session_ids = get_multi_demo_session_ids(session_obj)
-    created_count = 0
     skipped_count = 0
-    failed_summaries = []
+    pending_plans = {}
 
-    for plan in plans:
-        if event_lookup.get(plan["slot_key"]):
+    for plan in plans:
+        # A repeated slot key maps to the same event as the first plan.
+        if event_lookup.get(plan.slot_key) or plan.slot_key in pending_plans:
             skipped_count += 1
             continue
+        pending_plans[plan.slot_key] = plan
 
-        event = calendar_manager.create_event(
-            summary=f"{plan['assignee']} | {plan['summary']}",
-            description=build_multi_demo_description(plan),
-            location=plan["location"],
-            start_time=plan["start_at"],
-            end_time=plan["end_at"],
+    created_events = calendar_manager.create_events_batch(
+        (
+            slot_key,
+            {
+                "summary": f"{plan.assignee} | {plan.summary}",
+                "description": build_multi_demo_description(plan),
+                "location": plan.location,
+                "start_time": plan.start_at,
+                "end_time": plan.end_at,
+                "private_properties": build_multi_demo_private_properties(plan),
+            },
         )
+        for slot_key, plan in pending_plans.items()
+    )
 
+    created_count = 0
+    failed_summaries = []
+    for slot_key, plan in pending_plans.items():
+        event = created_events.get(slot_key)
         if event and event.get("id"):
-            session_ids[plan["slot_key"]] = event["id"]
+            session_ids[slot_key] = event["id"]
             created_count += 1
         else:
-            failed_summaries.append(plan["summary"])
+            failed_summaries.append(plan.summary)
 
     save_multi_demo_session_ids(session_obj, session_ids)
     return created_count, skipped_count, failed_summaries
 
 
-def flush_future_events(calendar_manager, session_obj):
+def flush_future_events(calendar_manager, session_obj, progress=None, async_manager=None):
     """Delete all future events in the target calendar.
 
+    Deletions are sent as batched HTTP requests on a bounded thread pool
+    with rate-limit backoff (see :meth:`CalendarManager.delete_events_batch`),
+    :data:`FLUSH_CHUNK_SIZE` events at a time.
+
+    With ``async_manager``, or ``api_settings.async_deletes`` set in
+    ``config.json``, each chunk is instead fanned out as concurrent single
+    requests on one event loop (see :meth:`AsyncCalendarManager.delete_events`).
+
     :param calendar_manager: Calendar manager instance.
     :param session_obj: Flask session object.
+    :param progress: Called with the processed and total event counts after
+        each chunk. It may raise to stop before the next chunk.
+    :param async_manager: Async manager built on ``calendar_manager``.
+    :type async_manager: gcal.async_calendar_manager.AsyncCalendarManager | None
     :return: Deleted count and failed count.
     :rtype: tuple[int, int]
     """
-    deleted_count = 0
+    event_ids = []
     failed_count = 0
 
     for event in list_future_events(calendar_manager):
@@ -331,11 +457,39 @@ def flush_future_events(calendar_manager, session_obj):
         if not event_id:
             failed_count += 1
             continue
+        event_ids.append(event_id)
 
-        if calendar_manager.delete_event(event_id):
-            deleted_count += 1
-        else:
-            failed_count += 1
+    deleted_count = 0
+
+    def record(chunk_start, outcomes):
+        nonlocal deleted_count, failed_count
+        chunk_deleted = sum(1 for deleted in outcomes.values() if deleted)
+        deleted_count += chunk_deleted
+        failed_count += len(outcomes) - chunk_deleted
+        if progress:
+            progress(chunk_start + len(outcomes), len(event_ids))
 
-    clear_multi_demo_session_ids(session_obj)
+    try:
+        if async_manager is None and calendar_manager.config.get("api_settings", {}).get("async_deletes"):
+            from gcal.async_calendar_manager import AsyncCalendarManager
+
+            async_manager = AsyncCalendarManager(calendar_manager)
+
+        if async_manager is not None:
+            asyncio.run(_delete_chunks_async(async_manager, event_ids, record))
+        else:
+            for chunk_start in range(0, len(event_ids), FLUSH_CHUNK_SIZE):
+                record(
+                    chunk_start,
+                    calendar_manager.delete_events_batch(event_ids[chunk_start : chunk_start + FLUSH_CHUNK_SIZE]),
+                )
+    finally:
+        clear_multi_demo_session_ids(session_obj)
     return deleted_count, failed_count
+
+
+async def _delete_chunks_async(async_manager, event_ids, record):
+    """Delete ``event_ids`` chunk by chunk, passing each chunk's outcomes to ``record``."""
+    async with async_manager:
+        for chunk_start in range(0, len(event_ids), FLUSH_CHUNK_SIZE):
+            record(chunk_start, await async_manager.delete_events(event_ids[chunk_start : chunk_start + FLUSH_CHUNK_SIZE]))
@@ -0,0 +1,124 @@
+"""Read-through cache of Google Sheets metadata and values."""
+
+import threading
+import time
+from collections import Counter
+
+
+DEFAULT_SPREADSHEET_CACHE_TTL_SECONDS = 60
+
+
+class SpreadsheetCache:
+    """Metadata and values of one spreadsheet kept in memory.
+
+    Entries are served from memory for ``ttl_seconds``. After that the cache
+    is revalidated on the next read: when a revision source is available
+    (the Drive ``modifiedTime`` of the spreadsheet) and the revision has not
+    changed, every entry is kept for another ``ttl_seconds``; otherwise the
+    entries are dropped and reloaded on demand.
+
+    Loads run under the cache lock, so concurrent readers of a missing entry
+    wait for one Sheets call instead of each making their own.
+    """
+
+    def __init__(self, spreadsheet_id):
+        self.spreadsheet_id = spreadsheet_id
+        self._entries = {}
+        self._revision = None
+        self._checked_at = None
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def _revalidate(self, ttl_seconds, get_revision):
+        """Drop the entries if they may be stale. Caller must hold the lock."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < ttl_seconds:
+            return
+
+        revision = None
+        if get_revision is not None:
+            revision = get_revision()
+            self._counts["revision_checks"] += 1
+
+        if revision is None or revision != self._revision:
+            if self._entries:
+                self._counts["invalidations"] += 1
+            self._entries.clear()
+        self._revision = revision
+        self._checked_at = now
+
+    def get(self, key, loader, ttl_seconds=DEFAULT_SPREADSHEET_CACHE_TTL_SECONDS, get_revision=None):
+        """Return a cached entry, calling ``loader`` when it is missing or stale.
+
+        :param key: Entry key, e.g. ``("values", "Sheet1!A:Z")``.
+        :type key: tuple
+        :param loader: Callable fetching the entry from the Sheets API.
+        :param ttl_seconds: Seconds an entry is served without revalidation.
+        :type ttl_seconds: float
+        :param get_revision: Callable returning the current revision of the
+            spreadsheet, or ``None`` to rely on the TTL only.
+        :return: Cached or freshly loaded entry.
+        """
+        with self._lock:
+            self._revalidate(ttl_seconds, get_revision)
+            if key in self._entries:
+                self._counts["hits"] += 1
+                return self._entries[key]
+
+            self._counts["misses"] += 1
+            value = loader()
+            self._entries[key] = value
+            return value
+
+    def invalidate(self):
+        """Drop every entry so the next read goes to the Sheets API."""
+        with self._lock:
+            self._entries.clear()
+            self._revision = None
+            self._checked_at = None
+
+    def stats(self):
+        """Return cache counters.
+
+        :return: ``{"entries", "hits", "misses", "revision_checks", "invalidations"}``.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._counts["hits"],
+                "misses": self._counts["misses"],
+                "revision_checks": self._counts["revision_checks"],
+                "invalidations": self._counts["invalidations"],
+            }
+
+
+_spreadsheet_caches = {}
+_spreadsheet_caches_lock = threading.Lock()
+
+
+def get_spreadsheet_cache(spreadsheet_id):
+    """Return the process-wide cache for ``spreadsheet_id``.
+
+    :param spreadsheet_id: Spreadsheet id.
+    :type spreadsheet_id: str
+    :return: Spreadsheet cache.
+    :rtype: SpreadsheetCache
+    """
+    with _spreadsheet_caches_lock:
+        cache = _spreadsheet_caches.get(spreadsheet_id)
+        if cache is None:
+            cache = SpreadsheetCache(spreadsheet_id)
+            _spreadsheet_caches[spreadsheet_id] = cache
+        return cache
+
+
+def get_spreadsheet_cache_stats():
+    """Return the counters of every spreadsheet cache.
+
+    :return: Stats per spreadsheet id.
+    :rtype: dict
+    """
+    with _spreadsheet_caches_lock:
+        caches = dict(_spreadsheet_caches)
+    return {spreadsheet_id: cache.stats() for spreadsheet_id, cache in caches.items()}
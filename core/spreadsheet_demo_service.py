@@ -1,17 +1,11 @@
 """Services for importing demo schedules from Google Spreadsheet."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 
 from core.constants import JST
-from core.demo_plan_service import REQUIRED_DEMO_PLAN_FIELDS, build_demo_plans, normalize_demo_plan_template
-from core.multi_demo_service import (
-    build_multi_demo_description,
-    format_demo_description_for_display,
-    format_event_datetime_for_display,
-    get_multi_demo_session_ids,
-    load_multi_demo_event_lookup,
-    save_multi_demo_session_ids,
-)
+from core.demo_plan_service import REQUIRED_DEMO_PLAN_FIELDS, DemoPlan, build_demo_plan, normalize_demo_plan_template
+from core.multi_demo_service import SyncRow, create_missing_demo_events, load_multi_demo_event_lookup
 
 
 SPREADSHEET_REQUIRED_FIELDS = (
@@ -25,31 +19,21 @@ SPREADSHEET_REQUIRED_FIELDS = (
     "start_minute",
     "duration_minutes",
 )
+# Rows handed to the calendar per chunk while a sheet is still being parsed.
+SPREADSHEET_CHUNK_SIZE = 500
 
 
-def _build_spreadsheet_demo_row(template, target_date):
-    """Build a dated spreadsheet row from a template and explicit date."""
-    start_at = datetime(
-        target_date.year,
-        target_date.month,
-        target_date.day,
-        template["start_hour"],
-        template["start_minute"],
-        tzinfo=JST,
-    )
-    end_at = start_at + timedelta(minutes=template["duration_minutes"])
-    return {
-        **template,
-        "target_date": target_date,
-        "weekday_label": ["月", "火", "水", "木", "金", "土", "日"][target_date.weekday()],
-        "start_at": start_at,
-        "end_at": end_at,
-        "planned_time_label": f"{start_at.strftime('%Y-%m-%d %H:%M')} - {end_at.strftime('%H:%M')}",
-    }
+class SpreadsheetParseError(ValueError):
+    """Raised when the header or a data row of a sheet cannot be parsed."""
 
 
+@lru_cache(maxsize=4096)
 def _parse_spreadsheet_day(day_value):
-    """Parse the spreadsheet day value into a date."""
+    """Parse the spreadsheet day value into a date.
+
+    A sheet repeats the same few days on many rows, so results are memoized
+    to avoid running ``strptime`` per row.
+    """
     value = str(day_value).strip()
     for fmt in ("%Y/%m/%d", "%Y-%m-%d", "%Y.%m.%d", "%Y%m%d"):
         try:
@@ -60,76 +44,182 @@ def _parse_spreadsheet_day(day_value):
     raise ValueError("day は YYYY/MM/DD または YYYY-MM-DD 形式で入力してください")
 
 
-def _normalize_spreadsheet_demo_plan(row, schema):
-    """Normalize a spreadsheet row into the internal template format."""
+def _normalize_spreadsheet_demo_plan(cells, schema, base_date, source_range=None):
+    """Build a demo plan from the stripped cells of one row.
+
+    :param cells: Required field to stripped cell value.
+    :type cells: dict
+    :param schema: ``"day"`` or ``"day_offset"``.
+    :type schema: str
+    :param base_date: Base date for ``day_offset`` rows.
+    :type base_date: datetime.date
+    :param source_range: A1 range the row was read from.
+    :type source_range: str | None
+    :return: Demo plan.
+    :rtype: DemoPlan
+    """
     if schema == "day_offset":
-        return normalize_demo_plan_template(row)
+        return build_demo_plan(normalize_demo_plan_template(cells), base_date, source_range=source_range)
 
-    missing_fields = [field for field in SPREADSHEET_REQUIRED_FIELDS if str(row.get(field, "")).strip() == ""]
+    missing_fields = [field for field in SPREADSHEET_REQUIRED_FIELDS if cells[field] == ""]
     if missing_fields:
         raise ValueError(f"必須項目が不足しています: {', '.join(missing_fields)}")
 
-    return {
-        "slot_key": str(row["slot_key"]).strip(),
-        "day": str(row["day"]).strip(),
-        "target_date": _parse_spreadsheet_day(row["day"]),
-        "assignee": str(row["assignee"]).strip(),
-        "summary": str(row["summary"]).strip(),
-        "location": str(row["location"]).strip(),
-        "description": str(row["description"]).strip(),
-        "start_hour": int(str(row["start_hour"]).strip()),
-        "start_minute": int(str(row["start_minute"]).strip()),
-        "duration_minutes": int(str(row["duration_minutes"]).strip()),
-    }
+    return DemoPlan(
+        cells["slot_key"],
+        cells["assignee"],
+        cells["summary"],
+        cells["location"],
+        cells["description"],
+        int(cells["start_hour"]),
+        int(cells["start_minute"]),
+        int(cells["duration_minutes"]),
+        _parse_spreadsheet_day(cells["day"]),
+        day=cells["day"],
+        source_range=source_range,
+    )
 
 
-def _find_header_row(values):
-    """Find the first row that contains all required headers."""
-    for row_index, row in enumerate(values):
-        normalized_row = [str(cell).strip() for cell in row]
-        if all(field in normalized_row for field in SPREADSHEET_REQUIRED_FIELDS):
-            return row_index, normalized_row, "day"
-        if all(field in normalized_row for field in REQUIRED_DEMO_PLAN_FIELDS):
-            return row_index, normalized_row, "day_offset"
+def _match_header_row(row):
+    """Return the headers and schema if ``row`` is a header row."""
+    normalized_row = [str(cell).strip() for cell in row]
+    if all(field in normalized_row for field in SPREADSHEET_REQUIRED_FIELDS):
+        return normalized_row, "day"
+    if all(field in normalized_row for field in REQUIRED_DEMO_PLAN_FIELDS):
+        return normalized_row, "day_offset"
+    return None
 
-    required = ", ".join(SPREADSHEET_REQUIRED_FIELDS)
-    raise ValueError(f"必要ヘッダー行が見つかりません。Spreadsheet では {required} を使用してください")
 
+def iter_demo_plans(values, source_range=None, base_date=None):
+    """Lazily parse the rows of one range into demo plans.
 
-def load_demo_plans_from_spreadsheet(spreadsheet_manager):
-    """Load demo plan templates from the configured spreadsheet.
+    The header row is located first and the column index of every required
+    field is resolved once; each data row then only reads and strips the
+    cells of those columns.
 
-    :param spreadsheet_manager: Spreadsheet manager instance.
-    :return: Demo plan templates.
-    :rtype: list[dict]
+    :param values: Rows of cell values. Any iterable of rows is accepted.
+    :param source_range: A1 range the values were read from. Stored on each
+        plan as ``source_range``.
+    :type source_range: str | None
+    :param base_date: Base date for ``day_offset`` rows.
+    :type base_date: datetime.date | None
+    :return: Demo plans.
+    :rtype: Iterator[DemoPlan]
     """
-    values = spreadsheet_manager.get_values()
-    if not values:
-        return []
+    if base_date is None:
+        base_date = datetime.now(JST).date()
+
+    rows = iter(values)
+    header_row_number = 0
+    for header_row_number, row in enumerate(rows, start=1):
+        header = _match_header_row(row)
+        if header:
+            headers, schema = header
+            break
+    else:
+        if header_row_number == 0:
+            return
+        required = ", ".join(SPREADSHEET_REQUIRED_FIELDS)
+        raise SpreadsheetParseError(f"必要ヘッダー行が見つかりません。Spreadsheet では {required} を使用してください")
 
-    header_row_index, headers, schema = _find_header_row(values)
-    plans = []
     required_fields = SPREADSHEET_REQUIRED_FIELDS if schema == "day" else REQUIRED_DEMO_PLAN_FIELDS
+    columns = [(field, headers.index(field)) for field in required_fields]
 
-    for row_index, row in enumerate(values[header_row_index + 1 :], start=header_row_index + 2):
-        padded_row = list(row) + [""] * (len(headers) - len(row))
-        record = {
-            header: str(padded_row[column_index]).strip()
-            for column_index, header in enumerate(headers)
-            if header
+    for row_number, row in enumerate(rows, start=header_row_number + 1):
+        row_length = len(row)
+        cells = {
+            field: str(row[column_index]).strip() if column_index < row_length else ""
+            for field, column_index in columns
         }
-
-        if not any(str(record.get(field, "")).strip() for field in required_fields):
+        if not any(cells.values()):
             continue
 
         try:
-            plans.append(_normalize_spreadsheet_demo_plan(record, schema))
+            plan = _normalize_spreadsheet_demo_plan(cells, schema, base_date, source_range)
         except Exception as exc:
-            raise ValueError(f"{row_index}行目のデータが不正です: {exc}") from exc
+            location = f"{source_range} の{row_number}行目" if source_range else f"{row_number}行目"
+            raise SpreadsheetParseError(f"{location}のデータが不正です: {exc}") from exc
+        yield plan
 
+
+def parse_demo_plans(values, source_range=None, base_date=None):
+    """Parse the cell values of one range into demo plans.
+
+    :param values: Cell values of the range.
+    :type values: list[list]
+    :param source_range: A1 range the values were read from.
+    :type source_range: str | None
+    :param base_date: Base date for ``day_offset`` rows.
+    :type base_date: datetime.date | None
+    :return: Demo plans.
+    :rtype: list[DemoPlan]
+    """
+    return list(iter_demo_plans(values, source_range, base_date=base_date))
+
+
+def load_demo_plans_from_spreadsheet(spreadsheet_manager, base_date=None):
+    """Load demo plans from every configured range.
+
+    All ranges (e.g. one tab per sales team) are read with a single
+    ``values.batchGet`` call. Each plan is tagged with its ``source_range``.
+
+    :param spreadsheet_manager: Spreadsheet manager instance.
+    :param base_date: Base date for ``day_offset`` rows.
+    :type base_date: datetime.date | None
+    :return: Demo plans in range order.
+    :rtype: list[DemoPlan]
+    """
+    plans = []
+    for source_range, values in spreadsheet_manager.batch_get_values().items():
+        plans.extend(iter_demo_plans(values, source_range, base_date=base_date))
     return plans
 
 
+def iter_spreadsheet_demo_row_chunks(spreadsheet_manager, base_date=None, chunk_size=SPREADSHEET_CHUNK_SIZE):
+    """Yield dated demo rows from Google Spreadsheet in chunks of ``chunk_size``.
+
+    Rows are parsed lazily, so a consumer can work on the first chunk before
+    the rest of the sheet has been parsed.
+
+    :param spreadsheet_manager: Spreadsheet manager instance.
+    :param base_date: Base date for ``day_offset`` templates.
+    :type base_date: datetime.date | None
+    :param chunk_size: Maximum number of rows per chunk.
+    :type chunk_size: int
+    :return: Lists of demo plans.
+    :rtype: Iterator[list[DemoPlan]]
+    """
+    if base_date is None:
+        base_date = datetime.now(JST).date()
+
+    chunk = []
+    for source_range, values in spreadsheet_manager.batch_get_values().items():
+        for plan in iter_demo_plans(values, source_range, base_date=base_date):
+            chunk.append(plan)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_spreadsheet_demo_rows(spreadsheet_manager, base_date=None):
+    """Parse every configured range without keeping the plans.
+
+    :param spreadsheet_manager: Spreadsheet manager instance.
+    :param base_date: Base date for ``day_offset`` rows.
+    :type base_date: datetime.date | None
+    :return: Number of valid plans.
+    :rtype: int
+    :raises SpreadsheetParseError: If the header or a row of a range is invalid.
+    """
+    plan_count = 0
+    for source_range, values in spreadsheet_manager.batch_get_values().items():
+        for _plan in iter_demo_plans(values, source_range, base_date=base_date):
+            plan_count += 1
+    return plan_count
+
+
 def build_spreadsheet_demo_rows(spreadsheet_manager, base_date=None):
     """Return dated demo rows loaded from Google Spreadsheet.
 
@@ -137,55 +227,57 @@ def build_spreadsheet_demo_rows(spreadsheet_manager, base_date=None):
     :param base_date: Base date used for the generated schedule.
     :type base_date: datetime.date | None
     :return: Planned demo schedule rows.
-    :rtype: list[dict]
+    :rtype: list[DemoPlan]
     """
-    plan_templates = load_demo_plans_from_spreadsheet(spreadsheet_manager)
-    if not plan_templates:
-        return []
-
-    if "day" not in plan_templates[0]:
-        return build_demo_plans(plan_templates, base_date=base_date)
-
-    return [_build_spreadsheet_demo_row(template, template["target_date"]) for template in plan_templates]
+    rows = []
+    for chunk in iter_spreadsheet_demo_row_chunks(spreadsheet_manager, base_date=base_date):
+        rows.extend(chunk)
+    return rows
 
 
-def create_spreadsheet_demo_events(calendar_manager, session_obj, spreadsheet_manager):
+def create_spreadsheet_demo_events(calendar_manager, session_obj, spreadsheet_manager, progress=None):
     """Create missing calendar events from the spreadsheet schedule.
 
+    Events are created chunk by chunk while the sheet is being parsed. A
+    validation pass over the cached cell values runs first, so an invalid
+    row anywhere in the sheet stops the import before anything is created.
+
     :param calendar_manager: Calendar manager instance.
     :param session_obj: Flask session object.
     :param spreadsheet_manager: Spreadsheet manager instance.
+    :param progress: Called with the number of processed plans after each
+        chunk. It may raise to stop before the next chunk.
     :return: Created count, skipped count, failed summaries.
     :rtype: tuple[int, int, list[str]]
+    :raises SpreadsheetParseError: If a row of the sheet is invalid. Nothing has been created then.
     """
-    plans = build_spreadsheet_demo_rows(spreadsheet_manager)
-    event_lookup = load_multi_demo_event_lookup(calendar_manager, session_obj, plans)
-    session_ids = get_multi_demo_session_ids(session_obj)
+    base_date = datetime.now(JST).date()
+    validate_spreadsheet_demo_rows(spreadsheet_manager, base_date=base_date)
+
     created_count = 0
     skipped_count = 0
     failed_summaries = []
+    for chunk in iter_spreadsheet_demo_row_chunks(spreadsheet_manager, base_date=base_date):
+        chunk_created, chunk_skipped, chunk_failed = create_missing_demo_events(calendar_manager, session_obj, chunk)
+        created_count += chunk_created
+        skipped_count += chunk_skipped
+        failed_summaries.extend(chunk_failed)
+        if progress:
+            progress(created_count + skipped_count + len(failed_summaries))
+    return created_count, skipped_count, failed_summaries
 
-    for plan in plans:
-        if event_lookup.get(plan["slot_key"]):
-            skipped_count += 1
-            continue
 
-        event = calendar_manager.create_event(
-            summary=f"{plan['assignee']} | {plan['summary']}",
-            description=build_multi_demo_description(plan),
-            location=plan["location"],
-            start_time=plan["start_at"],
-            end_time=plan["end_at"],
-        )
-
-        if event and event.get("id"):
-            session_ids[plan["slot_key"]] = event["id"]
-            created_count += 1
-        else:
-            failed_summaries.append(plan["summary"])
-
-    save_multi_demo_session_ids(session_obj, session_ids)
-    return created_count, skipped_count, failed_summaries
+class SpreadsheetSyncRow(SyncRow):
+    """Spreadsheet row paired with its event; the status also flags Google-side edits."""
+
+    __slots__ = ()
+
+    @property
+    def status_label(self):
+        """Sync state shown in the UI."""
+        if self.has_changes:
+            return "Google側で編集あり"
+        return "同期済み" if self.event else "未作成"
 
 
 def build_spreadsheet_sync_rows(calendar_manager, session_obj, spreadsheet_manager):
@@ -195,44 +287,8 @@ def build_spreadsheet_sync_rows(calendar_manager, session_obj, spreadsheet_manag
     :param session_obj: Session-like object.
     :param spreadsheet_manager: Spreadsheet manager instance.
     :return: UI rows.
-    :rtype: list[dict]
+    :rtype: list[SpreadsheetSyncRow]
     """
     plans = build_spreadsheet_demo_rows(spreadsheet_manager)
     event_lookup = load_multi_demo_event_lookup(calendar_manager, session_obj, plans)
-    rows = []
-
-    for plan in plans:
-        event = event_lookup.get(plan["slot_key"])
-        actual_start = format_event_datetime_for_display(event.get("start")) if event else "-"
-        actual_end = format_event_datetime_for_display(event.get("end")) if event else "-"
-        actual_description = event.get("description", "-") if event else "-"
-        has_changes = False
-
-        if event:
-            has_changes = any(
-                [
-                    event.get("summary", "") != f"{plan['assignee']} | {plan['summary']}",
-                    event.get("location", "") != plan["location"],
-                    actual_start != plan["start_at"].strftime("%Y-%m-%d %H:%M"),
-                    actual_end != plan["end_at"].strftime("%Y-%m-%d %H:%M"),
-                    actual_description != build_multi_demo_description(plan),
-                ]
-            )
-
-        rows.append(
-            {
-                **plan,
-                "event": event,
-                "event_id": event.get("id") if event else None,
-                "exists": bool(event),
-                "actual_summary": event.get("summary", "-") if event else "-",
-                "actual_location": event.get("location", "-") if event else "-",
-                "actual_start": actual_start,
-                "actual_end": actual_end,
-                "actual_description": format_demo_description_for_display(actual_description),
-                "has_changes": has_changes,
-                "status_label": "Google側で編集あり" if has_changes else ("同期済み" if event else "未作成"),
-            }
-        )
-
-    return rows
+    return [SpreadsheetSyncRow(plan, event_lookup.get(plan.slot_key)) for plan in plans]
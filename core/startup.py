@@ -0,0 +1,49 @@
+"""Cold-start timing of the app.
+
+Import this module before anything else so elapsed times are measured from
+the start of the app's own imports.
+"""
+
+import sys
+import threading
+import time
+
+
+# Modules that should only be imported once a Google API call is made.
+DEFERRED_MODULES = ("googleapiclient", "google.oauth2", "google_auth_httplib2", "cryptography")
+
+_started_at = time.perf_counter()
+_stages = {}
+_stages_lock = threading.Lock()
+
+
+def mark_startup(stage):
+    """Record the elapsed time of a startup stage the first time it is reached.
+
+    :param stage: Stage name, e.g. ``imports`` or ``first_request``.
+    :type stage: str
+    :return: Milliseconds since startup timing began.
+    :rtype: float
+    """
+    with _stages_lock:
+        if stage not in _stages:
+            _stages[stage] = (time.perf_counter() - _started_at) * 1000
+        return _stages[stage]
+
+
+def get_startup_report():
+    """Return the startup stages, discovery timings and deferred module state.
+
+    :return: Startup report.
+    :rtype: dict
+    """
+    from core.discovery import get_discovery_timings
+
+    with _stages_lock:
+        stages = dict(_stages)
+
+    return {
+        "stages_ms": stages,
+        "discovery": get_discovery_timings(),
+        "deferred_modules_loaded": {name: name in sys.modules for name in DEFERRED_MODULES},
+    }
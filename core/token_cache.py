@@ -0,0 +1,153 @@
+"""Process-wide OAuth access-token cache shared by the Google API managers.
+
+A fresh ``service_account.Credentials`` object has no token and mints one
+on first use. Managers wrap their credentials in
+:class:`SharedTokenCredentials`, which takes the token from one
+:class:`TokenCache` keyed by service account, scopes and subject, so new
+managers reuse a token minted by an earlier one.
+"""
+
+import datetime
+import threading
+from collections import Counter
+
+from google.auth import credentials as google_credentials
+
+
+# Tokens are renewed this long before they expire. It is longer than
+# google-auth's own refresh threshold, so a renewal asked for by an ageing
+# token always mints a new one instead of handing back the cached token.
+TOKEN_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
+
+def _utcnow():
+    """Return the current UTC time as a naive datetime, like google-auth."""
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class TokenCache:
+    """Thread-safe access-token cache with single-flight refresh.
+
+    Only one thread refreshes the token of a key at a time; the others wait
+    for it and use the token it minted. A token the server rejected is
+    never handed out again, however far it is from expiry.
+    """
+
+    def __init__(self, refresh_margin=TOKEN_REFRESH_MARGIN):
+        self.refresh_margin = refresh_margin
+        self._entries = {}
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(credentials):
+        """Return the cache key of ``credentials``.
+
+        :param credentials: Service account credentials.
+        :return: ``(service account, scopes, subject)``.
+        :rtype: tuple
+        """
+        scopes = getattr(credentials, "scopes", None) or ()
+        return (
+            getattr(credentials, "service_account_email", None),
+            tuple(sorted(scopes)),
+            getattr(credentials, "_subject", None),
+        )
+
+    def _fresh_token(self, entry, now, rejected_token=None):
+        """Return ``(token, expiry)`` if it is not due for renewal. Caller must hold the lock."""
+        if entry["token"] is None or entry["token"] == rejected_token:
+            return None
+        if entry["expiry"] is not None and entry["expiry"] - self.refresh_margin <= now:
+            return None
+        return entry["token"], entry["expiry"]
+
+    def get_token(self, credentials, request, rejected_token=None):
+        """Return a cached access token, refreshing ``credentials`` when needed.
+
+        :param credentials: Service account credentials used to mint a token.
+        :param request: ``google.auth.transport.Request`` used for the refresh.
+        :param rejected_token: Token the caller was refused with (401); a new
+            one is minted if it is still the cached token.
+        :return: ``(token, expiry)``.
+        :rtype: tuple[str, datetime.datetime | None]
+        """
+        with self._lock:
+            entry = self._entries.setdefault(
+                self.cache_key(credentials),
+                {"token": None, "expiry": None, "refresh_lock": threading.Lock()},
+            )
+            cached = self._fresh_token(entry, _utcnow(), rejected_token)
+            if cached:
+                self._counts["hits"] += 1
+                return cached
+
+        with entry["refresh_lock"]:
+            # Another thread may have refreshed the token while we waited.
+            with self._lock:
+                cached = self._fresh_token(entry, _utcnow(), rejected_token)
+                if cached:
+                    self._counts["shared_refreshes"] += 1
+                    return cached
+
+            credentials.refresh(request)
+
+            with self._lock:
+                entry["token"] = credentials.token
+                entry["expiry"] = credentials.expiry
+                self._counts["refreshes"] += 1
+                return credentials.token, credentials.expiry
+
+    def clear(self):
+        """Drop every cached token."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return cache counters.
+
+        :return: ``{"keys", "hits", "refreshes", "shared_refreshes"}``.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "keys": len(self._entries),
+                "hits": self._counts["hits"],
+                "refreshes": self._counts["refreshes"],
+                "shared_refreshes": self._counts["shared_refreshes"],
+            }
+
+
+token_cache = TokenCache()
+
+
+class SharedTokenCredentials(google_credentials.Credentials):
+    """Credentials that take their access token from a :class:`TokenCache`."""
+
+    def __init__(self, credentials, cache=None):
+        super().__init__()
+        self._credentials = credentials
+        self._token_cache = cache or token_cache
+        self._quota_project_id = getattr(credentials, "quota_project_id", None)
+
+    @property
+    def service_account_email(self):
+        """Email of the wrapped service account."""
+        return getattr(self._credentials, "service_account_email", None)
+
+    @property
+    def project_id(self):
+        """Project id of the wrapped service account."""
+        return getattr(self._credentials, "project_id", None)
+
+    def refresh(self, request):
+        """Take the token from the shared cache, minting one if it is due.
+
+        Transports call this after a 401 as well, so the token held now is
+        treated as rejected and is not taken from the cache again.
+
+        :param request: ``google.auth.transport.Request`` used for the refresh.
+        """
+        self.token, self.expiry = self._token_cache.get_token(
+            self._credentials, request, rejected_token=self.token
+        )
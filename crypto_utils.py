@@ -1,11 +1,20 @@
 import base64
+import json
 import os
+import struct
+import tempfile
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 
+# 認証情報バンドルの形式: MAGIC(8) + バージョン(1) + ソルト(16) + Fernetトークン
+# トークンの中身: インデックス長(4) + インデックスJSON + 各ファイルの連結データ
+BUNDLE_FILE_NAME = "credentials.bundle"
+BUNDLE_MAGIC = b"GCALCRED"
+BUNDLE_VERSION = 1
+
 # パスワードからキーを生成する関数
 def generate_key_from_password(password, salt=None):
     if salt is None:
@@ -76,6 +85,114 @@ def decrypt_file(encrypted_file_path, password, output_path=None):
         return decrypted_data
 
 
+# 複数ファイルを1つのソルト・1回の鍵導出で暗号化バンドルにまとめる関数
+def encrypt_bundle(files, password, output_path):
+    index = []
+    blobs = []
+    offset = 0
+    for name in sorted(files):
+        data = files[name]
+        index.append({"name": name, "offset": offset, "size": len(data)})
+        blobs.append(data)
+        offset += len(data)
+
+    index_data = json.dumps({"entries": index}).encode("utf-8")
+    payload = struct.pack(">I", len(index_data)) + index_data + b"".join(blobs)
+
+    key, salt = generate_key_from_password(password)
+    encrypted_data = Fernet(key).encrypt(payload)
+
+    # 一時ファイルに書いてから置き換え、途中で失敗しても既存バンドルを壊さない
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".bundle_", dir=output_dir)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(BUNDLE_MAGIC)
+            file.write(bytes([BUNDLE_VERSION]))
+            file.write(salt)
+            file.write(encrypted_data)
+        os.replace(temp_path, output_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return output_path
+
+
+# 暗号化バンドルを復号化してファイル名とデータの辞書を返す関数
+def decrypt_bundle(bundle_path, password):
+    with open(bundle_path, "rb") as file:
+        file_data = file.read()
+
+    header_size = len(BUNDLE_MAGIC) + 1
+    if file_data[: len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+        raise ValueError("認証情報バンドルの形式が不正です")
+    version = file_data[len(BUNDLE_MAGIC)]
+    if version != BUNDLE_VERSION:
+        raise ValueError(f"未対応の認証情報バンドルのバージョンです: {version}")
+
+    salt = file_data[header_size : header_size + 16]
+    key, _ = generate_key_from_password(password, salt)
+    payload = Fernet(key).decrypt(file_data[header_size + 16 :])
+
+    (index_size,) = struct.unpack(">I", payload[:4])
+    index = json.loads(payload[4 : 4 + index_size])
+    data_start = 4 + index_size
+    return {
+        entry["name"]: payload[data_start + entry["offset"] : data_start + entry["offset"] + entry["size"]]
+        for entry in index["entries"]
+    }
+
+
+# 暗号化ディレクトリ内の全ファイルをディスクに書き出さずに復号化する関数（旧形式）
+def decrypt_directory(encrypted_dir, password):
+    decrypted_files = {}
+    for root, _dirs, files in os.walk(encrypted_dir):
+        for file_name in files:
+            if not file_name.endswith(".encrypted"):
+                continue
+
+            encrypted_file_path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(encrypted_file_path, encrypted_dir)[: -len(".encrypted")]
+            decrypted_files[relative_path.replace(os.sep, "/")] = decrypt_file(encrypted_file_path, password)
+
+    return decrypted_files
+
+
+# 復号化済みファイル群から設定とサービスアカウントキーを取り出す関数
+def parse_credentials_files(decrypted_files):
+    if "config.json" not in decrypted_files:
+        raise FileNotFoundError("config.json が認証情報に含まれていません")
+
+    key_names = sorted(
+        name
+        for name in decrypted_files
+        if "/" not in name and name.endswith(".json") and name not in ["credentials.json", "config.json"]
+    )
+    if not key_names:
+        raise FileNotFoundError("サービスアカウントキーファイルが見つかりません")
+
+    return {
+        "config": json.loads(decrypted_files["config.json"]),
+        "key_info": json.loads(decrypted_files[key_names[0]]),
+        "key_name": key_names[0],
+    }
+
+
+# 暗号化された認証情報を復号化する関数（バンドルがなければ旧形式のファイル群を読む）
+def read_encrypted_credentials(encrypted_dir, password):
+    bundle_path = os.path.join(encrypted_dir, BUNDLE_FILE_NAME)
+    if os.path.exists(bundle_path):
+        return decrypt_bundle(bundle_path, password)
+    return decrypt_directory(encrypted_dir, password)
+
+
+# 暗号化された認証情報をメモリ上で読み込む関数
+def load_credentials_bundle(encrypted_dir, password):
+    return parse_credentials_files(read_encrypted_credentials(encrypted_dir, password))
+
+
 # 文字列データを暗号化する関数
 def encrypt_data(data, password):
     if isinstance(data, str):
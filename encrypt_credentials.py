@@ -3,7 +3,23 @@ import os
 import sys
 from pathlib import Path
 
-from crypto_utils import encrypt_file
+from crypto_utils import BUNDLE_FILE_NAME, encrypt_bundle
+
+
+def remove_legacy_encrypted_files(encrypted_dir):
+    """バンドルに置き換えられた旧形式の .encrypted ファイルを削除する"""
+    for legacy_file in Path(encrypted_dir).glob("**/*.encrypted"):
+        legacy_file.unlink()
+        print(f"旧形式のファイルを削除: {legacy_file}")
+
+
+def write_password_note(encrypted_dir, password):
+    """テスト用のパスワードメモを書き出す"""
+    # パスワードを保存するファイルを作成（本番では使用しないでください！）
+    # これはテスト用で、実際のアプリケーションではユーザーに直接入力させるべきです
+    with open(Path(encrypted_dir) / "password.txt", "w") as f:
+        f.write("このファイルには本番環境では実際のパスワードを保存しないでください！\n")
+        f.write("テスト用パスワード: " + password)
 
 
 def encrypt_credentials_folder(credentials_dir, password=None):
@@ -26,30 +42,25 @@ def encrypt_credentials_folder(credentials_dir, password=None):
     encrypted_dir = credentials_path.parent / "encrypted_credentials"
     os.makedirs(encrypted_dir, exist_ok=True)
 
-    # 各ファイルを暗号化
-    file_count = 0
+    # 全ファイルを1つのバンドルにまとめる（鍵導出は1回だけ）
+    files = {}
     for file_path in credentials_path.glob("**/*"):
         if file_path.is_file():
             # 相対パスを維持する
-            rel_path = file_path.relative_to(credentials_path)
-            encrypted_file_path = encrypted_dir / f"{rel_path}.encrypted"
-
-            # 出力ディレクトリがなければ作成
-            os.makedirs(encrypted_file_path.parent, exist_ok=True)
+            rel_path = file_path.relative_to(credentials_path).as_posix()
+            files[rel_path] = file_path.read_bytes()
+            print(f"追加: {file_path}")
 
-            # ファイルを暗号化
-            encrypt_file(file_path, password, encrypted_file_path)
-            file_count += 1
-            print(f"暗号化: {file_path} → {encrypted_file_path}")
+    bundle_path = encrypted_dir / BUNDLE_FILE_NAME
+    encrypt_bundle(files, password, bundle_path)
+    file_count = len(files)
+    print(f"暗号化: {file_count}ファイル → {bundle_path}")
 
-    # パスワードを保存するファイルを作成（本番では使用しないでください！）
-    # これはテスト用で、実際のアプリケーションではユーザーに直接入力させるべきです
-    with open(encrypted_dir / "password.txt", "w") as f:
-        f.write("このファイルには本番環境では実際のパスワードを保存しないでください！\n")
-        f.write("テスト用パスワード: " + password)
+    remove_legacy_encrypted_files(encrypted_dir)
+    write_password_note(encrypted_dir, password)
 
     print(f"\n暗号化完了: {file_count}ファイルを暗号化しました。")
-    print(f"暗号化されたファイルは {encrypted_dir} に保存されました。")
+    print(f"暗号化されたバンドルは {bundle_path} に保存されました。")
     print(
         "\n注意: PyInstallerでアプリをビルドする際に、このencrypted_credentialsディレクトリを含めてください。"
     )
@@ -2,5 +2,19 @@
 Google Calendar API操作用パッケージ
 """
 
-from . import calendar_crud_demo
-from .calendar_manager import CalendarManager
+import importlib
+
+
+def __getattr__(name):
+    """googleapiclient を読み込むサブモジュールは初回参照時にインポートする"""
+    if name == "CalendarManager":
+        from .calendar_manager import CalendarManager
+
+        return CalendarManager
+    if name == "AsyncCalendarManager":
+        from .async_calendar_manager import AsyncCalendarManager
+
+        return AsyncCalendarManager
+    if name == "calendar_crud_demo":
+        return importlib.import_module(f"{__name__}.calendar_crud_demo")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,330 @@
+"""asyncio 版の Google Calendar マネージャー"""
+
+import asyncio
+
+import google_auth_httplib2
+import httplib2
+import httpx
+from googleapiclient.errors import HttpError
+
+from core.google_api import execute_request_async, is_duplicate_error
+from core.http_transport import get_shared_http_pool
+
+from .calendar_manager import CalendarManager
+
+
+class AsyncCalendarManager:
+    """CalendarManager と同じ操作を asyncio で並列実行するマネージャークラス
+
+    リクエストの組み立て（Discovery文書によるURL・パラメータの検証）と設定・
+    認証情報・レート制御は CalendarManager のものをそのまま使い、送信だけを
+    httpx.AsyncClient の共有コネクションプールで行う。同時に送信するリクエスト
+    数は max_concurrency で制限する。
+    """
+
+    # 同時に送信するリクエスト数の上限
+    MAX_CONCURRENCY = 10
+    # httpx のタイムアウト（秒）
+    REQUEST_TIMEOUT = 30.0
+
+    def __init__(self, calendar_manager=None, max_concurrency=None, client=None, authorize=True, **manager_kwargs):
+        """
+        AsyncCalendarManagerの初期化
+
+        Args:
+            calendar_manager: 設定・認証情報を共有する CalendarManager（省略時は manager_kwargs で作成）
+            max_concurrency: 同時に送信するリクエスト数の上限
+            client: 使用する httpx.AsyncClient（省略時は初回送信時に作成）
+            authorize: False の場合は認証ヘッダーを付けない（ベンチマーク用の偽APIなど）
+            manager_kwargs: CalendarManager に渡す引数（config_file, key_dir など）
+        """
+        self.calendar_manager = calendar_manager or CalendarManager(**manager_kwargs)
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.authorize = authorize
+        self._client = client
+        self._owns_client = client is None
+        # asyncio のプリミティブはイベントループ上で作成する
+        self._semaphore = None
+        self._token_lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """自分で作成した httpx クライアントを閉じる"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def target_calendar_id(self):
+        """ターゲットカレンダーIDを取得"""
+        return self.calendar_manager.target_calendar_id
+
+    @property
+    def timezone(self):
+        """タイムゾーンを取得"""
+        return self.calendar_manager.timezone
+
+    def _get_client(self):
+        """共有コネクションプールを持つ httpx クライアントを取得"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                timeout=self.REQUEST_TIMEOUT,
+            )
+        return self._client
+
+    async def _access_token(self):
+        """有効なアクセストークンを取得（期限切れの場合は1回だけ更新する）"""
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        credentials = self.calendar_manager.credentials
+        async with self._token_lock:
+            if not credentials.valid:
+                request = google_auth_httplib2.Request(get_shared_http_pool(self.calendar_manager.config))
+                await asyncio.to_thread(credentials.refresh, request)
+        return credentials.token
+
+    async def _send(self, request):
+        """googleapiclient の HttpRequest を httpx で1回送信"""
+        headers = dict(request.headers)
+        if self.authorize:
+            headers["authorization"] = f"Bearer {await self._access_token()}"
+
+        try:
+            response = await self._get_client().request(
+                request.method,
+                request.uri,
+                content=request.body,
+                headers=headers,
+            )
+        except httpx.TimeoutException as e:
+            # httpx の例外は再送判定 (is_retryable_error) が扱う組み込み例外に変換する
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        if response.status_code >= 300:
+            resp = httplib2.Response({**response.headers, "status": str(response.status_code)})
+            resp.reason = response.reason_phrase
+            raise HttpError(resp, response.content, uri=request.uri)
+
+        return response.json() if response.content else {}
+
+    async def execute(self, request):
+        """リトライ・レート制御・同時実行数の制限付きでAPIリクエストを実行"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            return await execute_request_async(
+                lambda: self._send(request),
+                rate_limiter=self.calendar_manager.rate_limiter,
+            )
+
+    async def get_events(
+        self,
+        calendar_id=None,
+        max_results=10,
+        time_min=None,
+        time_max=None,
+        search_text=None,
+        order_by="startTime",
+        fields=None,
+    ):
+        """イベントを取得（引数は CalendarManager.get_events と同じ）
+
+        Returns:
+            イベントのリスト
+        """
+        manager = self.calendar_manager
+        params = manager._build_list_params(calendar_id, max_results, time_min, time_max, search_text, order_by, fields)
+
+        try:
+            events_result = await self.execute(manager.service.events().list(**params))
+            return events_result.get("items", [])
+        except Exception as e:
+            print(f"イベント取得エラー: {str(e)}")
+            return []
+
+    async def get_event(self, event_id, calendar_id=None, fields=None):
+        """特定のイベントを取得（引数は CalendarManager.get_event と同じ）
+
+        Returns:
+            イベント情報、取得失敗時はNone
+        """
+        manager = self.calendar_manager
+        params = {"calendarId": calendar_id or manager.target_calendar_id, "eventId": event_id}
+        if fields:
+            params["fields"] = manager.resolve_fields(fields)
+
+        try:
+            return await self.execute(manager.service.events().get(**params))
+        except Exception as e:
+            print(f"イベント取得エラー: {str(e)}")
+            return None
+
+    async def get_events_by_ids(self, event_ids, calendar_id=None, fields=None):
+        """複数のイベントを同時実行数の上限内で並列に取得
+
+        Args:
+            event_ids: イベントIDのリスト
+            calendar_id: カレンダーID（省略時はターゲットカレンダー）
+            fields: 取得するフィールド（プリセット名またはfieldsマスク）
+
+        Returns:
+            イベントIDをキーとしたイベント情報（取得失敗時はNone）の辞書
+        """
+        event_ids = list(dict.fromkeys(event_ids))
+        events = await asyncio.gather(
+            *(self.get_event(event_id, calendar_id=calendar_id, fields=fields) for event_id in event_ids)
+        )
+        return dict(zip(event_ids, events))
+
+    async def create_event(
+        self,
+        summary,
+        start_time=None,
+        end_time=None,
+        description="",
+        location="",
+        calendar_id=None,
+        attendees=None,
+        reminders=None,
+        private_properties=None,
+    ):
+        """イベントを作成（引数は CalendarManager.create_event と同じ）
+
+        Returns:
+            作成されたイベント情報、作成失敗時はNone
+        """
+        manager = self.calendar_manager
+        event = manager._build_event_body(
+            summary,
+            start_time=start_time,
+            end_time=end_time,
+            description=description,
+            location=location,
+            attendees=attendees,
+            reminders=reminders,
+            private_properties=private_properties,
+        )
+
+        try:
+            try:
+                created_event = await self.execute(
+                    manager.service.events().insert(
+                        calendarId=calendar_id or manager.target_calendar_id,
+                        body=event,
+                    )
+                )
+            except HttpError as e:
+                if not is_duplicate_error(e):
+                    raise
+                # 再試行の前の送信で作成済みだった
+                created_event = await self.get_event(event["id"], calendar_id)
+            manager.invalidate_event_pages(calendar_id)
+            return created_event
+        except Exception as e:
+            print(f"イベント作成エラー: {str(e)}")
+            return None
+
+    async def update_event(
+        self,
+        event_id,
+        summary=None,
+        start_time=None,
+        end_time=None,
+        description=None,
+        location=None,
+        calendar_id=None,
+        attendees=None,
+    ):
+        """イベントを更新（引数は CalendarManager.update_event と同じ）
+
+        Returns:
+            更新されたイベント情報、更新失敗時はNone
+        """
+        manager = self.calendar_manager
+        calendar_id = calendar_id or manager.target_calendar_id
+
+        # 現在のイベント情報を取得
+        event = await self.get_event(event_id, calendar_id)
+        if not event:
+            print(f"更新対象のイベントが見つかりません: {event_id}")
+            return None
+
+        manager._apply_event_updates(event, summary, start_time, end_time, description, location, attendees)
+
+        try:
+            updated_event = await self.execute(
+                manager.service.events().update(calendarId=calendar_id, eventId=event_id, body=event)
+            )
+            manager.invalidate_event_pages(calendar_id)
+            return updated_event
+        except Exception as e:
+            print(f"イベント更新エラー: {str(e)}")
+            return None
+
+    async def delete_event(self, event_id, calendar_id=None):
+        """イベントを削除（引数は CalendarManager.delete_event と同じ）
+
+        Returns:
+            削除成功時はTrue、失敗時はFalse
+        """
+        manager = self.calendar_manager
+
+        try:
+            await self.execute(
+                manager.service.events().delete(
+                    calendarId=calendar_id or manager.target_calendar_id,
+                    eventId=event_id,
+                )
+            )
+            manager.invalidate_event_pages(calendar_id)
+            return True
+        except Exception as e:
+            print(f"イベント削除エラー: {str(e)}")
+            return False
+
+    async def delete_events(self, event_ids, calendar_id=None):
+        """複数のイベントを同時実行数の上限内で並列に削除
+
+        CalendarManager.delete_events_batch と同じ結果を返す。一時的なエラーや
+        レート制限で失敗したリクエストは指数バックオフの後に再送する。
+
+        Args:
+            event_ids: 削除するイベントIDのリスト
+            calendar_id: カレンダーID（省略時はターゲットカレンダー）
+
+        Returns:
+            イベントIDから削除成否への辞書
+        """
+        manager = self.calendar_manager
+        calendar_id = calendar_id or manager.target_calendar_id
+
+        async def delete(event_id):
+            try:
+                await self.execute(manager.service.events().delete(calendarId=calendar_id, eventId=event_id))
+                return True
+            except HttpError as e:
+                if e.resp.status == 410:
+                    # 既に削除済み
+                    return True
+                print(f"イベント削除エラー: {event_id}: {str(e)}")
+                return False
+            except Exception as e:
+                print(f"イベント削除エラー: {event_id}: {str(e)}")
+                return False
+
+        event_ids = list(dict.fromkeys(event_ids))
+        outcomes = await asyncio.gather(*(delete(event_id) for event_id in event_ids))
+        manager.invalidate_event_pages(calendar_id)
+        return dict(zip(event_ids, outcomes))
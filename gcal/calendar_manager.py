@@ -2,28 +2,56 @@ import datetime
 import json
 import os
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import google_auth_httplib2
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from core.constants import EVENT_FIELD_PRESETS
+from core.discovery import build_service
+from core.event_pages import DEFAULT_EVENT_PAGE_CACHE_TTL_SECONDS, get_event_page_cache
+from core.google_api import build_rate_limiter, execute_batch, execute_request, is_duplicate_error
+from core.http_transport import get_shared_http_pool
+from core.token_cache import SharedTokenCredentials
 
 
 class CalendarManager:
     """Google Calendarの操作を行うマネージャークラス"""
 
-    def __init__(self, config_file="credentials/config.json", key_dir="credentials"):
+    # バッチリクエスト1回あたりの最大リクエスト数
+    MAX_BATCH_SIZE = 50
+    # 並列に送信するバッチ数の上限
+    MAX_BATCH_WORKERS = 4
+
+    def __init__(
+        self,
+        config_file="credentials/config.json",
+        key_dir="credentials",
+        config=None,
+        key_info=None,
+        http=None,
+    ):
         """
         CalendarManagerの初期化
 
         Args:
             config_file: 設定ファイルのパス
             key_dir: 認証キーファイルの存在するディレクトリ
+            config: 読み込み済みの設定（指定時は config_file を読まない）
+            key_info: 読み込み済みのサービスアカウントキー（指定時は key_dir を探さない）
+            http: 認証済みHTTPの代わりに使うスレッドセーフなHTTPオブジェクト（ベンチマーク用の偽APIなど）
         """
         # パスの調整
         base_dir = self._get_base_dir()
         self.config_file = os.path.join(base_dir, config_file)
         self.key_dir = os.path.join(base_dir, key_dir)
-        self.config = self._load_config()
+        self.key_info = key_info
+        self._http = http
+        self.config = config if config is not None else self._load_config()
         self.service = self._create_service()
 
     def _get_base_dir(self):
@@ -50,18 +78,25 @@ class CalendarManager:
 
     def _create_service(self):
         """Google Calendar APIサービスを作成"""
-        key_file = self._find_key_file()
-        if not key_file:
-            raise FileNotFoundError("サービスアカウントキーファイルが見つかりません")
+        key_file = None
+        if self.key_info is None:
+            key_file = self._find_key_file()
+            if not key_file:
+                raise FileNotFoundError("サービスアカウントキーファイルが見つかりません")
 
         try:
             # スコープの設定
             scopes = ["https://www.googleapis.com/auth/calendar"]
 
-            # サービスアカウントの認証情報を作成
-            credentials = service_account.Credentials.from_service_account_file(
-                key_file, scopes=scopes
-            )
+            # サービスアカウントの認証情報を作成（メモリ上のキーがあればファイルを読まない）
+            if self.key_info is not None:
+                credentials = service_account.Credentials.from_service_account_info(
+                    self.key_info, scopes=scopes
+                )
+            else:
+                credentials = service_account.Credentials.from_service_account_file(
+                    key_file, scopes=scopes
+                )
 
             # なりすましが設定されている場合は適用
             if "impersonation_email" in self.config.get("auth_settings", {}):
@@ -70,13 +105,45 @@ class CalendarManager:
                     credentials = credentials.with_subject(impersonation_email)
                     print(f"サービスアカウントが {impersonation_email} としてAPIにアクセスします")
 
-            # サービスの作成
-            service = build("calendar", "v3", credentials=credentials)
-            print(f"サービスアカウントキーを使用して接続しました: {os.path.basename(key_file)}")
+            # サービスの作成（HTTPは共有コネクションプール、アクセストークンはプロセス共通のキャッシュを使う）
+            self.credentials = SharedTokenCredentials(credentials)
+            self.rate_limiter = build_rate_limiter(self.config, credentials)
+            service = build_service(
+                "calendar",
+                "v3",
+                http=self._authorized_http(),
+            )
+            key_label = os.path.basename(key_file) if key_file else "メモリ上のキー"
+            print(f"サービスアカウントキーを使用して接続しました: {key_label}")
             return service
         except Exception as e:
             raise ConnectionError(f"サービス接続エラー: {str(e)}")
 
+    def _authorized_http(self):
+        """全マネージャーで共有するコネクションプール経由の認証済みHTTPオブジェクトを作成
+
+        プール（core.http_transport.PooledHttp）はスレッドセーフで、googleapis.com
+        への keep-alive 接続をマネージャー・スレッドをまたいで再利用する。
+        http を指定して生成した場合はそのオブジェクトをそのまま使う。
+        """
+        if self._http is not None:
+            return self._http
+
+        return google_auth_httplib2.AuthorizedHttp(
+            self.credentials, http=get_shared_http_pool(self.config)
+        )
+
+    def execute(self, request):
+        """リトライとレート制御付きでAPIリクエストを実行
+
+        Args:
+            request: googleapiclient の HttpRequest
+
+        Returns:
+            レスポンス（再試行しても失敗した場合は例外を送出）
+        """
+        return execute_request(request, rate_limiter=self.rate_limiter)
+
     @property
     def timezone(self):
         """タイムゾーンを取得"""
@@ -92,10 +159,29 @@ class CalendarManager:
         """ターゲットカレンダーIDを取得"""
         return self.config["calendar_settings"].get("target_calendar_id", self.default_calendar_id)
 
+    @property
+    def page_cache_ttl_seconds(self):
+        """イベント一覧のページをメモリから返す秒数を取得"""
+        return self.config["calendar_settings"].get("page_cache_ttl_seconds", DEFAULT_EVENT_PAGE_CACHE_TTL_SECONDS)
+
+    @staticmethod
+    def resolve_fields(fields):
+        """fields の指定を部分レスポンス用のマスク文字列に変換
+
+        Args:
+            fields: プリセット名（list, detail, sync）、fieldsマスク文字列、または None
+
+        Returns:
+            fieldsマスク文字列（None の場合は全フィールドを取得）
+        """
+        if fields is None:
+            return None
+        return EVENT_FIELD_PRESETS.get(fields, fields)
+
     def get_calendar_list(self):
         """利用可能なカレンダーリストを取得"""
         try:
-            calendar_list = self.service.calendarList().list().execute()
+            calendar_list = self.execute(self.service.calendarList().list())
             return calendar_list.get("items", [])
         except Exception as e:
             print(f"カレンダーリスト取得エラー: {str(e)}")
@@ -113,6 +199,7 @@ class CalendarManager:
         time_max=None,
         search_text=None,
         order_by="startTime",
+        fields=None,
     ):
         """イベントを取得
 
@@ -123,43 +210,115 @@ class CalendarManager:
             time_max: この時間以前のイベントを取得（省略時は制限なし）
             search_text: 検索テキスト
             order_by: 並び順（startTime, updated）
+            fields: 取得するフィールド（プリセット名またはfieldsマスク、省略時は全フィールド）
 
         Returns:
             イベントのリスト
         """
+        params = self._build_list_params(calendar_id, max_results, time_min, time_max, search_text, order_by, fields)
+
+        try:
+            events_result = self.execute(self.service.events().list(**params))
+            return events_result.get("items", [])
+        except Exception as e:
+            print(f"イベント取得エラー: {str(e)}")
+            return []
+
+    def get_events_page(
+        self,
+        time_min,
+        time_max,
+        page_token=None,
+        max_results=50,
+        calendar_id=None,
+        fields="list",
+    ):
+        """期間内のイベントを1ページ分取得
+
+        get_events と異なり、取得に失敗した場合は例外を送出する。
+
+        Args:
+            time_min: この時間以降のイベントを取得
+            time_max: この時間以前のイベントを取得
+            page_token: 前のページの nextPageToken（省略時は最初のページ）
+            max_results: 1ページあたりの最大イベント数
+            calendar_id: カレンダーID（省略時はターゲットカレンダー）
+            fields: 取得するフィールド（プリセット名またはfieldsマスク）
+
+        Returns:
+            (イベントのリスト, 次のページの pageToken（最後のページではNone）)
+        """
+        params = self._build_list_params(calendar_id, max_results, time_min, time_max, None, "startTime", fields)
+        if page_token:
+            params["pageToken"] = page_token
+
+        events_result = self.execute(self.service.events().list(**params))
+        return events_result.get("items", []), events_result.get("nextPageToken")
+
+    def get_cached_events_page(self, time_min, time_max, page_token=None, max_results=50, calendar_id=None):
+        """期間内のイベントを1ページ分、ページキャッシュ経由で取得
+
+        同じ期間・ページは page_cache_ttl_seconds の間メモリから返す。
+        このマネージャーからイベントを作成・更新・削除するとキャッシュは破棄される。
+
+        Args:
+            time_min: この時間以降のイベントを取得
+            time_max: この時間以前のイベントを取得
+            page_token: 表示するページの pageToken（省略時は最初のページ）
+            max_results: 1ページあたりの最大イベント数
+            calendar_id: カレンダーID（省略時はターゲットカレンダー）
+
+        Returns:
+            ページ情報の辞書（EventPageCache.get_page を参照）
+        """
+        if calendar_id is None:
+            calendar_id = self.target_calendar_id
+
+        return get_event_page_cache(calendar_id).get_page(
+            (time_min, time_max, max_results),
+            page_token,
+            partial(self.get_events_page, time_min, time_max, page_token, max_results, calendar_id),
+            ttl_seconds=self.page_cache_ttl_seconds,
+        )
+
+    def invalidate_event_pages(self, calendar_id=None):
+        """イベント一覧のページキャッシュを破棄する"""
+        get_event_page_cache(calendar_id or self.target_calendar_id).invalidate()
+
+    def _build_list_params(self, calendar_id, max_results, time_min, time_max, search_text, order_by, fields):
+        """get_events 用の events.list パラメータを作成"""
         if calendar_id is None:
             calendar_id = self.target_calendar_id
 
         if time_min is None:
             time_min = datetime.datetime.utcnow().isoformat() + "Z"  # 'Z'はUTC
 
-        try:
-            params = {
-                "calendarId": calendar_id,
-                "timeMin": time_min,
-                "maxResults": max_results,
-                "singleEvents": True,
-                "orderBy": order_by,
-            }
+        params = {
+            "calendarId": calendar_id,
+            "timeMin": time_min,
+            "maxResults": max_results,
+            "singleEvents": True,
+            "orderBy": order_by,
+        }
 
-            if time_max:
-                params["timeMax"] = time_max
+        if time_max:
+            params["timeMax"] = time_max
 
-            if search_text:
-                params["q"] = search_text
+        if search_text:
+            params["q"] = search_text
 
-            events_result = self.service.events().list(**params).execute()
-            return events_result.get("items", [])
-        except Exception as e:
-            print(f"イベント取得エラー: {str(e)}")
-            return []
+        if fields:
+            params["fields"] = self.resolve_fields(fields)
+
+        return params
 
-    def get_event(self, event_id, calendar_id=None):
+    def get_event(self, event_id, calendar_id=None, fields=None):
         """特定のイベントを取得
 
         Args:
             event_id: イベントID
             calendar_id: カレンダーID（省略時はターゲットカレンダー）
+            fields: 取得するフィールド（プリセット名またはfieldsマスク、省略時は全フィールド）
 
         Returns:
             イベント情報、取得失敗時はNone
@@ -168,7 +327,10 @@ class CalendarManager:
             calendar_id = self.target_calendar_id
 
         try:
-            return self.service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+            params = {"calendarId": calendar_id, "eventId": event_id}
+            if fields:
+                params["fields"] = self.resolve_fields(fields)
+            return self.execute(self.service.events().get(**params))
         except Exception as e:
             print(f"イベント取得エラー: {str(e)}")
             return None
@@ -184,6 +346,7 @@ class CalendarManager:
         attendees=None,
         reminders=None,
         create_meet=False,  # 現在は機能していません
+        private_properties=None,
     ):
         """イベントを作成
 
@@ -197,6 +360,7 @@ class CalendarManager:
             attendees: 参加者のメールアドレスのリスト
             reminders: リマインダー設定（辞書形式）
             create_meet: Google Meetリンク作成（現在は機能していません）
+            private_properties: 非公開の拡張プロパティ（辞書形式）
 
         Returns:
             作成されたイベント情報、作成失敗時はNone
@@ -204,6 +368,53 @@ class CalendarManager:
         if calendar_id is None:
             calendar_id = self.target_calendar_id
 
+        # Google Meetの作成機能はWorkspace有料版のみ対応のため無効化
+        if create_meet:
+            print("Google Meetリンクの作成には有料版が必要です")
+
+        event = self._build_event_body(
+            summary,
+            start_time=start_time,
+            end_time=end_time,
+            description=description,
+            location=location,
+            attendees=attendees,
+            reminders=reminders,
+            private_properties=private_properties,
+        )
+
+        try:
+            kwargs = {"calendarId": calendar_id, "body": event}
+
+            try:
+                created_event = self.execute(self.service.events().insert(**kwargs))
+            except HttpError as e:
+                if not is_duplicate_error(e):
+                    raise
+                # 再試行の前の送信で作成済みだった
+                created_event = self.get_event(event["id"], calendar_id)
+            self.invalidate_event_pages(calendar_id)
+            return created_event
+        except Exception as e:
+            print(f"イベント作成エラー: {str(e)}")
+            # デバッグ情報を追加
+            import traceback
+
+            print(f"エラー詳細: {traceback.format_exc()}")
+            return None
+
+    def _build_event_body(
+        self,
+        summary,
+        start_time=None,
+        end_time=None,
+        description="",
+        location="",
+        attendees=None,
+        reminders=None,
+        private_properties=None,
+    ):
+        """create_event / create_events_batch 用のイベントデータを作成"""
         # 開始・終了時間のデフォルト値設定
         if start_time is None:
             start_time = datetime.datetime.now() + datetime.timedelta(hours=1)
@@ -212,7 +423,10 @@ class CalendarManager:
             end_time = start_time + datetime.timedelta(hours=1)
 
         # イベントデータの作成
+        # IDはクライアントで採番する。送信が成功していたのにエラーとなり再試行した場合も
+        # 409（作成済み）になるだけで、同じイベントが二重に作成されない
         event = {
+            "id": uuid.uuid4().hex,
             "summary": summary,
             "location": location,
             "description": description,
@@ -226,10 +440,6 @@ class CalendarManager:
             },
         }
 
-        # Google Meetの作成機能はWorkspace有料版のみ対応のため無効化
-        if create_meet:
-            print("Google Meetリンクの作成には有料版が必要です")
-
         # 参加者がいる場合は追加
         if attendees:
             event["attendees"] = [{"email": email} for email in attendees]
@@ -238,17 +448,51 @@ class CalendarManager:
         if reminders:
             event["reminders"] = reminders
 
-        try:
-            kwargs = {"calendarId": calendar_id, "body": event}
+        # 拡張プロパティがある場合は追加（privateExtendedProperty で検索可能）
+        if private_properties:
+            event["extendedProperties"] = {"private": private_properties}
 
-            return self.service.events().insert(**kwargs).execute()
-        except Exception as e:
-            print(f"イベント作成エラー: {str(e)}")
-            # デバッグ情報を追加
-            import traceback
+        return event
 
-            print(f"エラー詳細: {traceback.format_exc()}")
-            return None
+    def create_events_batch(self, events, calendar_id=None):
+        """複数のイベントをバッチリクエストでまとめて作成
+
+        MAX_BATCH_SIZE 件ごとに1回のHTTPリクエストへまとめて送信する。
+        一時的なエラーやレート制限で失敗したイベントだけをバックオフ後に再送する。
+
+        Args:
+            events: (キー, create_event と同じキーワード引数の辞書) のリスト
+            calendar_id: カレンダーID（省略時はターゲットカレンダー）
+
+        Returns:
+            キーから作成されたイベント情報への辞書（作成失敗時はNone）
+        """
+        if calendar_id is None:
+            calendar_id = self.target_calendar_id
+
+        events = list(events)
+        results = {}
+
+        for chunk_start in range(0, len(events), self.MAX_BATCH_SIZE):
+            chunk = events[chunk_start : chunk_start + self.MAX_BATCH_SIZE]
+            bodies = [(key, self._build_event_body(**event_kwargs)) for key, event_kwargs in chunk]
+            keyed_requests = [
+                (key, self.service.events().insert(calendarId=calendar_id, body=body)) for key, body in bodies
+            ]
+            event_ids = {key: body["id"] for key, body in bodies}
+
+            for key, (response, exception) in execute_batch(
+                self.service, keyed_requests, rate_limiter=self.rate_limiter
+            ).items():
+                if is_duplicate_error(exception):
+                    # 再試行の前の送信で作成済みだった
+                    response, exception = self.get_event(event_ids[key], calendar_id), None
+                if exception is not None:
+                    print(f"イベント作成エラー: {str(exception)}")
+                results[key] = response if exception is None else None
+
+        self.invalidate_event_pages(calendar_id)
+        return results
 
     def update_event(
         self,
@@ -285,6 +529,20 @@ class CalendarManager:
             print(f"更新対象のイベントが見つかりません: {event_id}")
             return None
 
+        self._apply_event_updates(event, summary, start_time, end_time, description, location, attendees)
+
+        try:
+            updated_event = self.execute(
+                self.service.events().update(calendarId=calendar_id, eventId=event_id, body=event)
+            )
+            self.invalidate_event_pages(calendar_id)
+            return updated_event
+        except Exception as e:
+            print(f"イベント更新エラー: {str(e)}")
+            return None
+
+    def _apply_event_updates(self, event, summary, start_time, end_time, description, location, attendees):
+        """update_event で指定された項目をイベントデータに反映"""
         # 更新するフィールドを設定
         if summary:
             event["summary"] = summary
@@ -310,16 +568,6 @@ class CalendarManager:
         if attendees is not None:
             event["attendees"] = [{"email": email} for email in attendees]
 
-        try:
-            return (
-                self.service.events()
-                .update(calendarId=calendar_id, eventId=event_id, body=event)
-                .execute()
-            )
-        except Exception as e:
-            print(f"イベント更新エラー: {str(e)}")
-            return None
-
     def delete_event(self, event_id, calendar_id=None):
         """イベントを削除
 
@@ -334,12 +582,66 @@ class CalendarManager:
             calendar_id = self.target_calendar_id
 
         try:
-            self.service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+            self.execute(self.service.events().delete(calendarId=calendar_id, eventId=event_id))
+            self.invalidate_event_pages(calendar_id)
             return True
         except Exception as e:
             print(f"イベント削除エラー: {str(e)}")
             return False
 
+    def delete_events_batch(self, event_ids, calendar_id=None, max_workers=None):
+        """複数のイベントをバッチリクエストで並列に削除
+
+        MAX_BATCH_SIZE 件ごとのバッチを最大 max_workers 個まで並列に送信する。
+        一時的なエラーやレート制限で失敗したイベントは指数バックオフの後に再送する。
+
+        Args:
+            event_ids: 削除するイベントIDのリスト
+            calendar_id: カレンダーID（省略時はターゲットカレンダー）
+            max_workers: 並列に送信するバッチ数（省略時は MAX_BATCH_WORKERS）
+
+        Returns:
+            イベントIDから削除成否への辞書
+        """
+        if calendar_id is None:
+            calendar_id = self.target_calendar_id
+
+        event_ids = list(event_ids)
+        chunks = [
+            event_ids[chunk_start : chunk_start + self.MAX_BATCH_SIZE]
+            for chunk_start in range(0, len(event_ids), self.MAX_BATCH_SIZE)
+        ]
+        if not chunks:
+            return {}
+
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=max_workers or self.MAX_BATCH_WORKERS) as executor:
+            for chunk_outcomes in executor.map(lambda chunk: self._delete_chunk(chunk, calendar_id), chunks):
+                outcomes.update(chunk_outcomes)
+        self.invalidate_event_pages(calendar_id)
+        return outcomes
+
+    def _delete_chunk(self, event_ids, calendar_id):
+        """1バッチ分のイベントを削除"""
+        keyed_requests = [
+            (event_id, self.service.events().delete(calendarId=calendar_id, eventId=event_id))
+            for event_id in event_ids
+        ]
+
+        outcomes = {}
+        for event_id, (_response, exception) in execute_batch(
+            self.service, keyed_requests, rate_limiter=self.rate_limiter
+        ).items():
+            if exception is None:
+                outcomes[event_id] = True
+            elif isinstance(exception, HttpError) and exception.resp.status == 410:
+                # 既に削除済み
+                outcomes[event_id] = True
+            else:
+                print(f"イベント削除エラー: {event_id}: {str(exception)}")
+                outcomes[event_id] = False
+        return outcomes
+
     def format_event_time(self, event):
         """イベントの時間を見やすくフォーマット
 
@@ -2,20 +2,46 @@
 
 import json
 import os
+from functools import partial
 from pathlib import Path
 
+import google_auth_httplib2
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+
+from core.discovery import build_service
+from core.google_api import build_rate_limiter, execute_request
+from core.http_transport import get_shared_http_pool
+from core.spreadsheet_cache import DEFAULT_SPREADSHEET_CACHE_TTL_SECONDS, get_spreadsheet_cache
+from core.token_cache import SharedTokenCredentials
 
 
 class SpreadsheetManager:
-    """Google Spreadsheet の読み取りを行うマネージャークラス"""
+    """Google Spreadsheet の読み取りを行うマネージャークラス
+
+    シートのメタデータと値はプロセス共通のキャッシュ（core.spreadsheet_cache）に
+    保持し、spreadsheet_settings.cache_ttl_seconds の間はメモリから返す。
+    spreadsheet_settings.revision_check に "drive" を指定すると、TTL 経過後に
+    Drive の modifiedTime を確認し、変更がなければ再取得せずに使い続ける。
+    """
 
-    def __init__(self, config_file="credentials/config.json", key_dir="credentials"):
+    # revision_check が "drive" の場合に追加するスコープ
+    DRIVE_METADATA_SCOPE = "https://www.googleapis.com/auth/drive.metadata.readonly"
+
+    def __init__(
+        self,
+        config_file="credentials/config.json",
+        key_dir="credentials",
+        config=None,
+        key_info=None,
+        http=None,
+    ):
         base_dir = self._get_base_dir()
         self.config_file = os.path.join(base_dir, config_file)
         self.key_dir = os.path.join(base_dir, key_dir)
-        self.config = self._load_config()
+        self.key_info = key_info
+        self._http = http
+        self.config = config if config is not None else self._load_config()
+        self._drive_service = None
         self.service = self._create_service()
 
     def _get_base_dir(self):
@@ -40,27 +66,62 @@ class SpreadsheetManager:
 
     def _create_service(self):
         """Google Sheets APIサービスを作成"""
-        key_file = self._find_key_file()
-        if not key_file:
-            raise FileNotFoundError("サービスアカウントキーファイルが見つかりません")
+        key_file = None
+        if self.key_info is None:
+            key_file = self._find_key_file()
+            if not key_file:
+                raise FileNotFoundError("サービスアカウントキーファイルが見つかりません")
 
         try:
             scopes = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-            credentials = service_account.Credentials.from_service_account_file(
-                key_file, scopes=scopes
-            )
+            if self.revision_check == "drive":
+                scopes.append(self.DRIVE_METADATA_SCOPE)
+            if self.key_info is not None:
+                credentials = service_account.Credentials.from_service_account_info(
+                    self.key_info, scopes=scopes
+                )
+            else:
+                credentials = service_account.Credentials.from_service_account_file(
+                    key_file, scopes=scopes
+                )
 
             impersonation_email = self.config.get("auth_settings", {}).get("impersonation_email")
             if impersonation_email:
                 credentials = credentials.with_subject(impersonation_email)
                 print(f"サービスアカウントが {impersonation_email} としてSheets APIにアクセスします")
 
-            service = build("sheets", "v4", credentials=credentials)
-            print(f"Google Spreadsheetに接続しました: {os.path.basename(key_file)}")
+            # アクセストークンはプロセス共通のキャッシュから取得する（CalendarManager と共有）
+            self.credentials = SharedTokenCredentials(credentials)
+            self.rate_limiter = build_rate_limiter(self.config, credentials)
+            service = build_service(
+                "sheets",
+                "v4",
+                http=self._authorized_http(),
+            )
+            key_label = os.path.basename(key_file) if key_file else "メモリ上のキー"
+            print(f"Google Spreadsheetに接続しました: {key_label}")
             return service
         except Exception as exc:
             raise ConnectionError(f"Google Spreadsheet接続エラー: {str(exc)}") from exc
 
+    def _authorized_http(self):
+        """全マネージャーで共有するコネクションプール経由の認証済みHTTPオブジェクトを作成
+
+        プール（core.http_transport.PooledHttp）はスレッドセーフで、googleapis.com
+        への keep-alive 接続をマネージャー・スレッドをまたいで再利用する。
+        http を指定して生成した場合はそのオブジェクトをそのまま使う。
+        """
+        if self._http is not None:
+            return self._http
+
+        return google_auth_httplib2.AuthorizedHttp(
+            self.credentials, http=get_shared_http_pool(self.config)
+        )
+
+    def execute(self, request):
+        """リトライとレート制御付きでAPIリクエストを実行"""
+        return execute_request(request, rate_limiter=self.rate_limiter)
+
     @property
     def spreadsheet_id(self):
         """対象スプレッドシートIDを取得"""
@@ -69,6 +130,69 @@ class SpreadsheetManager:
             raise KeyError("config.json の spreadsheet_settings.spreadsheet_id が設定されていません")
         return spreadsheet_id
 
+    @property
+    def cache_ttl_seconds(self):
+        """メタデータと値をメモリから返す秒数を取得"""
+        return self.config.get("spreadsheet_settings", {}).get(
+            "cache_ttl_seconds", DEFAULT_SPREADSHEET_CACHE_TTL_SECONDS
+        )
+
+    @property
+    def revision_check(self):
+        """キャッシュの更新確認方法を取得（"drive" または None）"""
+        return self.config.get("spreadsheet_settings", {}).get("revision_check")
+
+    def _get_revision(self, spreadsheet_id):
+        """Drive の modifiedTime をスプレッドシートのリビジョンとして取得
+
+        Returns:
+            modifiedTime、取得できない場合はNone（TTLのみで判定）
+        """
+        try:
+            if self._drive_service is None:
+                self._drive_service = build_service("drive", "v3", http=self._authorized_http())
+            metadata = self.execute(
+                self._drive_service.files().get(
+                    fileId=spreadsheet_id,
+                    fields="modifiedTime",
+                    supportsAllDrives=True,
+                )
+            )
+            return metadata.get("modifiedTime")
+        except Exception as exc:
+            print(f"スプレッドシートの更新確認エラー: {str(exc)}")
+            return None
+
+    def _cached(self, spreadsheet_id, key, loader):
+        """キャッシュ経由でスプレッドシートの情報を取得"""
+        get_revision = None
+        if self.revision_check == "drive":
+            get_revision = partial(self._get_revision, spreadsheet_id)
+        return get_spreadsheet_cache(spreadsheet_id).get(
+            key,
+            loader,
+            ttl_seconds=self.cache_ttl_seconds,
+            get_revision=get_revision,
+        )
+
+    def invalidate_cache(self, spreadsheet_id=None):
+        """キャッシュを破棄して次回の読み込みでAPIから再取得させる"""
+        get_spreadsheet_cache(spreadsheet_id or self.spreadsheet_id).invalidate()
+
+    def get_metadata(self):
+        """スプレッドシートのタイトルとシート名の一覧を1回のAPI呼び出しで取得"""
+        spreadsheet_id = self.spreadsheet_id
+        return self._cached(
+            spreadsheet_id,
+            ("metadata",),
+            lambda: self.execute(
+                self.service.spreadsheets().get(
+                    spreadsheetId=spreadsheet_id,
+                    fields="properties.title,sheets.properties.title",
+                )
+            ),
+        )
+
     @property
     def range_name(self):
         """取得対象のA1表記範囲を取得"""
@@ -77,33 +201,75 @@ class SpreadsheetManager:
             return configured_range
         return f"{self.get_first_sheet_title()}!A:Z"
 
+    @property
+    def range_names(self):
+        """取り込み対象のA1表記範囲の一覧を取得
+
+        spreadsheet_settings.range_names（例: チームごとのタブ）が設定されていれば
+        それを使い、なければ range_name の1範囲のみを返す。
+        """
+        configured_ranges = self.config.get("spreadsheet_settings", {}).get("range_names")
+        if configured_ranges:
+            return list(configured_ranges)
+        return [self.range_name]
+
     def get_first_sheet_title(self):
         """先頭シートのタイトルを取得"""
-        metadata = self.service.spreadsheets().get(
-            spreadsheetId=self.spreadsheet_id,
-            fields="sheets.properties.title",
-        ).execute()
-        sheets = metadata.get("sheets", [])
+        sheets = self.get_metadata().get("sheets", [])
         if not sheets:
             raise ValueError("スプレッドシート内に参照可能なシートが見つかりません")
         return sheets[0].get("properties", {}).get("title", "Sheet1")
 
     def get_sheet_title(self):
         """対象スプレッドシートのタイトルを取得"""
-        metadata = self.service.spreadsheets().get(
-            spreadsheetId=self.spreadsheet_id,
-            fields="properties.title",
-        ).execute()
-        return metadata.get("properties", {}).get("title")
+        return self.get_metadata().get("properties", {}).get("title")
 
     def get_values(self, spreadsheet_id=None, range_name=None):
-        """対象範囲の値を取得"""
-        result = self.service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id or self.spreadsheet_id,
-            range=range_name or self.range_name,
-        ).execute()
+        """対象範囲の値を取得（キャッシュが有効な間はメモリから返す）"""
+        spreadsheet_id = spreadsheet_id or self.spreadsheet_id
+        range_name = range_name or self.range_name
+        result = self._cached(
+            spreadsheet_id,
+            ("values", range_name),
+            lambda: self.execute(
+                self.service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                )
+            ),
+        )
         return result.get("values", [])
 
+    def batch_get_values(self, range_names=None, spreadsheet_id=None):
+        """複数範囲の値を values.batchGet の1回のAPI呼び出しで取得
+
+        Args:
+            range_names: A1表記範囲のリスト（省略時は range_names）
+            spreadsheet_id: スプレッドシートID（省略時は設定値）
+
+        Returns:
+            範囲をキーとした値の辞書（指定した範囲の順序を保持）
+        """
+        spreadsheet_id = spreadsheet_id or self.spreadsheet_id
+        range_names = list(range_names or self.range_names)
+        result = self._cached(
+            spreadsheet_id,
+            ("values_batch", tuple(range_names)),
+            lambda: self.execute(
+                self.service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=range_names,
+                    fields="valueRanges(range,values)",
+                )
+            ),
+        )
+        # valueRanges は要求した順に返るため、APIが正規化した range ではなく要求した範囲をキーにする
+        value_ranges = result.get("valueRanges", [])
+        return {
+            range_name: value_range.get("values", [])
+            for range_name, value_range in zip(range_names, value_ranges)
+        }
+
     def get_records(self, spreadsheet_id=None, range_name=None):
         """ヘッダー行を使ってレコード一覧を取得"""
         values = self.get_values(spreadsheet_id=spreadsheet_id, range_name=range_name)
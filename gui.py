@@ -3,18 +3,24 @@ import tkinter as tk
 from datetime import datetime
 from tkinter import messagebox, ttk
 
+from core.background import BackgroundWorker
 from core.multi_demo_service import flush_future_events
 from core.spreadsheet_demo_service import (
+    SpreadsheetParseError,
     build_spreadsheet_sync_rows,
     create_spreadsheet_demo_events,
 )
-from gcal.calendar_manager import CalendarManager
-from gsheets.spreadsheet_manager import SpreadsheetManager
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+FILTER_ALL = "すべて"
+# 行の高さを取得できないときに使う値 (ピクセル)
+DEFAULT_ROW_HEIGHT = 20
+# マウスホイール1目盛りでスクロールする行数
+WHEEL_SCROLL_ROWS = 3
+
 
 class LocalSessionState(dict):
     """Minimal session-like store used by shared demo services."""
@@ -34,23 +40,112 @@ class SpreadsheetCalendarGUI:
 
         self.session_state = LocalSessionState()
         self.rows = []
+        # 全行の (iid, 行) と、フィルター適用後の (iid, 行)。iid は slot_key
+        self.row_items = []
+        self.row_by_item = {}
+        self.filtered_items = []
+        # Treeview には filtered_items のうち表示範囲の行だけを入れる
+        self.scroll_offset = 0
+        # Treeview に入っている iid -> 行 / 表示中の値。表示順もこの順序
         self.item_row_map = {}
-
-        try:
-            self.calendar_manager = CalendarManager()
-            self.spreadsheet_manager = SpreadsheetManager()
-        except Exception as exc:
-            logger.error("マネージャー初期化エラー: %s", exc)
-            messagebox.showerror("エラー", f"初期化に失敗しました:\n{exc}")
-            self.root.after(0, self.root.destroy)
-            return
+        self.item_values = {}
+        # スクロールバーに最後に設定した (first, last)
+        self.scrollbar_range = None
+        self.selected_item = None
+        self.shown_detail = None
+        self.calendar_manager = None
+        self.spreadsheet_manager = None
 
         self.subtitle_var = tk.StringVar(value="スプレッドシート接続中...")
         self.status_var = tk.StringVar(value="読み込み待機中")
         self.detail_var = tk.StringVar(value="行を選択すると詳細を表示します。")
+        self.assignee_filter_var = tk.StringVar(value=FILTER_ALL)
+        self.date_filter_var = tk.StringVar()
+        self.status_filter_var = tk.StringVar(value=FILTER_ALL)
+        self.count_var = tk.StringVar(value="")
+
+        # Google API の呼び出しはワーカースレッドで行い、結果は root.after 経由で受け取る
+        self.worker = BackgroundWorker(self.root)
+        self.action_buttons = []
+        # 再取得ボタンで立て、次に実行される再取得タスクがワーカースレッドで下ろす
+        self.invalidate_requested = False
 
         self.create_widgets()
-        self.refresh_rows(show_message=False)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        # 先にウィンドウを表示し、Google APIクライアントの読み込みはその後で行う
+        self.root.after_idle(self.initialize_managers)
+
+    def initialize_managers(self):
+        """Google APIマネージャーを初期化して初回の読み込みを行う"""
+
+        def task(handle):
+            handle.report("Google API クライアントを初期化中...")
+            from gcal.calendar_manager import CalendarManager
+            from gsheets.spreadsheet_manager import SpreadsheetManager
+
+            return CalendarManager(), SpreadsheetManager()
+
+        def on_done(managers):
+            self.calendar_manager, self.spreadsheet_manager = managers
+            self.refresh_rows(show_message=False)
+
+        def on_error(exc):
+            logger.error("マネージャー初期化エラー: %s", exc)
+            messagebox.showerror("エラー", f"初期化に失敗しました:\n{exc}")
+            self.close()
+
+        self.run_task("initialize", task, on_done, on_error, on_cancel=self.close)
+
+    def run_task(self, name, task, on_done, on_error, on_cancel=None, rerun=False):
+        """Google API の処理をバックグラウンドで実行する
+
+        Args:
+            name: タスク名。同名のタスクが実行中の場合はまとめられる
+            task: ワーカースレッドで実行する関数。BackgroundTask を受け取る
+            on_done: 完了時に UI スレッドで呼ばれる関数
+            on_error: 失敗時に UI スレッドで呼ばれる関数
+            on_cancel: キャンセル時に UI スレッドで呼ばれる関数
+            rerun: 実行中に再度要求された場合、完了後にもう一度だけ実行する
+        """
+
+        def finish(callback):
+            def wrapper(*args):
+                self.update_busy_state()
+                if callback:
+                    callback(*args)
+
+            return wrapper
+
+        def cancelled():
+            self.status_var.set("処理をキャンセルしました")
+
+        self.worker.submit(
+            name,
+            task,
+            on_done=finish(on_done),
+            on_error=finish(on_error),
+            on_progress=self.status_var.set,
+            on_cancel=finish(on_cancel or cancelled),
+            rerun=rerun,
+        )
+        self.update_busy_state()
+
+    def update_busy_state(self):
+        """処理中はボタンを無効化し、キャンセルボタンを有効化する"""
+        busy = self.worker.busy
+        for button in self.action_buttons:
+            button.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
+
+    def cancel_task(self):
+        """実行中の処理をキャンセルする"""
+        self.worker.cancel()
+        self.status_var.set("キャンセルしています...")
+
+    def close(self):
+        """実行中の処理を止めてウィンドウを閉じる"""
+        self.worker.shutdown()
+        self.root.destroy()
 
     def create_widgets(self):
         """ウィジェットを作成する"""
@@ -74,20 +169,41 @@ class SpreadsheetCalendarGUI:
         button_frame = ttk.Frame(header_frame)
         button_frame.pack(side=tk.RIGHT)
 
-        ttk.Button(button_frame, text="Google Spreadsheet を再取得", command=self.refresh_rows).pack(
-            side=tk.LEFT, padx=(0, 6)
-        )
-        ttk.Button(button_frame, text="カレンダーに流し込み", command=self.create_events).pack(
+        # 再取得は処理中も押せる (実行中の再取得の完了後に一度だけ再実行される。
+        # キャッシュの破棄もワーカースレッドで行うため、押しても画面は固まらない)
+        ttk.Button(button_frame, text="Google Spreadsheet を再取得", command=self.reload_spreadsheet).pack(
             side=tk.LEFT, padx=(0, 6)
         )
-        ttk.Button(button_frame, text="先日付予定をFLUSH", command=self.flush_events).pack(
-            side=tk.LEFT, padx=(0, 6)
-        )
-        ttk.Button(button_frame, text="終了", command=self.root.quit).pack(side=tk.LEFT)
+        create_button = ttk.Button(button_frame, text="カレンダーに流し込み", command=self.create_events)
+        create_button.pack(side=tk.LEFT, padx=(0, 6))
+        flush_button = ttk.Button(button_frame, text="先日付予定をFLUSH", command=self.flush_events)
+        flush_button.pack(side=tk.LEFT, padx=(0, 6))
+        self.action_buttons = [create_button, flush_button]
+        self.cancel_button = ttk.Button(button_frame, text="キャンセル", command=self.cancel_task, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(button_frame, text="終了", command=self.close).pack(side=tk.LEFT)
 
         table_frame = ttk.LabelFrame(main_frame, text="Google Spreadsheet の予定一覧")
         table_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
 
+        filter_frame = ttk.Frame(table_frame)
+        filter_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=6, pady=6)
+        ttk.Label(filter_frame, text="担当:").pack(side=tk.LEFT)
+        self.assignee_filter = ttk.Combobox(
+            filter_frame, textvariable=self.assignee_filter_var, values=(FILTER_ALL,), state="readonly", width=16
+        )
+        self.assignee_filter.pack(side=tk.LEFT, padx=(2, 10))
+        ttk.Label(filter_frame, text="日付 (前方一致):").pack(side=tk.LEFT)
+        ttk.Entry(filter_frame, textvariable=self.date_filter_var, width=12).pack(side=tk.LEFT, padx=(2, 10))
+        ttk.Label(filter_frame, text="同期状況:").pack(side=tk.LEFT)
+        self.status_filter = ttk.Combobox(
+            filter_frame, textvariable=self.status_filter_var, values=(FILTER_ALL,), state="readonly", width=18
+        )
+        self.status_filter.pack(side=tk.LEFT, padx=(2, 10))
+        ttk.Label(filter_frame, textvariable=self.count_var).pack(side=tk.RIGHT)
+        for variable in (self.assignee_filter_var, self.date_filter_var, self.status_filter_var):
+            variable.trace_add("write", lambda *_args: self.apply_filters())
+
         columns = ("date", "assignee", "summary", "planned_time", "status", "actual_summary")
         self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="browse")
         self.tree.heading("date", text="日付")
@@ -103,18 +219,27 @@ class SpreadsheetCalendarGUI:
         self.tree.column("status", width=140, minwidth=120, anchor=tk.W)
         self.tree.column("actual_summary", width=320, minwidth=220, anchor=tk.W)
 
-        v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        # 縦スクロールは Treeview ではなく表示範囲 (scroll_offset) を動かす
+        self.v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.on_scroll)
         h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
 
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.tree.grid(row=1, column=0, sticky="nsew")
+        self.v_scrollbar.grid(row=1, column=1, sticky="ns")
+        h_scrollbar.grid(row=2, column=0, sticky="ew")
 
-        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_rowconfigure(1, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
 
         self.tree.bind("<<TreeviewSelect>>", self.on_item_select)
+        self.tree.bind("<Configure>", lambda _event: self.render_window())
+        self.tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda _event: self.scroll_rows(-WHEEL_SCROLL_ROWS))
+        self.tree.bind("<Button-5>", lambda _event: self.scroll_rows(WHEEL_SCROLL_ROWS))
+        self.tree.bind("<Up>", lambda _event: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda _event: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda _event: self.move_selection(-self.window_size()))
+        self.tree.bind("<Next>", lambda _event: self.move_selection(self.window_size()))
 
         detail_outer = ttk.LabelFrame(main_frame, text="選択中の詳細")
         detail_outer.pack(fill=tk.BOTH, expand=False)
@@ -146,88 +271,299 @@ class SpreadsheetCalendarGUI:
         widget.insert("1.0", content)
         widget.config(state=tk.DISABLED)
 
+    def reload_spreadsheet(self):
+        """キャッシュを使わずに Google Spreadsheet を再取得する
+
+        キャッシュの破棄は読み込み中のスレッドとロックを取り合うため、
+        UI スレッドでは行わず再取得タスクの中で行う。
+        """
+        if self.spreadsheet_manager is None:
+            return
+        self.invalidate_requested = True
+        self.refresh_rows()
+
     def refresh_rows(self, show_message=True):
         """Google Spreadsheet とカレンダー状態を再取得する"""
-        try:
-            self.rows = build_spreadsheet_sync_rows(
-                self.calendar_manager,
-                self.session_state,
-                self.spreadsheet_manager,
-            )
-            spreadsheet_title = self.spreadsheet_manager.get_sheet_title() or self.spreadsheet_manager.spreadsheet_id
-            self.subtitle_var.set(
-                f"接続先: {spreadsheet_title} / 範囲: {self.spreadsheet_manager.range_name}"
-            )
-            self.status_var.set(
-                f"取り込み件数: {len(self.rows)} / 最終取得: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        calendar_manager = self.calendar_manager
+        spreadsheet_manager = self.spreadsheet_manager
+        session_state = self.session_state
+
+        def task(handle):
+            if self.invalidate_requested:
+                self.invalidate_requested = False
+                spreadsheet_manager.invalidate_cache()
+            handle.report("Google Spreadsheet を読み込み中...")
+            rows = build_spreadsheet_sync_rows(calendar_manager, session_state, spreadsheet_manager)
+            handle.raise_if_cancelled()
+            spreadsheet_title = spreadsheet_manager.get_sheet_title() or spreadsheet_manager.spreadsheet_id
+            # range_names はシート情報の取得を伴うことがあるため、ワーカースレッドで求める
+            range_label = ", ".join(spreadsheet_manager.range_names)
+            return rows, spreadsheet_title, range_label
+
+        def on_done(result):
+            rows, spreadsheet_title, range_label = result
+            self.set_rows(rows)
+            self._set_var(self.subtitle_var, f"接続先: {spreadsheet_title} / 範囲: {range_label}")
+            self._set_var(
+                self.status_var,
+                f"取り込み件数: {len(self.rows)} / 最終取得: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             )
-            self.update_table()
-            self.clear_detail()
+            self.show_detail()
             if show_message:
                 messagebox.showinfo("完了", "Google Spreadsheet の最新状態を再取得しました")
-        except Exception as exc:
+
+        def on_error(exc):
             logger.error("Spreadsheet再取得エラー: %s", exc)
+            self.status_var.set("Google Spreadsheet の読み込みに失敗しました")
             messagebox.showerror("エラー", f"Google Spreadsheet の読み込みに失敗しました:\n{exc}")
 
-    def update_table(self):
-        """一覧テーブルを更新する"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        self.item_row_map = {}
-        for row in self.rows:
-            values = (
-                row["target_date"].strftime("%Y-%m-%d"),
-                row["assignee"],
-                row["summary"],
-                row["planned_time_label"],
-                row["status_label"],
-                row["actual_summary"] if row["exists"] else "-",
-            )
-            item_id = self.tree.insert("", tk.END, values=values)
-            self.item_row_map[item_id] = row
+        self.run_task("refresh", task, on_done, on_error, rerun=True)
+
+    @staticmethod
+    def format_row_values(row):
+        """一覧テーブルの1行分の表示値を返す"""
+        return (
+            row.target_date.strftime("%Y-%m-%d"),
+            row.assignee,
+            row.summary,
+            row.planned_time_label,
+            row.status_label,
+            row.actual_summary if row.exists else "-",
+        )
 
-    def clear_detail(self):
-        """詳細表示をクリアする"""
-        self.detail_var.set("行を選択すると詳細を表示します。")
-        self._set_text(self.plan_text, "")
-        self._set_text(self.actual_text, "")
+    def set_rows(self, rows):
+        """取り込んだ行を保持し、フィルターと表示範囲を更新する"""
+        self.rows = rows
+        self.row_items = []
+        self.row_by_item = {}
+        for row in rows:
+            item_id = row.slot_key
+            duplicate = 1
+            while item_id in self.row_by_item:
+                duplicate += 1
+                item_id = f"{row.slot_key}#{duplicate}"
+            self.row_items.append((item_id, row))
+            self.row_by_item[item_id] = row
+
+        self._set_filter_choices(self.assignee_filter, sorted({row.assignee for row in rows}))
+        self._set_filter_choices(self.status_filter, sorted({row.status_label for row in rows}))
+        self.apply_filters(reset_scroll=False)
+
+    @staticmethod
+    def _set_filter_choices(combobox, choices):
+        """フィルターの選択肢を更新する (変わらなければ何もしない)"""
+        values = (FILTER_ALL, *choices)
+        if tuple(combobox.cget("values")) != values:
+            combobox.config(values=values)
+
+    @staticmethod
+    def _set_var(variable, value):
+        """StringVar を更新する (変わらなければ何もしない)"""
+        if variable.get() != value:
+            variable.set(value)
+
+    def apply_filters(self, reset_scroll=True):
+        """担当・日付・同期状況で行を絞り込む
+
+        Args:
+            reset_scroll: True の場合は先頭までスクロールする
+        """
+        assignee = self.assignee_filter_var.get()
+        date_prefix = self.date_filter_var.get().strip()
+        status = self.status_filter_var.get()
+
+        items = self.row_items
+        if assignee != FILTER_ALL:
+            items = [(item_id, row) for item_id, row in items if row.assignee == assignee]
+        if date_prefix:
+            items = [(item_id, row) for item_id, row in items if row.target_date.isoformat().startswith(date_prefix)]
+        if status != FILTER_ALL:
+            items = [(item_id, row) for item_id, row in items if row.status_label == status]
+
+        self.filtered_items = items
+        if reset_scroll:
+            self.scroll_offset = 0
+        self._set_var(self.count_var, f"表示: {len(items)}件 / 全{len(self.row_items)}件")
+        self.render_window()
+
+    def window_size(self):
+        """Treeview に表示できる行数を返す"""
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else None
+        if bbox:
+            header_height, row_height = bbox[1], bbox[3]
+        else:
+            try:
+                row_height = int(ttk.Style(self.tree).lookup("Treeview", "rowheight")) or DEFAULT_ROW_HEIGHT
+            except (TypeError, ValueError):
+                row_height = DEFAULT_ROW_HEIGHT
+            header_height = row_height + 4
+        return max(1, (self.tree.winfo_height() - header_height) // row_height)
+
+    def render_window(self):
+        """スクロール位置の行だけを Treeview に表示する"""
+        size = self.window_size()
+        total = len(self.filtered_items)
+        self.scroll_offset = max(0, min(self.scroll_offset, total - size))
+        self.update_table(self.filtered_items[self.scroll_offset : self.scroll_offset + size])
+
+        # 空の Treeview では行の高さを推定しているため、行を入れた後に測り直す
+        measured_size = self.window_size()
+        if measured_size != size:
+            size = measured_size
+            self.scroll_offset = max(0, min(self.scroll_offset, total - size))
+            self.update_table(self.filtered_items[self.scroll_offset : self.scroll_offset + size])
+
+        if total > size:
+            scrollbar_range = (self.scroll_offset / total, (self.scroll_offset + size) / total)
+        else:
+            scrollbar_range = (0.0, 1.0)
+        if scrollbar_range != self.scrollbar_range:
+            self.scrollbar_range = scrollbar_range
+            self.v_scrollbar.set(*scrollbar_range)
+
+        # 選択中の行が表示範囲に戻ってきたら選択状態も戻す
+        if self.selected_item in self.item_row_map and self.tree.selection() != (self.selected_item,):
+            self.tree.selection_set(self.selected_item)
+
+    def scroll_rows(self, delta):
+        """表示範囲を delta 行スクロールする"""
+        self.scroll_offset += delta
+        self.render_window()
+        return "break"
+
+    def on_scroll(self, *args):
+        """縦スクロールバーの操作を表示範囲に反映する"""
+        if args[0] == "moveto":
+            self.scroll_offset = int(float(args[1]) * len(self.filtered_items))
+            self.render_window()
+        elif args[0] == "scroll":
+            step = self.window_size() if args[2] == "pages" else 1
+            self.scroll_rows(int(args[1]) * step)
+
+    def on_mouse_wheel(self, event):
+        """マウスホイールで表示範囲をスクロールする (Windows / macOS)"""
+        if abs(event.delta) >= 120:
+            return self.scroll_rows(-event.delta // 120 * WHEEL_SCROLL_ROWS)
+        return self.scroll_rows(-event.delta)
+
+    def move_selection(self, delta):
+        """キー操作で選択行を移動し、必要なら表示範囲もスクロールする"""
+        if not self.filtered_items:
+            return "break"
+
+        index = next(
+            (position for position, (item_id, _row) in enumerate(self.filtered_items) if item_id == self.selected_item),
+            None,
+        )
+        if index is None:
+            index = self.scroll_offset
+        else:
+            index = max(0, min(index + delta, len(self.filtered_items) - 1))
+
+        size = self.window_size()
+        if index < self.scroll_offset:
+            self.scroll_offset = index
+        elif index >= self.scroll_offset + size:
+            self.scroll_offset = index - size + 1
+
+        self.selected_item = self.filtered_items[index][0]
+        self.render_window()
+        self.tree.focus(self.selected_item)
+        self.show_detail()
+        return "break"
+
+    def update_table(self, items):
+        """一覧テーブルを slot_key 単位の差分で更新する
+
+        追加された行を挿入し、値が変わった行だけを書き換え、なくなった行を削除する。
+        変更がなければ Treeview には触れないため、選択とスクロール位置も保たれる。
+
+        Args:
+            items: 表示する (iid, 行) のリスト
+        """
+        new_row_map = dict(items)
+
+        removed = [item_id for item_id in self.item_values if item_id not in new_row_map]
+        if removed:
+            self.tree.delete(*removed)
+            for item_id in removed:
+                del self.item_values[item_id]
+
+        # 残った行の並びが変わっていれば先に並べ替え、挿入位置を正しくしておく
+        kept_order = [item_id for item_id in new_row_map if item_id in self.item_values]
+        current_order = list(self.item_values)
+        if kept_order != current_order:
+            start = 0
+            while kept_order[start] == current_order[start]:
+                start += 1
+            end = len(kept_order)
+            while kept_order[end - 1] == current_order[end - 1]:
+                end -= 1
+            for index in range(start, end):
+                self.tree.move(kept_order[index], "", index)
+
+        item_values = {}
+        for index, (item_id, row) in enumerate(new_row_map.items()):
+            values = self.format_row_values(row)
+            current = self.item_values.get(item_id)
+            if current is None:
+                self.tree.insert("", index, iid=item_id, values=values)
+            elif current != values:
+                self.tree.item(item_id, values=values)
+            item_values[item_id] = values
+
+        self.item_values = item_values
+        self.item_row_map = new_row_map
 
     def on_item_select(self, _event):
         """一覧選択時に詳細を表示する"""
         selection = self.tree.selection()
-        if not selection:
-            self.clear_detail()
-            return
+        if selection:
+            self.selected_item = selection[0]
+        elif self.selected_item in self.item_row_map:
+            self.selected_item = None
+        # 表示範囲外へスクロールして Treeview から外れた行は選択中のまま扱う
+        self.show_detail()
+
+    def show_detail(self):
+        """選択中の行の詳細を表示する (表示内容が変わらなければ何もしない)"""
+        row = self.row_by_item.get(self.selected_item)
+        if row:
+            detail = (
+                f"slot_key: {row.slot_key} / 状態: {row.status_label}",
+                self.format_plan_detail(row),
+                self.format_actual_detail(row),
+            )
+        else:
+            detail = ("行を選択すると詳細を表示します。", "", "")
 
-        row = self.item_row_map.get(selection[0])
-        if not row:
-            self.clear_detail()
+        if detail == self.shown_detail:
             return
-
-        self.detail_var.set(f"slot_key: {row['slot_key']} / 状態: {row['status_label']}")
-        self._set_text(self.plan_text, self.format_plan_detail(row))
-        self._set_text(self.actual_text, self.format_actual_detail(row))
+        self.shown_detail = detail
+        self.detail_var.set(detail[0])
+        self._set_text(self.plan_text, detail[1])
+        self._set_text(self.actual_text, detail[2])
 
     def format_plan_detail(self, row):
         """Spreadsheet の予定案を整形する"""
         return "\n".join(
             [
-                f"slot_key: {row['slot_key']}",
-                f"日付: {row['target_date'].strftime('%Y-%m-%d')} ({row['weekday_label']}曜日)",
-                f"担当: {row['assignee']}",
-                f"件名: {row['summary']}",
-                f"時間: {row['planned_time_label']}",
-                f"場所: {row['location']}",
+                f"slot_key: {row.slot_key}",
+                f"日付: {row.target_date.strftime('%Y-%m-%d')} ({row.weekday_label}曜日)",
+                f"担当: {row.assignee}",
+                f"件名: {row.summary}",
+                f"時間: {row.planned_time_label}",
+                f"場所: {row.location}",
                 "",
                 "説明:",
-                row["description"],
+                row.description,
             ]
         )
 
     def format_actual_detail(self, row):
         """Google Calendar 上の状態を整形する"""
-        if not row["exists"]:
+        if not row.exists:
             return "\n".join(
                 [
                     "まだカレンダーに作成されていません。",
@@ -238,31 +574,49 @@ class SpreadsheetCalendarGUI:
             )
 
         lines = [
-            f"イベントID: {row['event_id']}",
-            f"件名: {row['actual_summary']}",
-            f"時間: {row['actual_start']} - {row['actual_end']}",
-            f"場所: {row['actual_location']}",
+            f"イベントID: {row.event_id}",
+            f"件名: {row.actual_summary}",
+            f"時間: {row.actual_start} - {row.actual_end}",
+            f"場所: {row.actual_location}",
             "",
             "説明:",
-            row["actual_description"],
+            row.actual_description,
         ]
-        if row["has_changes"]:
+        if row.has_changes:
             lines.extend(["", "Google Calendar 側で予定内容が編集されています。"])
         return "\n".join(lines)
 
     def create_events(self):
         """Spreadsheet の予定案を Google Calendar に作成する"""
-        try:
-            created_count, skipped_count, failed_summaries = create_spreadsheet_demo_events(
-                self.calendar_manager,
-                self.session_state,
-                self.spreadsheet_manager,
+        calendar_manager = self.calendar_manager
+        spreadsheet_manager = self.spreadsheet_manager
+        session_state = self.session_state
+
+        def task(handle):
+            handle.report("Google Calendar へ流し込み中...")
+            return create_spreadsheet_demo_events(
+                calendar_manager,
+                session_state,
+                spreadsheet_manager,
+                progress=lambda processed: handle.report(f"Google Calendar へ流し込み中... {processed}件処理済み"),
             )
-        except Exception as exc:
+
+        def on_error(exc):
             logger.error("カレンダー流し込みエラー: %s", exc)
-            messagebox.showerror("エラー", f"Google Calendar への流し込みに失敗しました:\n{exc}")
-            return
+            if isinstance(exc, SpreadsheetParseError):
+                messagebox.showerror("エラー", f"Spreadsheet の内容が不正なため、予定は1件も作成していません:\n{exc}")
+            else:
+                messagebox.showerror("エラー", f"Google Calendar への流し込みに失敗しました:\n{exc}")
+
+        def on_cancel():
+            # 途中までに作成された予定を一覧に反映する
+            self.refresh_rows(show_message=False)
+
+        self.run_task("create_events", task, self.show_create_result, on_error, on_cancel=on_cancel)
 
+    def show_create_result(self, result):
+        """流し込み結果を表示して一覧を更新する"""
+        created_count, skipped_count, failed_summaries = result
         messages = []
         if created_count:
             messages.append(f"{created_count}件の予定を Google Calendar へ作成しました。")
@@ -284,13 +638,30 @@ class SpreadsheetCalendarGUI:
         ):
             return
 
-        try:
-            deleted_count, failed_count = flush_future_events(self.calendar_manager, self.session_state)
-        except Exception as exc:
+        calendar_manager = self.calendar_manager
+        session_state = self.session_state
+
+        def task(handle):
+            handle.report("先日付イベントを削除中...")
+            return flush_future_events(
+                calendar_manager,
+                session_state,
+                progress=lambda done, total: handle.report(f"先日付イベントを削除中... {done}/{total}件"),
+            )
+
+        def on_error(exc):
             logger.error("FLUSHエラー: %s", exc)
             messagebox.showerror("エラー", f"FLUSH に失敗しました:\n{exc}")
-            return
 
+        def on_cancel():
+            # 途中までの削除を一覧に反映する
+            self.refresh_rows(show_message=False)
+
+        self.run_task("flush_events", task, self.show_flush_result, on_error, on_cancel=on_cancel)
+
+    def show_flush_result(self, result):
+        """FLUSH結果を表示して一覧を更新する"""
+        deleted_count, failed_count = result
         lines = [f"先日付イベントを {deleted_count} 件削除しました。"]
         if failed_count:
             lines.append(f"{failed_count} 件の削除に失敗しました。")
@@ -0,0 +1,28 @@
+"""Shared fixtures: managers wired to the in-process fake Google API."""
+
+import pytest
+
+from benchmarks.fake_google_api import FakeGoogleApi
+from benchmarks.run_benchmarks import BENCHMARK_CALENDAR_ID, build_benchmark_config, build_benchmark_key_info
+
+
+@pytest.fixture(scope="session")
+def key_info():
+    """Service account key with a freshly generated RSA key."""
+    return build_benchmark_key_info()
+
+
+@pytest.fixture
+def fake_api():
+    """Fake Calendar/Sheets API with an empty benchmark calendar."""
+    fake_api = FakeGoogleApi(seed=0)
+    fake_api.add_calendar(BENCHMARK_CALENDAR_ID, summary="Test")
+    return fake_api
+
+
+@pytest.fixture
+def calendar_manager(fake_api, key_info):
+    """CalendarManager that sends every request to ``fake_api``."""
+    from gcal.calendar_manager import CalendarManager
+
+    return CalendarManager(config=build_benchmark_config(), key_info=key_info, http=fake_api)
@@ -0,0 +1,142 @@
+"""Tests for the process-wide cache of decrypted credentials."""
+
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import crypto_utils
+from core import auth
+from core.constants import CREDENTIALS_CACHE_TTL_SECONDS
+
+
+FILES = {
+    "config.json": json.dumps({"calendar_id": "primary"}).encode("utf-8"),
+    "service-account.json": json.dumps({"client_email": "demo@example.com"}).encode("utf-8"),
+}
+
+
+@pytest.fixture
+def bundle_path(tmp_path, monkeypatch):
+    """Encrypted bundle in a temporary ``encrypted_credentials`` directory."""
+    encrypted_dir = tmp_path / "encrypted_credentials"
+    encrypted_dir.mkdir()
+    path = crypto_utils.encrypt_bundle(FILES, "secret", str(encrypted_dir / crypto_utils.BUNDLE_FILE_NAME))
+    monkeypatch.setattr(auth, "resource_path", lambda relative_path: str(tmp_path / relative_path))
+    auth.evict_credentials_cache()
+    yield path
+    auth.evict_credentials_cache()
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Record the passwords passed to ``load_credentials_bundle``."""
+    calls = []
+    load_credentials_bundle = crypto_utils.load_credentials_bundle
+
+    def counting_load(encrypted_dir, password):
+        calls.append(password)
+        return load_credentials_bundle(encrypted_dir, password)
+
+    monkeypatch.setattr(crypto_utils, "load_credentials_bundle", counting_load)
+    return calls
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace ``time.monotonic`` as seen by ``core.auth``."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(auth, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_same_password_is_decrypted_once(bundle_path, loads):
+    first, error = auth.setup_credentials({"credentials_password": "secret"})
+    second, _ = auth.setup_credentials({"credentials_password": "secret"})
+
+    assert error is None
+    assert first is second
+    assert first["config"] == {"calendar_id": "primary"}
+    assert first["key_name"] == "service-account.json"
+    assert loads == ["secret"]
+
+
+def test_wrong_password_is_not_cached(bundle_path, loads):
+    for _ in range(2):
+        bundle, error = auth.setup_credentials({"credentials_password": "wrong"})
+        assert bundle is None
+        assert error.startswith("認証情報の復号化エラー")
+
+    assert loads == ["wrong", "wrong"]
+    assert auth._credentials_load_locks == {}
+
+
+def test_missing_password(bundle_path, loads):
+    assert auth.setup_credentials({}) == (None, "認証情報のパスワードが設定されていません。")
+    assert loads == []
+
+
+def test_changed_bundle_gets_a_new_cache_key(bundle_path, loads):
+    first, _ = auth.setup_credentials({"credentials_password": "secret"})
+    mtime = os.path.getmtime(bundle_path)
+    os.utime(bundle_path, (mtime + 10, mtime + 10))
+
+    second, _ = auth.setup_credentials({"credentials_password": "secret"})
+
+    assert second is not first
+    assert second["bundle_id"] != first["bundle_id"]
+    assert loads == ["secret", "secret"]
+
+
+def test_entries_expire_after_ttl(bundle_path, loads, clock):
+    first, _ = auth.setup_credentials({"credentials_password": "secret"})
+
+    clock.now += CREDENTIALS_CACHE_TTL_SECONDS - 1
+    assert auth.setup_credentials({"credentials_password": "secret"})[0] is first
+
+    clock.now += 1
+    assert auth.setup_credentials({"credentials_password": "secret"})[0] is not first
+    assert loads == ["secret", "secret"]
+
+
+def test_evict_credentials_cache(bundle_path, loads):
+    auth.setup_credentials({"credentials_password": "secret"})
+
+    assert auth.evict_credentials_cache("other") == 0
+    assert auth.evict_credentials_cache("secret") == 1
+    assert auth.evict_credentials_cache() == 0
+
+    auth.setup_credentials({"credentials_password": "secret"})
+    assert loads == ["secret", "secret"]
+
+
+def test_concurrent_callers_share_one_derivation(bundle_path, monkeypatch):
+    calls = []
+    load_credentials_bundle = crypto_utils.load_credentials_bundle
+
+    def slow_load(encrypted_dir, password):
+        calls.append(password)
+        time.sleep(0.2)
+        return load_credentials_bundle(encrypted_dir, password)
+
+    monkeypatch.setattr(crypto_utils, "load_credentials_bundle", slow_load)
+    results = []
+
+    def setup(password):
+        results.append(auth.setup_credentials({"credentials_password": password}))
+
+    threads = [threading.Thread(target=setup, args=("secret",)) for _ in range(6)]
+    threads.append(threading.Thread(target=setup, args=("wrong",)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["secret", "wrong"]
+    bundles = [bundle for bundle, _error in results if bundle is not None]
+    assert len(bundles) == 6
+    assert all(bundle is bundles[0] for bundle in bundles)
+    assert auth._credentials_load_locks == {}
@@ -0,0 +1,48 @@
+"""Tests for event inserts retried after the server already committed them."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from benchmarks.run_benchmarks import BENCHMARK_CALENDAR_ID
+from core import google_api
+
+
+START = datetime(2026, 10, 21, 10, 0)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(google_api.time, "sleep", lambda seconds: None)
+
+
+def test_retried_insert_creates_one_event(calendar_manager, fake_api):
+    fake_api.fail_next(503, after_commit=True)
+
+    created = calendar_manager.create_event("Demo", START, START + timedelta(hours=1))
+
+    events = fake_api.events(BENCHMARK_CALENDAR_ID)
+    assert [event["id"] for event in events] == [created["id"]]
+    assert fake_api.request_counts["error:503"] == 1
+    assert fake_api.request_counts["error:409"] == 1
+
+
+def test_retried_batch_insert_creates_one_event_per_key(calendar_manager, fake_api):
+    fake_api.fail_next(503, count=2, after_commit=True)
+    events = [
+        (index, {"summary": f"Demo {index}", "start_time": START + timedelta(hours=index)}) for index in range(5)
+    ]
+
+    results = calendar_manager.create_events_batch(events)
+
+    created = fake_api.events(BENCHMARK_CALENDAR_ID)
+    assert len(created) == 5
+    assert sorted(event["id"] for event in results.values()) == sorted(event["id"] for event in created)
+    assert fake_api.request_counts["error:409"] == 2
+
+
+def test_inserts_get_distinct_client_ids(calendar_manager):
+    first = calendar_manager._build_event_body("Demo", START, START + timedelta(hours=1))
+    second = calendar_manager._build_event_body("Demo", START, START + timedelta(hours=1))
+
+    assert first["id"] != second["id"]
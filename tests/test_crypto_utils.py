@@ -0,0 +1,48 @@
+"""Tests for the encrypted credentials bundle."""
+
+import json
+
+import pytest
+from cryptography.fernet import InvalidToken
+
+from crypto_utils import BUNDLE_FILE_NAME, decrypt_bundle, encrypt_bundle, load_credentials_bundle
+
+
+FILES = {
+    "config.json": json.dumps({"calendar_id": "primary"}).encode("utf-8"),
+    "service-account.json": json.dumps({"client_email": "demo@example.com"}).encode("utf-8"),
+    "credentials.json": b"{}",
+}
+
+
+def test_bundle_round_trip(tmp_path):
+    bundle_path = encrypt_bundle(FILES, "secret", str(tmp_path / BUNDLE_FILE_NAME))
+
+    assert decrypt_bundle(bundle_path, "secret") == FILES
+
+
+def test_bundle_rejects_wrong_password(tmp_path):
+    bundle_path = encrypt_bundle(FILES, "secret", str(tmp_path / BUNDLE_FILE_NAME))
+
+    with pytest.raises(InvalidToken):
+        decrypt_bundle(bundle_path, "wrong")
+
+
+def test_bundle_rejects_foreign_file(tmp_path):
+    bundle_path = tmp_path / BUNDLE_FILE_NAME
+    bundle_path.write_bytes(b"not a bundle")
+
+    with pytest.raises(ValueError):
+        decrypt_bundle(str(bundle_path), "secret")
+
+
+def test_load_credentials_bundle(tmp_path):
+    encrypt_bundle(FILES, "secret", str(tmp_path / BUNDLE_FILE_NAME))
+
+    bundle = load_credentials_bundle(str(tmp_path), "secret")
+
+    assert bundle == {
+        "config": {"calendar_id": "primary"},
+        "key_info": {"client_email": "demo@example.com"},
+        "key_name": "service-account.json",
+    }
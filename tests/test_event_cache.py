@@ -0,0 +1,111 @@
+"""Tests for the sync-token backed Calendar event cache."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from benchmarks.run_benchmarks import BENCHMARK_CALENDAR_ID
+from core.constants import JST, MULTI_DEMO_SLOT_MARKER, MULTI_DEMO_SLOT_PROPERTY
+from core.event_cache import CalendarEventCache, extract_event_slot_key
+
+
+@pytest.mark.parametrize(
+    "event, slot_key",
+    [
+        ({"extendedProperties": {"private": {MULTI_DEMO_SLOT_PROPERTY: "slot-1"}}}, "slot-1"),
+        (
+            {
+                "extendedProperties": {"private": {MULTI_DEMO_SLOT_PROPERTY: "slot-1"}},
+                "description": f"{MULTI_DEMO_SLOT_MARKER} legacy",
+            },
+            "slot-1",
+        ),
+        ({"description": f"商談メモ\n{MULTI_DEMO_SLOT_MARKER} slot-2 \n担当: 佐藤"}, "slot-2"),
+        ({"description": f"{MULTI_DEMO_SLOT_MARKER}   "}, None),
+        ({"description": f"見出し {MULTI_DEMO_SLOT_MARKER} slot-3"}, None),
+        ({"description": "商談メモ"}, None),
+        ({}, None),
+    ],
+)
+def test_extract_event_slot_key(event, slot_key):
+    assert extract_event_slot_key(event) == slot_key
+
+
+@pytest.fixture
+def start_time():
+    return datetime.now(JST) + timedelta(days=1)
+
+
+@pytest.fixture
+def event_cache():
+    return CalendarEventCache(BENCHMARK_CALENDAR_ID)
+
+
+def create_slot_event(calendar_manager, slot_key, start_time):
+    return calendar_manager.create_event(
+        f"デモ {slot_key}",
+        start_time=start_time,
+        private_properties={MULTI_DEMO_SLOT_PROPERTY: slot_key},
+    )
+
+
+def test_refresh_applies_changes_with_sync_token(calendar_manager, fake_api, event_cache, start_time):
+    kept = create_slot_event(calendar_manager, "slot-1", start_time)
+    moved = create_slot_event(calendar_manager, "slot-2", start_time + timedelta(hours=1))
+    deleted = create_slot_event(calendar_manager, "slot-3", start_time + timedelta(hours=2))
+    event_cache.refresh(calendar_manager)
+
+    added = create_slot_event(calendar_manager, "slot-4", start_time + timedelta(hours=3))
+    calendar_manager.update_event(moved["id"], summary="デモ 変更後", start_time=start_time - timedelta(hours=1))
+    calendar_manager.delete_event(deleted["id"])
+    fake_api.request_counts.clear()
+    event_cache.refresh(calendar_manager)
+
+    assert fake_api.request_counts == {"events.list": 1}
+    assert [event["id"] for event in event_cache.future_events(datetime.now(JST))] == [
+        moved["id"],
+        kept["id"],
+        added["id"],
+    ]
+    assert event_cache.get(moved["id"])["summary"] == "デモ 変更後"
+    assert event_cache.get(deleted["id"]) is None
+
+
+def test_refresh_falls_back_to_full_sync_when_token_expires(calendar_manager, fake_api, event_cache, start_time):
+    first = create_slot_event(calendar_manager, "slot-1", start_time)
+    event_cache.refresh(calendar_manager)
+
+    second = create_slot_event(calendar_manager, "slot-2", start_time + timedelta(hours=1))
+    calendar_manager.delete_event(first["id"])
+    fake_api.expire_sync_tokens(BENCHMARK_CALENDAR_ID)
+    fake_api.request_counts.clear()
+    event_cache.refresh(calendar_manager)
+
+    assert fake_api.request_counts == {"error:410": 1, "events.list": 1}
+    assert [event["id"] for event in event_cache.future_events(datetime.now(JST))] == [second["id"]]
+
+    # The token of the recovery full sync is a regular delta token again.
+    third = create_slot_event(calendar_manager, "slot-3", start_time + timedelta(hours=2))
+    fake_api.request_counts.clear()
+    event_cache.refresh(calendar_manager)
+
+    assert fake_api.request_counts == {"events.list": 1}
+    assert event_cache.get(third["id"]) is not None
+
+
+def test_slot_index_follows_delta_sync(calendar_manager, event_cache, start_time):
+    later = create_slot_event(calendar_manager, "slot-1", start_time + timedelta(days=1))
+    moved = create_slot_event(calendar_manager, "slot-2", start_time)
+    deleted = create_slot_event(calendar_manager, "slot-3", start_time)
+    event_cache.refresh(calendar_manager)
+
+    earlier = create_slot_event(calendar_manager, "slot-1", start_time)
+    calendar_manager.update_event(moved["id"], description=f"{MULTI_DEMO_SLOT_MARKER} slot-4")
+    calendar_manager.delete_event(deleted["id"])
+    event_cache.refresh(calendar_manager)
+
+    now = datetime.now(JST)
+    assert event_cache.find_slot_event("slot-1", now)["id"] == earlier["id"]
+    assert event_cache.find_slot_event("slot-1", start_time + timedelta(hours=2))["id"] == later["id"]
+    assert event_cache.find_slot_event("slot-2", now)["id"] == moved["id"]
+    assert event_cache.find_slot_event("slot-3", now) is None
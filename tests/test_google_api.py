@@ -0,0 +1,145 @@
+"""Tests for rate limiting and retry decisions of Google API calls."""
+
+import asyncio
+import socket
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from core import google_api
+from core.google_api import BACKOFF_MAX_SECONDS, TokenBucket, is_retryable_error, retry_delay
+
+
+class FakeClock:
+    """Stand-in for ``time.monotonic``/``time.sleep`` that only moves when slept."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(google_api.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(google_api.time, "sleep", clock.sleep)
+    return clock
+
+
+def http_error(status, content=b"", **headers):
+    resp = httplib2.Response({"status": str(status), **headers})
+    return HttpError(resp, content, uri="https://www.googleapis.com/calendar/v3/calendars/primary/events")
+
+
+def test_token_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket(rate=10, capacity=3)
+
+    assert [bucket._try_acquire(1) for _ in range(3)] == [0, 0, 0]
+    assert bucket._try_acquire(1) == pytest.approx(0.1)
+
+
+def test_token_bucket_refills_at_rate(clock):
+    bucket = TokenBucket(rate=10, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    clock.now += 0.25
+
+    assert bucket._try_acquire(2) == 0
+    assert bucket._try_acquire(1) == pytest.approx(0.05)
+
+
+def test_token_bucket_never_exceeds_capacity(clock):
+    bucket = TokenBucket(rate=10, capacity=3)
+
+    clock.now += 60
+
+    assert bucket._try_acquire(3) == 0
+    assert bucket._try_acquire(1) == pytest.approx(0.1)
+
+
+def test_token_bucket_acquire_sleeps_until_tokens_are_available(clock):
+    bucket = TokenBucket(rate=4, capacity=1)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_token_bucket_acquire_async_sleeps_until_tokens_are_available(clock, monkeypatch):
+    async def fake_sleep(seconds):
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(google_api.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate=4, capacity=1)
+
+    async def acquire_twice():
+        await bucket.acquire_async()
+        await bucket.acquire_async()
+
+    asyncio.run(acquire_twice())
+
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        http_error(429),
+        http_error(500),
+        http_error(503),
+        http_error(403, b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'),
+        http_error(403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}'),
+        ConnectionResetError(),
+        TimeoutError(),
+        socket.timeout(),
+    ],
+)
+def test_retryable_errors(exception):
+    assert is_retryable_error(exception)
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        http_error(400),
+        http_error(403, b'{"error": {"errors": [{"reason": "forbidden"}]}}'),
+        http_error(404),
+        http_error(410),
+        ValueError("bad request body"),
+    ],
+)
+def test_non_retryable_errors(exception):
+    assert not is_retryable_error(exception)
+
+
+def test_retry_delay_honours_retry_after_seconds():
+    assert retry_delay(0, http_error(429, **{"retry-after": "7"})) == 7.0
+
+
+def test_retry_delay_honours_retry_after_date(monkeypatch):
+    retry_at = datetime(2026, 10, 21, 7, 30, tzinfo=timezone.utc)
+    monkeypatch.setattr(google_api.time, "time", lambda: retry_at.timestamp() - 30)
+
+    delay = retry_delay(0, http_error(503, **{"retry-after": format_datetime(retry_at, usegmt=True)}))
+
+    assert delay == pytest.approx(30.0)
+
+
+@pytest.mark.parametrize("attempt, backoff", [(0, 1.0), (1, 2.0), (3, 8.0), (10, BACKOFF_MAX_SECONDS)])
+def test_retry_delay_uses_capped_exponential_backoff_with_jitter(attempt, backoff):
+    delays = [retry_delay(attempt, http_error(503)) for _ in range(200)]
+
+    assert all(backoff / 2 <= delay <= backoff * 1.5 for delay in delays)
+    assert len(set(delays)) > 1
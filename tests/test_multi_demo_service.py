@@ -0,0 +1,40 @@
+"""Tests for bulk creation of missing demo events."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from benchmarks.run_benchmarks import BENCHMARK_CALENDAR_ID
+from core import multi_demo_service
+from core.constants import JST
+from core.event_cache import CalendarEventCache
+from core.multi_demo_service import build_multi_demo_plans, create_missing_demo_events
+
+
+class FakeSession(dict):
+    modified = False
+
+
+@pytest.fixture
+def plans(monkeypatch):
+    event_cache = CalendarEventCache(BENCHMARK_CALENDAR_ID)
+    monkeypatch.setattr(multi_demo_service, "get_event_cache", lambda calendar_id: event_cache)
+    return build_multi_demo_plans(base_date=datetime.now(JST).date() + timedelta(days=1))[:5]
+
+
+def test_existing_slots_are_skipped(calendar_manager, fake_api, plans):
+    session = FakeSession()
+
+    assert create_missing_demo_events(calendar_manager, session, plans[:3]) == (3, 0, [])
+    assert create_missing_demo_events(calendar_manager, session, plans) == (2, 3, [])
+    assert len(fake_api.events(BENCHMARK_CALENDAR_ID)) == 5
+
+
+def test_repeated_slot_keys_are_counted_as_skipped(calendar_manager, fake_api, plans):
+    plans = plans + [plans[0], plans[0]]
+
+    created, skipped, failed = create_missing_demo_events(calendar_manager, FakeSession(), plans)
+
+    assert (created, skipped, failed) == (5, 2, [])
+    assert created + skipped + len(failed) == len(plans)
+    assert len(fake_api.events(BENCHMARK_CALENDAR_ID)) == 5
@@ -0,0 +1,88 @@
+"""Tests for the shared OAuth access-token cache."""
+
+import datetime
+import threading
+import time
+
+from core.token_cache import SharedTokenCredentials, TokenCache
+
+
+class FakeServiceAccountCredentials:
+    """Service account credentials whose ``refresh`` mints numbered tokens."""
+
+    service_account_email = "demo@example.com"
+    scopes = ["https://www.googleapis.com/auth/calendar"]
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.refreshes = 0
+        self.token = None
+        self.expiry = None
+        self._lock = threading.Lock()
+
+    def refresh(self, request):
+        time.sleep(self.delay)
+        with self._lock:
+            self.refreshes += 1
+            self.token = f"token-{self.refreshes}"
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        self.expiry = now + datetime.timedelta(hours=1)
+
+
+def test_managers_share_one_token():
+    cache = TokenCache()
+    fake = FakeServiceAccountCredentials()
+    first = SharedTokenCredentials(fake, cache=cache)
+    second = SharedTokenCredentials(fake, cache=cache)
+
+    first.refresh(None)
+    second.refresh(None)
+
+    assert first.token == second.token == "token-1"
+    assert fake.refreshes == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_refresh_after_401_mints_a_new_token():
+    cache = TokenCache()
+    fake = FakeServiceAccountCredentials()
+    credentials = SharedTokenCredentials(fake, cache=cache)
+    credentials.refresh(None)
+
+    # The transport got 401 with token-1 and asks for a new token.
+    credentials.refresh(None)
+
+    assert credentials.token == "token-2"
+    assert fake.refreshes == 2
+
+
+def test_refresh_with_a_stale_token_takes_the_newer_cached_one():
+    cache = TokenCache()
+    fake = FakeServiceAccountCredentials()
+    first = SharedTokenCredentials(fake, cache=cache)
+    second = SharedTokenCredentials(fake, cache=cache)
+    first.refresh(None)
+    second.refresh(None)
+
+    first.refresh(None)
+    second.refresh(None)
+
+    assert first.token == second.token == "token-2"
+    assert fake.refreshes == 2
+
+
+def test_concurrent_401s_share_one_mint():
+    cache = TokenCache()
+    fake = FakeServiceAccountCredentials(delay=0.2)
+    managers = [SharedTokenCredentials(fake, cache=cache) for _ in range(6)]
+    for credentials in managers:
+        credentials.refresh(None)
+
+    threads = [threading.Thread(target=credentials.refresh, args=(None,)) for credentials in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {credentials.token for credentials in managers} == {"token-2"}
+    assert fake.refreshes == 2